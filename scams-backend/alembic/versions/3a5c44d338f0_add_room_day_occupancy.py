@@ -0,0 +1,45 @@
+"""add room day occupancy
+
+Revision ID: 3a5c44d338f0
+Revises: d95348e48297
+Create Date: 2026-10-19 22:10:05.271844
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a5c44d338f0'
+down_revision: Union[str, Sequence[str], None] = 'd95348e48297'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('room_day_occupancy',
+    sa.Column('room_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('booked_mask', sa.Integer(), nullable=False),
+    sa.Column('booked_hours', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.PrimaryKeyConstraint('room_id', 'date')
+    )
+    op.create_index(op.f('ix_room_day_occupancy_date'), 'room_day_occupancy', ['date'], unique=False)
+
+    # Backfill from the existing bookings; slots are unique per room-day, so
+    # summing the hour bits gives the mask.
+    op.execute(
+        'INSERT INTO room_day_occupancy (room_id, date, booked_mask, booked_hours) '
+        'SELECT room_id, date, sum(1 << CAST(EXTRACT(HOUR FROM start_time) AS INTEGER)), '
+        'count(*) FROM schedules GROUP BY room_id, date'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_room_day_occupancy_date'), table_name='room_day_occupancy')
+    op.drop_table('room_day_occupancy')
@@ -0,0 +1,52 @@
+"""add schedule cancellations
+
+Revision ID: 5e1f0b7a9c42
+Revises: 3a5c44d338f0
+Create Date: 2026-10-19 23:02:41.518207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1f0b7a9c42'
+down_revision: Union[str, Sequence[str], None] = '3a5c44d338f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('schedule_cancellations',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('cancellation_id', sa.String(length=36), nullable=False),
+    sa.Column('schedule_id', sa.Integer(), nullable=False),
+    sa.Column('room_id', sa.Integer(), nullable=False),
+    sa.Column('lecturer_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=False),
+    sa.Column('purpose', sa.String(length=512), nullable=False),
+    sa.Column('team_members', sa.String(length=1024), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('cancelled_by', sa.Integer(), nullable=False),
+    sa.Column('reason', sa.String(length=255), nullable=True),
+    sa.Column('cancelled_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.ForeignKeyConstraint(['cancelled_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['lecturer_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_schedule_cancellations_cancellation_id'), 'schedule_cancellations', ['cancellation_id'], unique=False)
+    op.create_index(op.f('ix_schedule_cancellations_date'), 'schedule_cancellations', ['date'], unique=False)
+    op.create_index(op.f('ix_schedule_cancellations_id'), 'schedule_cancellations', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_schedule_cancellations_id'), table_name='schedule_cancellations')
+    op.drop_index(op.f('ix_schedule_cancellations_date'), table_name='schedule_cancellations')
+    op.drop_index(op.f('ix_schedule_cancellations_cancellation_id'), table_name='schedule_cancellations')
+    op.drop_table('schedule_cancellations')
@@ -0,0 +1,33 @@
+"""add room date start index to schedules
+
+Revision ID: 9936452cda10
+Revises: bd36a9df27a8
+Create Date: 2026-10-19 18:56:08.057284
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9936452cda10'
+down_revision: Union[str, Sequence[str], None] = 'bd36a9df27a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_schedules_room_id_date_start_time',
+        'schedules',
+        ['room_id', 'date', 'start_time'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_schedules_room_id_date_start_time', table_name='schedules')
@@ -0,0 +1,29 @@
+"""add lecturer date index to schedules
+
+Revision ID: a7d2c95e1b36
+Revises: 5e1f0b7a9c42
+Create Date: 2026-10-19 23:48:12.904315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d2c95e1b36'
+down_revision: Union[str, Sequence[str], None] = '5e1f0b7a9c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Created on the partitioned parent, so every monthly partition gets it.
+    op.create_index('ix_schedules_lecturer_id_date_start_time', 'schedules', ['lecturer_id', 'date', 'start_time'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_schedules_lecturer_id_date_start_time', table_name='schedules')
@@ -0,0 +1,116 @@
+"""partition schedules by month
+
+Revision ID: d95348e48297
+Revises: c8fb4838bcf1
+Create Date: 2026-10-19 21:02:41.518203
+
+"""
+import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd95348e48297'
+down_revision: Union[str, Sequence[str], None] = 'c8fb4838bcf1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 12
+
+
+def add_months(month: datetime.date, months: int) -> datetime.date:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Range partitions by month on date. The primary key has to include the
+    # partition key; ids still come from the same sequence and stay unique.
+    op.execute('ALTER TABLE schedules RENAME TO schedules_unpartitioned')
+    op.execute(
+        'ALTER TABLE schedules_unpartitioned '
+        'RENAME CONSTRAINT schedules_pkey TO schedules_unpartitioned_pkey'
+    )
+    op.drop_index('ix_schedules_id', table_name='schedules_unpartitioned')
+    op.drop_index(
+        'ix_schedules_room_id_date_start_time', table_name='schedules_unpartitioned'
+    )
+    op.execute(
+        'CREATE TABLE schedules (LIKE schedules_unpartitioned INCLUDING DEFAULTS) '
+        'PARTITION BY RANGE (date)'
+    )
+    op.execute('ALTER SEQUENCE schedules_id_seq OWNED BY schedules.id')
+    op.create_primary_key('schedules_pkey', 'schedules', ['id', 'date'])
+    op.create_foreign_key(None, 'schedules', 'rooms', ['room_id'], ['id'])
+    op.create_foreign_key(None, 'schedules', 'users', ['lecturer_id'], ['id'])
+    op.create_index('ix_schedules_id', 'schedules', ['id'], unique=False)
+    op.create_index(
+        'ix_schedules_room_id_date_start_time',
+        'schedules',
+        ['room_id', 'date', 'start_time'],
+        unique=True,
+    )
+    # Catches rows outside every monthly partition; partition maintenance
+    # moves them out when it creates the matching month.
+    op.execute('CREATE TABLE schedules_default PARTITION OF schedules DEFAULT')
+
+    first_date = (
+        op.get_bind()
+        .execute(sa.text('SELECT min(date) FROM schedules_unpartitioned'))
+        .scalar()
+    )
+    current_month = datetime.date.today().replace(day=1)
+    month = (first_date or current_month).replace(day=1)
+    while month <= add_months(current_month, MONTHS_AHEAD):
+        next_month = add_months(month, 1)
+        op.execute(
+            f'CREATE TABLE schedules_y{month.year}m{month.month:02d} '
+            f"PARTITION OF schedules FOR VALUES FROM ('{month}') TO ('{next_month}')"
+        )
+        month = next_month
+
+    op.execute('INSERT INTO schedules SELECT * FROM schedules_unpartitioned')
+    op.drop_table('schedules_unpartitioned')
+
+    # Cold storage for archived months, outside the partition tree.
+    op.execute('CREATE TABLE schedules_archive (LIKE schedules INCLUDING DEFAULTS)')
+    op.execute('ALTER TABLE schedules_archive ALTER COLUMN id DROP DEFAULT')
+    op.create_primary_key('schedules_archive_pkey', 'schedules_archive', ['id'])
+    op.create_index(
+        'ix_schedules_archive_date', 'schedules_archive', ['date'], unique=False
+    )
+    op.execute('ANALYZE schedules')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Months archived to files are not restored; the archive table is.
+    op.execute('ALTER TABLE schedules RENAME TO schedules_partitioned')
+    op.execute(
+        'ALTER TABLE schedules_partitioned '
+        'RENAME CONSTRAINT schedules_pkey TO schedules_partitioned_pkey'
+    )
+    op.drop_index('ix_schedules_id', table_name='schedules_partitioned')
+    op.drop_index(
+        'ix_schedules_room_id_date_start_time', table_name='schedules_partitioned'
+    )
+    op.execute('CREATE TABLE schedules (LIKE schedules_partitioned INCLUDING DEFAULTS)')
+    op.execute('ALTER SEQUENCE schedules_id_seq OWNED BY schedules.id')
+    op.create_primary_key('schedules_pkey', 'schedules', ['id'])
+    op.create_foreign_key(None, 'schedules', 'rooms', ['room_id'], ['id'])
+    op.create_foreign_key(None, 'schedules', 'users', ['lecturer_id'], ['id'])
+    op.execute('INSERT INTO schedules SELECT * FROM schedules_archive')
+    op.execute('INSERT INTO schedules SELECT * FROM schedules_partitioned')
+    op.drop_table('schedules_partitioned')
+    op.drop_table('schedules_archive')
+    op.create_index('ix_schedules_id', 'schedules', ['id'], unique=False)
+    op.create_index(
+        'ix_schedules_room_id_date_start_time',
+        'schedules',
+        ['room_id', 'date', 'start_time'],
+        unique=True,
+    )
@@ -0,0 +1,432 @@
+"""Time the main services and endpoints against seeded datasets.
+
+Every scale is seeded into an offline database (in-memory SQLite unless
+--database-url points elsewhere; its tables are dropped and recreated), then
+each case is run --repeat times after a warm-up. Services are called directly
+with a fresh session; endpoints go through the full ASGI app, middlewares
+included. For every case the median and p95 time, the number of SQL
+statements and the peak traced memory are recorded.
+
+With --baseline the results are compared to a stored run and the exit status
+is 1 when a case got slower than --tolerance or runs more queries.
+
+Usage (from scams-backend/):
+    python -m benchmarks.bench_services --scale small --scale medium
+    python -m benchmarks.bench_services --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_services --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import datetime
+import itertools
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, NamedTuple, Optional
+
+import jwt
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+from benchmarks.dataset import Dataset, parse_spec, seed_dataset
+from scams_backend.cache.catalog import catalog_cache
+from scams_backend.cache.lecturer_directory import lecturer_directory_cache
+from scams_backend.constants.user import UserRole
+from scams_backend.core.config import settings
+from scams_backend.db.session import SessionLocal
+from scams_backend.main import app
+from scams_backend.schemas.schedule.schedule_schema import CreateScheduleRequest
+from scams_backend.services.room.room_detail_service import RoomDetailService
+from scams_backend.services.room.room_list_service import RoomListService
+from scams_backend.services.schedule.create_schedule_service import (
+    CreateScheduleService,
+)
+from scams_backend.services.schedule.get_my_schedules_service import (
+    GetMySchedulesService,
+)
+from scams_backend.services.schedule.lecturer_free_busy_service import (
+    LecturerFreeBusyService,
+)
+from scams_backend.services.schedule.list_all_schedules_service import (
+    ListAllSchedulesService,
+)
+
+DEFAULT_SEED = 20240901
+
+
+class Case(NamedTuple):
+    name: str
+    run: Callable[[], object]
+
+
+class CaseResult(NamedTuple):
+    median_ms: float
+    p95_ms: float
+    queries: int
+    peak_kib: float
+
+
+class QueryCounter:
+    def __init__(self, engine: Engine):
+        self.count: int = 0
+        event.listen(engine, "before_cursor_execute", self.increment)
+
+    def increment(self, *args) -> None:
+        self.count += 1
+
+
+def create_offline_engine(database_url: str) -> Engine:
+    if database_url.startswith("sqlite"):
+        return create_engine(
+            database_url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+    return create_engine(database_url)
+
+
+def free_slots(dataset: Dataset):
+    """Yield booking requests after the seeded range, so none of them conflict.
+
+    One booking per day: the requests are all made by one lecturer, who
+    cannot be in two rooms at once.
+    """
+    for index in itertools.count():
+        yield CreateScheduleRequest(
+            room_id=dataset.room_ids[index % len(dataset.room_ids)],
+            date=dataset.end_date + datetime.timedelta(days=index + 1),
+            start_time=datetime.time(settings.BOOKING_DAY_START_HOUR),
+            end_time=datetime.time(settings.BOOKING_DAY_START_HOUR + 2),
+            purpose="Benchmark booking",
+            team_members="Team A, Team B",
+        )
+
+
+def with_session(function: Callable) -> Callable[[], object]:
+    def run():
+        with SessionLocal() as db_session:
+            return function(db_session)
+
+    return run
+
+
+def request(
+    client: TestClient,
+    method: str,
+    url: str,
+    params: Optional[dict] = None,
+    body: Optional[Callable[[], str]] = None,
+) -> Callable[[], object]:
+    def run():
+        response = client.request(
+            method,
+            url,
+            params=params,
+            content=None if body is None else body(),
+            headers={"Content-Type": "application/json"},
+        )
+        if response.status_code >= 400:
+            raise RuntimeError(
+                f"{method} {url}: {response.status_code} {response.text}"
+            )
+        return response
+
+    return run
+
+
+def build_cases(dataset: Dataset) -> list[Case]:
+    today = dataset.today
+    window_start = datetime.datetime.combine(today, datetime.time(9))
+    window_end = datetime.datetime.combine(today, datetime.time(12))
+    room_id = dataset.room_ids[len(dataset.room_ids) // 2]
+    lecturer_id = dataset.busiest_lecturer_id
+    service_slots = free_slots(dataset)
+    endpoint_slots = free_slots(
+        dataset._replace(end_date=dataset.end_date + datetime.timedelta(days=3650))
+    )
+
+    client = TestClient(app)
+    client.cookies.set(
+        "access_token",
+        jwt.encode(
+            {
+                "id": lecturer_id,
+                "email": "benchmark@uni.edu",
+                "role": UserRole.LECTURER,
+                "full_name": "Benchmark Lecturer",
+            },
+            settings.SECRET_KEY,
+            algorithm=settings.JWT_ALGORITHM,
+        ),
+    )
+
+    return [
+        Case(
+            "service:room_list",
+            with_session(
+                lambda db_session: RoomListService(
+                    building_id=None,
+                    device_ids=None,
+                    any_device_ids=None,
+                    min_capacity=None,
+                    start_time=window_start,
+                    end_time=window_end,
+                    min_free_hours=None,
+                    limit=100,
+                    offset=0,
+                    db_session=db_session,
+                ).invoke()
+            ),
+        ),
+        Case(
+            "service:room_detail",
+            with_session(
+                lambda db_session: RoomDetailService(
+                    room_id=room_id, db_session=db_session
+                ).invoke()
+            ),
+        ),
+        Case(
+            "service:list_all_schedules",
+            with_session(
+                lambda db_session: ListAllSchedulesService(
+                    date=today,
+                    room_id=None,
+                    lecturer_id=None,
+                    building_id=None,
+                    db_session=db_session,
+                ).invoke()
+            ),
+        ),
+        Case(
+            "service:get_my_schedules",
+            with_session(
+                lambda db_session: GetMySchedulesService(
+                    user_id=lecturer_id, limit=50, offset=0, db_session=db_session
+                ).invoke()
+            ),
+        ),
+        Case(
+            "service:lecturer_free_busy",
+            with_session(
+                lambda db_session: LecturerFreeBusyService(
+                    lecturer_id=lecturer_id,
+                    start_date=today,
+                    end_date=today + datetime.timedelta(days=13),
+                    db_session=db_session,
+                ).invoke()
+            ),
+        ),
+        Case(
+            "service:create_schedule",
+            with_session(
+                lambda db_session: CreateScheduleService(
+                    create_schedule_request=next(service_slots),
+                    user_id=lecturer_id,
+                    db_session=db_session,
+                ).invoke()
+            ),
+        ),
+        Case(
+            "endpoint:GET /rooms/",
+            request(
+                client,
+                "GET",
+                "/rooms/",
+                params={
+                    "start_time": window_start.isoformat(),
+                    "end_time": window_end.isoformat(),
+                },
+            ),
+        ),
+        Case("endpoint:GET /rooms/{id}", request(client, "GET", f"/rooms/{room_id}")),
+        Case(
+            "endpoint:GET /schedules/",
+            request(client, "GET", "/schedules/", params={"date": today.isoformat()}),
+        ),
+        Case(
+            "endpoint:GET /schedules/me",
+            request(client, "GET", "/schedules/me", params={"limit": 50}),
+        ),
+        Case(
+            "endpoint:POST /schedules/",
+            request(
+                client,
+                "POST",
+                "/schedules/",
+                body=lambda: next(endpoint_slots).model_dump_json(),
+            ),
+        ),
+    ]
+
+
+def measure(case: Case, counter: QueryCounter, repeat: int) -> CaseResult:
+    case.run()  # warm-up: fills caches and the connection pool
+
+    counter.count = 0
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        case.run()
+        timings.append(time.perf_counter() - started)
+    queries = round(counter.count / repeat)
+
+    # Traced separately: tracemalloc slows allocation-heavy code down.
+    tracemalloc.start()
+    case.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    return CaseResult(
+        median_ms=round(statistics.median(timings) * 1000, 3),
+        p95_ms=round(
+            timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 3
+        ),
+        queries=queries,
+        peak_kib=round(peak / 1024, 1),
+    )
+
+
+def run_scale(
+    engine: Engine, counter: QueryCounter, scale: str, seed: int, repeat: int
+) -> dict[str, CaseResult]:
+    started = time.perf_counter()
+    dataset = seed_dataset(engine, parse_spec(scale), seed)
+    print(
+        f"\n[{scale}] {dataset.spec.rooms} rooms x {dataset.spec.days} days "
+        f"x {dataset.spec.density} density: {dataset.schedule_count} schedules "
+        f"seeded in {time.perf_counter() - started:.1f}s"
+    )
+    # The snapshots of the previous scale describe rows that are gone.
+    catalog_cache.bump_version()
+    lecturer_directory_cache.bump_version()
+
+    results = {}
+    for case in build_cases(dataset):
+        results[case.name] = measure(case, counter, repeat)
+        print(format_row(case.name, results[case.name]))
+    return results
+
+
+def format_row(
+    name: str, result: CaseResult, baseline: Optional[CaseResult] = None
+) -> str:
+    row = (
+        f"  {name:<32} median {result.median_ms:>9.2f} ms  p95 {result.p95_ms:>9.2f} ms"
+        f"  {result.queries:>3} queries  peak {result.peak_kib:>9.1f} KiB"
+    )
+    if baseline is not None:
+        change = (result.median_ms - baseline.median_ms) / baseline.median_ms
+        row += f"  {change:+.0%} vs baseline"
+    return row
+
+
+def find_regressions(
+    results: dict[str, dict[str, CaseResult]],
+    baseline: dict[str, dict[str, CaseResult]],
+    tolerance: float,
+) -> list[str]:
+    regressions = []
+    for scale, cases in results.items():
+        for name, result in cases.items():
+            expected = baseline.get(scale, {}).get(name)
+            if expected is None:
+                continue
+            if result.median_ms > expected.median_ms * (1 + tolerance):
+                regressions.append(
+                    f"[{scale}] {name}: median {result.median_ms:.2f} ms, "
+                    f"baseline {expected.median_ms:.2f} ms"
+                )
+            if result.queries > expected.queries:
+                regressions.append(
+                    f"[{scale}] {name}: {result.queries} queries, "
+                    f"baseline {expected.queries}"
+                )
+    return regressions
+
+
+def load_results(path: str) -> dict[str, dict[str, CaseResult]]:
+    with open(path) as file:
+        stored = json.load(file)
+    return {
+        scale: {name: CaseResult(**result) for name, result in cases.items()}
+        for scale, cases in stored["results"].items()
+    }
+
+
+def save_results(
+    path: str, results: dict[str, dict[str, CaseResult]], arguments
+) -> None:
+    with open(path, "w") as file:
+        json.dump(
+            {
+                "seed": arguments.seed,
+                "repeat": arguments.repeat,
+                "python": sys.version.split()[0],
+                "results": {
+                    scale: {name: result._asdict() for name, result in cases.items()}
+                    for scale, cases in results.items()
+                },
+            },
+            file,
+            indent=2,
+        )
+        file.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale",
+        action="append",
+        help="small, medium, large or ROOMSxDAYSxDENSITY; repeatable "
+        "(default: small and medium)",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--baseline", help="compare against this results file")
+    parser.add_argument("--save-baseline", help="write the results to this file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown of the median before failing",
+    )
+    arguments = parser.parse_args()
+
+    engine = create_offline_engine(arguments.database_url)
+    SessionLocal.configure(bind=engine)
+    counter = QueryCounter(engine)
+
+    results = {
+        scale: run_scale(engine, counter, scale, arguments.seed, arguments.repeat)
+        for scale in arguments.scale or ["small", "medium"]
+    }
+
+    if arguments.save_baseline:
+        save_results(arguments.save_baseline, results, arguments)
+        print(f"\nBaseline written to {arguments.save_baseline}")
+    if arguments.baseline:
+        baseline = load_results(arguments.baseline)
+        print(f"\nCompared with {arguments.baseline}:")
+        for scale, cases in results.items():
+            for name, result in cases.items():
+                print(
+                    f"[{scale}]"
+                    + format_row(name, result, baseline.get(scale, {}).get(name))
+                )
+        regressions = find_regressions(results, baseline, arguments.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Seeded, parameterized datasets for the benchmark suite.
+
+A dataset is ``rooms`` rooms booked over ``days`` days, each bookable hour
+taken with probability ``density``. The same spec and seed always produce the
+same rows; dates are laid out around ``start_date`` (today by default) so that
+"today" queries hit the middle of the data.
+
+On PostgreSQL the schema is built by the Alembic migrations, so plans are
+measured against the monthly partitions of ``schedules`` as in production.
+"""
+
+import datetime
+import random
+from collections import Counter
+from typing import NamedTuple, Optional
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import insert, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from scams_backend.constants.user import UserRole
+from scams_backend.core.config import settings
+from scams_backend.models.building import Building
+from scams_backend.models.device import Device
+from scams_backend.models.room import Room
+from scams_backend.models.room_device import RoomDevice
+from scams_backend.models.schedule import Schedule
+from scams_backend.models.user import User
+
+# Imported after the models: db.base imports them back.
+from scams_backend.db.base import Base
+from scams_backend.services.password.password_service import PasswordService
+from scams_backend.services.schedule.occupancy_summary_service import (
+    RebuildOccupancySummaryService,
+)
+from scams_backend.services.schedule.schedule_partition_service import (
+    SchedulePartitionService,
+)
+from scams_backend.utils.encrypt import encrypt_data
+from scams_backend.utils.hash import hash_email
+
+DEVICE_NAMES = (
+    "Projector",
+    "Whiteboard",
+    "Smart Board",
+    "PC",
+    "Speaker",
+    "Microphone",
+    "Document Camera",
+    "Air Conditioner",
+)
+ROOM_CAPACITIES = (20, 25, 30, 45, 60, 80, 120, 200)
+PURPOSES = ("Lecture", "Lab session", "Seminar", "Exam", "Thesis defense", "Meeting")
+FIRST_NAMES = ("Anh", "Binh", "Chi", "Dung", "Hoa", "Khanh", "Lan", "Minh", "Tam")
+LAST_NAMES = ("Nguyen", "Tran", "Le", "Pham", "Hoang", "Vo", "Dang", "Bui")
+BENCHMARK_PASSWORD = "benchmark123"
+
+
+class DatasetSpec(NamedTuple):
+    rooms: int
+    days: int
+    density: float
+
+
+class Dataset(NamedTuple):
+    spec: DatasetSpec
+    today: datetime.date
+    end_date: datetime.date
+    room_ids: list[int]
+    lecturer_ids: list[int]
+    busiest_lecturer_id: int
+    schedule_count: int
+
+
+SCALES: dict[str, DatasetSpec] = {
+    "small": DatasetSpec(rooms=20, days=14, density=0.3),
+    "medium": DatasetSpec(rooms=100, days=30, density=0.5),
+    "large": DatasetSpec(rooms=300, days=60, density=0.6),
+}
+
+
+def parse_spec(value: str) -> DatasetSpec:
+    """Accept a scale name or ``ROOMSxDAYSxDENSITY``, e.g. ``50x30x0.4``."""
+    if value in SCALES:
+        return SCALES[value]
+    rooms, days, density = value.split("x")
+    return DatasetSpec(rooms=int(rooms), days=int(days), density=float(density))
+
+
+def reset_schema(engine: Engine) -> None:
+    """Drop everything on ``engine`` and recreate the application schema."""
+    if engine.dialect.name != "postgresql":
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        return
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+        config = Config(settings.ALEMBIC_CONFIG_PATH)
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+
+
+def seed_dataset(
+    engine: Engine,
+    spec: DatasetSpec,
+    seed: int,
+    start_date: Optional[datetime.date] = None,
+) -> Dataset:
+    """Recreate every table on ``engine`` and fill it according to ``spec``."""
+    rng = random.Random(seed)
+    today = start_date or datetime.date.today()
+    first_date = today - datetime.timedelta(days=spec.days // 2)
+    reset_schema(engine)
+
+    with Session(engine) as session:
+        # A month without its partition would land in schedules_default.
+        SchedulePartitionService(db_session=session).ensure_partitions(
+            first_date, first_date + datetime.timedelta(days=spec.days - 1)
+        )
+        buildings = [
+            Building(name=f"Building {index + 1}")
+            for index in range(max(1, spec.rooms // 20))
+        ]
+        devices = [Device(name=name) for name in DEVICE_NAMES]
+        session.add_all(buildings + devices)
+        session.flush()
+
+        rooms = [
+            Room(
+                name=f"Room {index + 1:03d}",
+                floor_number=rng.randint(1, 8),
+                building_id=rng.choice(buildings).id,
+                capacity=rng.choice(ROOM_CAPACITIES),
+            )
+            for index in range(spec.rooms)
+        ]
+        # Ciphertexts are reused across rows: only their size matters here,
+        # and one bcrypt hash is shared by every account.
+        hashed_password = PasswordService.hash_password(BENCHMARK_PASSWORD)
+        lecturers = [
+            User(
+                role=UserRole.LECTURER,
+                full_name=encrypt_data(
+                    f"{rng.choice(LAST_NAMES)} {rng.choice(FIRST_NAMES)} {index}"
+                ),
+                email=encrypt_data(f"lecturer{index}@uni.edu"),
+                email_hash=hash_email(f"lecturer{index}@uni.edu"),
+                hashed_password=hashed_password,
+            )
+            for index in range(max(2, spec.rooms))
+        ]
+        session.add_all(rooms + lecturers)
+        session.flush()
+
+        session.execute(
+            insert(RoomDevice),
+            [
+                {"room_id": room.id, "device_id": device.id}
+                for room in rooms
+                for device in rng.sample(devices, rng.randint(1, 4))
+            ],
+        )
+
+        purposes = [encrypt_data(purpose) for purpose in PURPOSES]
+        team_members = encrypt_data("Team A, Team B")
+        # Rooms booked in the same hour get distinct lecturers, as
+        # verify_time_conflict would require.
+        schedules = []
+        for day in range(spec.days):
+            date = first_date + datetime.timedelta(days=day)
+            for hour in range(
+                settings.BOOKING_DAY_START_HOUR, settings.BOOKING_DAY_END_HOUR
+            ):
+                booked_rooms = [room for room in rooms if rng.random() < spec.density]
+                schedules.extend(
+                    {
+                        "room_id": room.id,
+                        "date": date,
+                        "start_time": datetime.time(hour),
+                        "lecturer_id": lecturer.id,
+                        "purpose": rng.choice(purposes),
+                        "team_members": team_members,
+                    }
+                    for room, lecturer in zip(
+                        booked_rooms,
+                        rng.sample(lecturers, min(len(booked_rooms), len(lecturers))),
+                    )
+                )
+        if schedules:
+            session.execute(insert(Schedule), schedules)
+        session.commit()
+        RebuildOccupancySummaryService(
+            start_date=first_date,
+            end_date=first_date + datetime.timedelta(days=spec.days - 1),
+            room_id=None,
+            db_session=session,
+        ).invoke()
+
+        lecturer_ids = [lecturer.id for lecturer in lecturers]
+        bookings = Counter(row["lecturer_id"] for row in schedules)
+        busiest_lecturer_id = max(
+            lecturer_ids, key=lambda lecturer_id: (bookings[lecturer_id], -lecturer_id)
+        )
+        room_ids = list(session.scalars(select(Room.id).order_by(Room.id)))
+
+    return Dataset(
+        spec=spec,
+        today=today,
+        end_date=first_date + datetime.timedelta(days=spec.days - 1),
+        room_ids=room_ids,
+        lecturer_ids=lecturer_ids,
+        busiest_lecturer_id=busiest_lecturer_id,
+        schedule_count=len(schedules),
+    )
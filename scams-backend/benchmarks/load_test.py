@@ -0,0 +1,369 @@
+"""Replay a traffic mix against the API and report latency per route.
+
+Requests arrive open-loop: arrival times follow a Poisson process at the rate
+of the current profile stage, whether or not earlier requests have finished,
+and latency is measured from the scheduled arrival so a stalled server is not
+hidden. Each arrival picks a request from the profile's weighted mix and fills
+its placeholders ({room_id}, {date}, {window_start}, ...) at random.
+
+By default the app runs in-process through httpx's ASGI transport, with no
+network; pass --base-url to load a running server instead. In-process runs
+use the configured database unless --database-url or --dataset is given;
+--dataset seeds an in-memory SQLite database with benchmarks.dataset and
+signs in as one of its lecturers.
+
+Usage (from scams-backend/):
+    python -m benchmarks.load_test --dataset medium
+    python -m benchmarks.load_test --profile my_profile.json --rate-scale 2
+    python -m benchmarks.load_test --base-url http://localhost:8000 --output out.json
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+
+import httpx
+
+from scams_backend.core.config import settings
+
+DEFAULT_PROFILE = Path(__file__).parent / "profiles" / "default.json"
+
+
+class RequestTemplate(NamedTuple):
+    name: str
+    weight: float
+    method: str
+    path: str
+    params: dict[str, Any]
+    json: Optional[dict[str, Any]]
+    optional: tuple[str, ...]
+
+
+class Stage(NamedTuple):
+    duration_seconds: float
+    rate: float
+
+
+class RouteStats:
+    def __init__(self):
+        self.latencies: list[float] = []
+        self.statuses: Counter = Counter()
+        self.failures: Counter = Counter()
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def errors(self) -> int:
+        server_errors = sum(
+            count for status, count in self.statuses.items() if status >= 500
+        )
+        return server_errors + sum(self.failures.values())
+
+    def record(
+        self, latency: float, status: Optional[int], failure: Optional[str]
+    ) -> None:
+        self.latencies.append(latency)
+        if failure is None:
+            self.statuses[status] += 1
+        else:
+            self.failures[failure] += 1
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            "requests": self.count,
+            "throughput_rps": round(self.count / elapsed, 2),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+            "error_rate": round(self.errors / self.count, 4) if self.count else 0.0,
+            "statuses": {str(status): count for status, count in self.statuses.items()},
+            "failures": dict(self.failures),
+        }
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(len(sorted_values) * fraction)))
+    return sorted_values[rank]
+
+
+class TrafficMix:
+    def __init__(self, profile: dict[str, Any], rng: random.Random):
+        self.rng: random.Random = rng
+        self.templates: list[RequestTemplate] = [
+            RequestTemplate(
+                name=entry["name"],
+                weight=entry.get("weight", 1),
+                method=entry.get("method", "GET"),
+                path=entry["path"],
+                params=entry.get("params", {}),
+                json=entry.get("json"),
+                optional=tuple(entry.get("optional", ())),
+            )
+            for entry in profile["mix"]
+        ]
+        self.weights: list[float] = [template.weight for template in self.templates]
+        self.parameters: dict[str, Any] = profile.get("parameters", {})
+        self.credentials: dict[str, str] = profile.get("credentials", {})
+
+    def placeholder_values(self) -> dict[str, Any]:
+        rng = self.rng
+        today = datetime.date.today()
+        date = today + datetime.timedelta(
+            days=rng.randint(*self.parameters.get("date_offset_days", (0, 0)))
+        )
+        future_date = today + datetime.timedelta(days=rng.randint(1, 365))
+        hour = rng.randint(
+            settings.BOOKING_DAY_START_HOUR, settings.BOOKING_DAY_END_HOUR - 2
+        )
+        window_start = datetime.datetime.combine(date, datetime.time(hour))
+        return {
+            "room_id": rng.randint(*self.parameters.get("room_ids", (1, 1))),
+            "building_id": rng.randint(*self.parameters.get("building_ids", (1, 1))),
+            "min_capacity": rng.choice(self.parameters.get("min_capacities", (1,))),
+            "date": date.isoformat(),
+            "future_date": future_date.isoformat(),
+            "start_time": f"{hour:02d}:00:00",
+            "end_time": f"{hour + 1:02d}:00:00",
+            "window_start": window_start.isoformat(),
+            "window_end": (window_start + datetime.timedelta(hours=2)).isoformat(),
+            **self.credentials,
+        }
+
+    def fill(self, value: Any, values: dict[str, Any]) -> Any:
+        if isinstance(value, dict):
+            return {key: self.fill(item, values) for key, item in value.items()}
+        if not isinstance(value, str):
+            return value
+        # A lone placeholder keeps its type, so JSON bodies get real integers.
+        if value.startswith("{") and value.endswith("}") and value[1:-1] in values:
+            return values[value[1:-1]]
+        return value.format(**values)
+
+    def next_request(self) -> tuple[str, dict[str, Any]]:
+        template = self.rng.choices(self.templates, weights=self.weights)[0]
+        values = self.placeholder_values()
+        params = {
+            key: self.fill(value, values)
+            for key, value in template.params.items()
+            if key not in template.optional or self.rng.random() < 0.5
+        }
+        request = {
+            "method": template.method,
+            "url": self.fill(template.path, values),
+            "params": params,
+        }
+        if template.json is not None:
+            request["json"] = self.fill(template.json, values)
+        return template.name, request
+
+
+class LoadTest:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        mix: TrafficMix,
+        stages: list[Stage],
+        max_in_flight: int,
+        rng: random.Random,
+    ):
+        self.client: httpx.AsyncClient = client
+        self.mix: TrafficMix = mix
+        self.stages: list[Stage] = stages
+        self.max_in_flight: int = max_in_flight
+        self.rng: random.Random = rng
+        self.stats: dict[str, RouteStats] = {}
+        self.dropped: int = 0
+        self.in_flight: set[asyncio.Task] = set()
+
+    async def send(self, name: str, request: dict[str, Any], scheduled: float):
+        status, failure = None, None
+        try:
+            response = await self.client.request(**request)
+            status = response.status_code
+        except httpx.TimeoutException:
+            failure = "timeout"
+        except httpx.HTTPError as e:
+            failure = type(e).__name__
+        latency = time.perf_counter() - scheduled
+        self.stats.setdefault(name, RouteStats()).record(latency, status, failure)
+
+    async def run(self) -> float:
+        started = time.perf_counter()
+        next_arrival = started
+        stage_end = started
+        for stage in self.stages:
+            stage_end += stage.duration_seconds
+            if stage.rate <= 0:
+                await asyncio.sleep(max(0.0, stage_end - time.perf_counter()))
+                next_arrival = stage_end
+                continue
+            while True:
+                next_arrival += self.rng.expovariate(stage.rate)
+                if next_arrival >= stage_end:
+                    next_arrival = stage_end
+                    break
+                await asyncio.sleep(max(0.0, next_arrival - time.perf_counter()))
+                if len(self.in_flight) >= self.max_in_flight:
+                    # The client itself is saturated; count it instead of queueing.
+                    self.dropped += 1
+                    continue
+                name, request = self.mix.next_request()
+                task = asyncio.create_task(self.send(name, request, next_arrival))
+                self.in_flight.add(task)
+                task.add_done_callback(self.in_flight.discard)
+        if self.in_flight:
+            await asyncio.gather(*self.in_flight)
+        return time.perf_counter() - started
+
+    def report(self, elapsed: float) -> dict[str, Any]:
+        total = RouteStats()
+        for stats in self.stats.values():
+            total.latencies.extend(stats.latencies)
+            total.statuses.update(stats.statuses)
+            total.failures.update(stats.failures)
+        return {
+            "elapsed_seconds": round(elapsed, 2),
+            "dropped": self.dropped,
+            "routes": {
+                name: stats.summary(elapsed)
+                for name, stats in sorted(self.stats.items())
+            },
+            "total": total.summary(elapsed),
+        }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    print(
+        f"\n{'route':<28}{'requests':>9}{'req/s':>9}{'p50 ms':>10}"
+        f"{'p95 ms':>10}{'p99 ms':>10}{'errors':>9}  statuses"
+    )
+    rows = list(report["routes"].items()) + [("total", report["total"])]
+    for name, summary in rows:
+        statuses = ", ".join(
+            f"{status}: {count}"
+            for status, count in sorted(
+                {**summary["statuses"], **summary["failures"]}.items()
+            )
+        )
+        print(
+            f"{name:<28}{summary['requests']:>9}{summary['throughput_rps']:>9.1f}"
+            f"{summary['p50_ms']:>10.1f}{summary['p95_ms']:>10.1f}"
+            f"{summary['p99_ms']:>10.1f}{summary['error_rate']:>9.1%}  {statuses}"
+        )
+    print(
+        f"\n{report['elapsed_seconds']}s elapsed; {report['dropped']} arrivals "
+        "dropped because the client hit max_in_flight"
+    )
+
+
+def prepare_in_process(arguments, profile: dict[str, Any]):
+    """Return the ASGI app, rebinding its sessions to an offline database if asked."""
+    from scams_backend.db.session import SessionLocal
+    from scams_backend.main import app
+
+    if arguments.dataset or arguments.database_url:
+        from benchmarks.bench_services import create_offline_engine
+
+        engine = create_offline_engine(arguments.database_url or "sqlite://")
+        SessionLocal.configure(bind=engine)
+    if arguments.dataset:
+        from benchmarks.dataset import (
+            BENCHMARK_PASSWORD,
+            parse_spec,
+            seed_dataset,
+        )
+
+        dataset = seed_dataset(engine, parse_spec(arguments.dataset), arguments.seed)
+        profile["parameters"]["room_ids"] = [
+            dataset.room_ids[0],
+            dataset.room_ids[-1],
+        ]
+        profile["parameters"]["building_ids"] = [1, max(1, dataset.spec.rooms // 20)]
+        profile["credentials"] = {
+            # benchmarks.dataset numbers lecturer emails from 0.
+            "email": "lecturer0@uni.edu",
+            "password": BENCHMARK_PASSWORD,
+        }
+        print(f"Seeded {dataset.schedule_count} schedules ({arguments.dataset})")
+    return app
+
+
+async def main_async(arguments) -> dict[str, Any]:
+    profile = json.loads(Path(arguments.profile).read_text())
+    profile.setdefault("parameters", {})
+    rng = random.Random(arguments.seed)
+    stages = [
+        Stage(stage["duration_seconds"], stage["rate"] * arguments.rate_scale)
+        for stage in profile["stages"]
+    ]
+    timeout = httpx.Timeout(profile.get("timeout_seconds", 10))
+    limits = httpx.Limits(max_connections=profile.get("max_in_flight", 100))
+
+    if arguments.base_url:
+        client = httpx.AsyncClient(
+            base_url=arguments.base_url, timeout=timeout, limits=limits
+        )
+    else:
+        app = prepare_in_process(arguments, profile)
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://testserver",
+            timeout=timeout,
+        )
+
+    async with client:
+        credentials = profile.get("credentials")
+        if credentials:
+            response = await client.post("/signin", json=credentials)
+            if response.status_code != 200:
+                raise SystemExit(
+                    f"Sign-in failed ({response.status_code}): {response.text}"
+                )
+        load_test = LoadTest(
+            client,
+            TrafficMix(profile, rng),
+            stages,
+            profile.get("max_in_flight", 100),
+            rng,
+        )
+        elapsed = await load_test.run()
+    return load_test.report(elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", default=str(DEFAULT_PROFILE))
+    parser.add_argument("--base-url", help="load a running server instead")
+    parser.add_argument(
+        "--dataset", help="seed an in-memory database: small, medium, large or RxDxP"
+    )
+    parser.add_argument("--database-url", help="in-process runs only")
+    parser.add_argument(
+        "--rate-scale",
+        type=float,
+        default=1.0,
+        help="multiply every stage's arrival rate",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="also write the report as JSON")
+    arguments = parser.parse_args()
+
+    report = asyncio.run(main_async(arguments))
+    print_report(report)
+    if arguments.output:
+        Path(arguments.output).write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
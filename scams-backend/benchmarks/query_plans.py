@@ -0,0 +1,270 @@
+"""Check the PostgreSQL plans of every statement the services run.
+
+Each service case of ``benchmarks.bench_services`` is run once against a
+seeded dataset while its SELECT statements are captured with their
+parameters. Every statement is then re-run under
+EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) and checked:
+
+- no sequential scan on a table listed in --no-seq-scan (schedules by
+  default; the small catalog tables are loaded whole by design). Partitions
+  such as schedules_y2026m10 count as their parent table, and scans that
+  read no row at all (empty partitions) are not reported;
+- no plan node whose estimated and actual row counts differ by more than
+  --max-misestimate times, ignoring nodes under 100 rows.
+
+The plan shape (node types, join types, relations and indexes, without costs)
+is compared with the snapshots in benchmarks/plans/. Partitions are shown as
+their parent and identical children of an Append are listed once, so the
+shape does not depend on how many monthly partitions exist. A changed plan fails the
+run until it is reviewed and the snapshots are rewritten with
+--update-snapshots. The exit status is 1 on any failure.
+
+Requires PostgreSQL; the schema of --database-url is dropped and rebuilt with
+the Alembic migrations.
+
+Usage (from scams-backend/):
+    python -m benchmarks.query_plans --database-url postgresql://u:p@localhost/bench
+    python -m benchmarks.query_plans --database-url ... --update-snapshots
+"""
+
+import argparse
+import datetime
+import difflib
+import json
+import sys
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+
+from benchmarks.bench_services import build_cases
+from benchmarks.dataset import parse_spec, seed_dataset
+from scams_backend.cache.catalog import catalog_cache
+from scams_backend.cache.lecturer_directory import lecturer_directory_cache
+from scams_backend.db.session import SessionLocal
+
+SNAPSHOT_DIR = Path(__file__).parent / "plans"
+MIN_ROWS_CHECKED = 100
+# A fixed date keeps the data, and so the plans, the same from run to run.
+DATASET_START_DATE = datetime.date(2025, 3, 3)
+# Nodes with one child per partition.
+APPEND_NODE_TYPES = ("Append", "Merge Append")
+
+
+class CapturedStatement(NamedTuple):
+    statement: str
+    parameters: Any
+
+
+class StatementPlan(NamedTuple):
+    statement: str
+    plan: dict[str, Any]
+    execution_ms: float
+
+
+class StatementCapture:
+    """Records the SELECT statements run on ``engine`` while it is active."""
+
+    def __init__(self, engine: Engine):
+        self.statements: list[CapturedStatement] = []
+        self.active: bool = False
+        event.listen(engine, "before_cursor_execute", self.record)
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        if (
+            self.active
+            and not executemany
+            and statement.lstrip().upper().startswith("SELECT")
+        ):
+            self.statements.append(CapturedStatement(statement, parameters))
+
+    def __enter__(self) -> "StatementCapture":
+        self.statements = []
+        self.active = True
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.active = False
+
+
+def explain(engine: Engine, captured: CapturedStatement) -> StatementPlan:
+    with engine.connect() as connection:
+        result = connection.exec_driver_sql(
+            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {captured.statement}",
+            captured.parameters,
+        ).scalar()
+        connection.rollback()
+    explained = result[0] if isinstance(result, list) else json.loads(result)[0]
+    return StatementPlan(
+        captured.statement, explained["Plan"], explained["Execution Time"]
+    )
+
+
+def load_partition_parents(engine: Engine) -> dict[str, str]:
+    """Parent table (or index) of every partition, by relation name."""
+    with engine.connect() as connection:
+        return dict(
+            connection.execute(
+                text(
+                    "SELECT child.relname, parent.relname FROM pg_inherits "
+                    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                    "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent"
+                )
+            ).all()
+        )
+
+
+def iter_nodes(node: dict[str, Any], depth: int = 0):
+    yield depth, node
+    for child in node.get("Plans", ()):
+        yield from iter_nodes(child, depth + 1)
+
+
+def describe_node(node: dict[str, Any], parents: dict[str, str]) -> str:
+    # Partitions are named by month, so snapshots show their parent instead.
+    description = node["Node Type"]
+    if "Join Type" in node:
+        description += f" ({node['Join Type']})"
+    if "Index Name" in node:
+        description += f" using {parents.get(node['Index Name'], node['Index Name'])}"
+    if "Relation Name" in node:
+        description += (
+            f" on {parents.get(node['Relation Name'], node['Relation Name'])}"
+        )
+    return description
+
+
+def shape_lines(
+    node: dict[str, Any], parents: dict[str, str], depth: int = 0
+) -> list[str]:
+    lines = [f"{'  ' * depth}{describe_node(node, parents)}"]
+    children = [
+        tuple(shape_lines(child, parents, depth + 1)) for child in node.get("Plans", ())
+    ]
+    if node["Node Type"] in APPEND_NODE_TYPES:
+        children = list(dict.fromkeys(children))
+    for child in children:
+        lines.extend(child)
+    return lines
+
+
+def plan_shape(plan: StatementPlan, parents: dict[str, str]) -> str:
+    first_line = " ".join(plan.statement.split())[:100]
+    return "\n".join([f"-- {first_line}"] + shape_lines(plan.plan, parents))
+
+
+def is_empty_scan(node: dict[str, Any]) -> bool:
+    return not node.get("Actual Rows") and not node.get("Rows Removed by Filter")
+
+
+def check_plan(
+    plan: StatementPlan,
+    no_seq_scan: set[str],
+    max_misestimate: float,
+    parents: dict[str, str],
+) -> list[str]:
+    problems = []
+    for _, node in iter_nodes(plan.plan):
+        relation = node.get("Relation Name")
+        if (
+            node["Node Type"] == "Seq Scan"
+            and parents.get(relation, relation) in no_seq_scan
+            and not is_empty_scan(node)
+        ):
+            problems.append(f"sequential scan on {relation}")
+        if not node.get("Actual Loops"):
+            continue
+        estimated, actual = node["Plan Rows"], node["Actual Rows"]
+        if max(estimated, actual) < MIN_ROWS_CHECKED:
+            continue
+        factor = max(estimated, actual) / max(min(estimated, actual), 1)
+        if factor > max_misestimate:
+            problems.append(
+                f"{describe_node(node, parents)}: estimated {estimated} rows, "
+                f"actual {actual} ({factor:.0f}x off)"
+            )
+    return problems
+
+
+def compare_snapshot(name: str, shape: str, update: bool) -> list[str]:
+    path = SNAPSHOT_DIR / f"{name}.plan"
+    if update:
+        SNAPSHOT_DIR.mkdir(exist_ok=True)
+        path.write_text(shape + "\n")
+        return []
+    if not path.exists():
+        return [f"no snapshot at {path}; run with --update-snapshots"]
+    expected = path.read_text().rstrip("\n")
+    if expected == shape:
+        return []
+    diff = difflib.unified_diff(
+        expected.splitlines(),
+        shape.splitlines(),
+        f"{path.name} (snapshot)",
+        f"{path.name} (current)",
+        lineterm="",
+    )
+    return ["plan changed:\n" + "\n".join(diff)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--scale", default="medium")
+    parser.add_argument("--seed", type=int, default=20240901)
+    parser.add_argument(
+        "--no-seq-scan", action="append", help="table that must not be seq scanned"
+    )
+    parser.add_argument("--max-misestimate", type=float, default=10.0)
+    parser.add_argument("--update-snapshots", action="store_true")
+    arguments = parser.parse_args()
+
+    engine = create_engine(arguments.database_url)
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("Query plans can only be checked on PostgreSQL.")
+    SessionLocal.configure(bind=engine)
+    dataset = seed_dataset(
+        engine, parse_spec(arguments.scale), arguments.seed, DATASET_START_DATE
+    )
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+    parents = load_partition_parents(engine)
+    capture = StatementCapture(engine)
+    no_seq_scan = set(arguments.no_seq_scan or ["schedules"])
+
+    failures = 0
+    for case in build_cases(dataset):
+        if not case.name.startswith("service:"):
+            continue
+        name = case.name.removeprefix("service:")
+        # Cold caches, so the snapshot loads are checked too.
+        catalog_cache.bump_version()
+        lecturer_directory_cache.bump_version()
+        with capture:
+            case.run()
+
+        plans = [explain(engine, captured) for captured in capture.statements]
+        problems = [
+            problem
+            for plan in plans
+            for problem in check_plan(
+                plan, no_seq_scan, arguments.max_misestimate, parents
+            )
+        ]
+        shape = "\n\n".join(plan_shape(plan, parents) for plan in plans)
+        problems += compare_snapshot(name, shape, arguments.update_snapshots)
+
+        total_ms = sum(plan.execution_ms for plan in plans)
+        status = "FAIL" if problems else "ok"
+        print(f"{status:<5}{name:<24}{len(plans):>3} statements {total_ms:>9.2f} ms")
+        for problem in problems:
+            print(f"       {problem}")
+        failures += bool(problems)
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare the cost of serializing 1k ScheduleDetail rows.
+
+"before" is the old path: validated construction, then FastAPI's
+``jsonable_encoder`` and ``JSONResponse``. "after" is trusted construction
+rendered by ``FastJSONResponse``.
+
+Usage: python scripts/benchmark_serialization.py [--rows 1000] [--repeat 20]
+"""
+
+import argparse
+import datetime
+import statistics
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from scams_backend.schemas.schedule.schedule_schema import (
+    ListSchedulesResponse,
+    ScheduleDetail,
+)
+from scams_backend.utils.responses import FastJSONResponse
+
+
+def make_rows(count: int) -> list[dict]:
+    created_at = datetime.datetime(2025, 1, 1, 8, 0)
+    return [
+        {
+            "id": index,
+            "room_id": index % 50,
+            "room_name": f"Room {index % 50}",
+            "lecturer_id": index % 20,
+            "lecturer_name": f"Lecturer {index % 20}",
+            "building_id": index % 5,
+            "building_name": f"Building {index % 5}",
+            "date": datetime.date(2025, 1, 1) + datetime.timedelta(days=index % 30),
+            "start_time": datetime.time(7 + index % 15),
+            "purpose": "Lecture",
+            "team_members": "Alice, Bob",
+            "created_at": created_at,
+        }
+        for index in range(count)
+    ]
+
+
+def before(rows: list[dict]) -> bytes:
+    response = ListSchedulesResponse(schedules=[ScheduleDetail(**row) for row in rows])
+    # FastAPI validated the returned model against the response model again.
+    response = ListSchedulesResponse.model_validate(response.model_dump())
+    return JSONResponse(content=jsonable_encoder(response)).body
+
+
+def after(rows: list[dict]) -> bytes:
+    response = ListSchedulesResponse.model_construct(
+        schedules=[ScheduleDetail.model_construct(**row) for row in rows]
+    )
+    return FastJSONResponse(content=response).body
+
+
+def measure(function, rows: list[dict], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(rows)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    per_thousand = 1000 / args.rows
+    before_seconds = measure(before, rows, args.repeat) * per_thousand
+    after_seconds = measure(after, rows, args.repeat) * per_thousand
+    print(f"before: {before_seconds * 1000:.2f} ms per 1k schedules")
+    print(f"after:  {after_seconds * 1000:.2f} ms per 1k schedules")
+    print(f"speedup: {before_seconds / after_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Export the schedules of a date range as CSV or Parquet.
+
+Same output as GET /schedules/export, written straight to a file or stdout.
+Parquet needs the optional pyarrow dependency (scams-backend[export]).
+
+Usage (from scams-backend/):
+    python scripts/export_schedules.py --start-date 2025-09-01 \\
+        --end-date 2026-06-30 --format parquet --output year.parquet
+    python scripts/export_schedules.py --start-date 2025-09-01 \\
+        --end-date 2025-09-30 > september.csv
+"""
+
+import argparse
+import datetime
+import sys
+import time
+
+from scams_backend.constants.export import ExportFormat
+from scams_backend.core.config import settings
+from scams_backend.db.session import SessionLocal
+from scams_backend.services.schedule.export_schedules_service import (
+    ExportSchedulesService,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--start-date", type=datetime.date.fromisoformat, required=True)
+    parser.add_argument("--end-date", type=datetime.date.fromisoformat, required=True)
+    parser.add_argument(
+        "--format",
+        dest="file_format",
+        type=ExportFormat,
+        choices=list(ExportFormat),
+        default=ExportFormat.CSV,
+    )
+    parser.add_argument("--room-id", type=int)
+    parser.add_argument("--building-id", type=int)
+    parser.add_argument("--batch-size", type=int, default=settings.EXPORT_BATCH_SIZE)
+    parser.add_argument("--output", help="file to write (default: stdout)")
+    arguments = parser.parse_args()
+
+    started = time.perf_counter()
+    written = 0
+    with SessionLocal() as db_session:
+        content = ExportSchedulesService(
+            start_date=arguments.start_date,
+            end_date=arguments.end_date,
+            room_id=arguments.room_id,
+            building_id=arguments.building_id,
+            file_format=arguments.file_format,
+            db_session=db_session,
+            batch_size=arguments.batch_size,
+        ).invoke()
+        output = open(arguments.output, "wb") if arguments.output else sys.stdout.buffer
+        try:
+            for chunk in content:
+                output.write(chunk)
+                written += len(chunk)
+        finally:
+            if arguments.output:
+                output.close()
+    print(
+        f"Exported {written / 1024 / 1024:.1f} MiB in "
+        f"{time.perf_counter() - started:.1f}s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Create upcoming schedule partitions and archive old ones.
+
+The API already creates upcoming months in the background; run this from cron
+to archive months older than SCHEDULE_ARCHIVE_AFTER_MONTHS. Archived months
+are detached from ``schedules`` and either written to gzipped CSV files in
+--archive-dir or moved to the ``schedules_archive`` table.
+
+Usage (from scams-backend/):
+    python scripts/maintain_schedule_partitions.py
+    python scripts/maintain_schedule_partitions.py --since 2023-09-01
+    python scripts/maintain_schedule_partitions.py --archive --mode table
+"""
+
+import argparse
+import datetime
+
+from scams_backend.core.config import settings
+from scams_backend.db.session import SessionLocal
+from scams_backend.services.schedule.schedule_partition_service import (
+    ARCHIVE_MODES,
+    SchedulePartitionService,
+    add_months,
+    archive_cutoff,
+    month_start,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--months-ahead", type=int, default=settings.SCHEDULE_PARTITION_MONTHS_AHEAD
+    )
+    parser.add_argument(
+        "--since",
+        type=datetime.date.fromisoformat,
+        help="also create partitions back to this date, e.g. after a backfill "
+        "into the default partition",
+    )
+    parser.add_argument("--archive", action="store_true")
+    parser.add_argument(
+        "--before",
+        type=datetime.date.fromisoformat,
+        help="archive months ending on or before this date "
+        f"(default: {settings.SCHEDULE_ARCHIVE_AFTER_MONTHS} months ago)",
+    )
+    parser.add_argument(
+        "--mode", choices=ARCHIVE_MODES, default=settings.SCHEDULE_ARCHIVE_MODE
+    )
+    parser.add_argument("--archive-dir", default=settings.SCHEDULE_ARCHIVE_DIR)
+    arguments = parser.parse_args()
+
+    with SessionLocal() as db_session:
+        service = SchedulePartitionService(db_session=db_session)
+        if not service.is_partitioned():
+            raise SystemExit("schedules is not partitioned; run the migrations.")
+
+        current = month_start(datetime.date.today())
+        created = service.ensure_partitions(
+            arguments.since or current, add_months(current, arguments.months_ahead)
+        )
+        print(f"Created {len(created)} partitions: {', '.join(created) or '-'}")
+
+        if arguments.archive:
+            archived = service.archive_partitions(
+                before=arguments.before or archive_cutoff(),
+                mode=arguments.mode,
+                archive_dir=arguments.archive_dir,
+            )
+            for target in archived:
+                print(f"Archived to {target}")
+            print(f"Archived {len(archived)} partitions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Rebuild room_day_occupancy from schedules.
+
+The summary is updated together with every booking; run this after writing
+schedules directly (imports, manual fixes) or whenever the two disagree.
+Without dates the whole range of schedules is rebuilt, one month per
+transaction, so bookings only wait for one month at a time.
+
+Usage (from scams-backend/):
+    python scripts/rebuild_occupancy_summary.py
+    python scripts/rebuild_occupancy_summary.py --start-date 2025-09-01 \\
+        --end-date 2025-12-31 --room-id 12
+"""
+
+import argparse
+import datetime
+
+from sqlalchemy import func, select
+
+from scams_backend.db.session import SessionLocal
+from scams_backend.models.schedule import Schedule
+from scams_backend.services.schedule.occupancy_summary_service import (
+    RebuildOccupancySummaryService,
+)
+from scams_backend.services.schedule.schedule_partition_service import add_months
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--start-date", type=datetime.date.fromisoformat)
+    parser.add_argument("--end-date", type=datetime.date.fromisoformat)
+    parser.add_argument("--room-id", type=int)
+    arguments = parser.parse_args()
+
+    with SessionLocal() as db_session:
+        first_date, last_date = db_session.execute(
+            select(func.min(Schedule.date), func.max(Schedule.date))
+        ).one()
+        start_date = arguments.start_date or first_date
+        end_date = arguments.end_date or last_date
+        if start_date is None or end_date is None:
+            raise SystemExit("No schedules to summarize.")
+
+        total = 0
+        month = start_date.replace(day=1)
+        while month <= end_date:
+            chunk_end = min(end_date, add_months(month, 1) - datetime.timedelta(days=1))
+            total += RebuildOccupancySummaryService(
+                start_date=max(start_date, month),
+                end_date=chunk_end,
+                room_id=arguments.room_id,
+                db_session=db_session,
+            ).invoke()
+            month = add_months(month, 1)
+        print(f"Rebuilt {total} room-days from {start_date} to {end_date}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Change the role of a user, e.g. to grant or revoke admin rights.
+
+Sign-up never creates admins; promote an existing account instead. The new
+role is in the user's token from their next sign-in.
+
+Usage (from scams-backend/):
+    python scripts/set_user_role.py --email someone@example.edu --role admin
+"""
+
+import argparse
+
+# Imported for its commit hook, which tells running workers about the change.
+import scams_backend.cache.lecturer_directory  # noqa: F401
+from scams_backend.constants.user import UserRole
+from scams_backend.db.session import SessionLocal
+from scams_backend.models.user import User
+from scams_backend.utils.hash import hash_email
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--role", type=UserRole, choices=list(UserRole), required=True)
+    arguments = parser.parse_args()
+
+    with SessionLocal() as db_session:
+        user = (
+            db_session.query(User)
+            .filter_by(email_hash=hash_email(arguments.email))
+            .first()
+        )
+        if user is None:
+            raise SystemExit(f"No user with email '{arguments.email}'.")
+        previous_role = user.role
+        user.role = arguments.role.value
+        db_session.commit()
+    print(
+        f"Changed role of {arguments.email} from {previous_role} to {arguments.role.value}."
+    )
+
+
+if __name__ == "__main__":
+    main()
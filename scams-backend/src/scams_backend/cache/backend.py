@@ -0,0 +1,100 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class CacheBackendError(Exception):
+    """The cache backend could not be reached; callers treat it as a miss."""
+
+
+MessageHandler = Callable[[bytes], None]
+SubscribedHandler = Callable[[], None]
+
+
+class CacheBackend(ABC):
+    """Byte-oriented key/value store with TTLs and a publish/subscribe channel."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def incr(self, key: str) -> int: ...
+
+    @abstractmethod
+    def publish(self, channel: str, message: bytes) -> None: ...
+
+    @abstractmethod
+    def subscribe(
+        self,
+        channel: str,
+        handler: MessageHandler,
+        on_subscribed: Optional[SubscribedHandler] = None,
+    ) -> None:
+        """Deliver every message on ``channel`` to ``handler``.
+
+        ``on_subscribed`` runs each time the subscription is (re)established;
+        messages published while it was down are lost.
+        """
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Process-local LRU with TTLs; publish reaches this process's subscribers."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize: int = maxsize
+        self._entries: OrderedDict[str, tuple[bytes, Optional[float]]] = OrderedDict()
+        self._handlers: dict[str, list[MessageHandler]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        expires_at = None if ttl_seconds is None else time.monotonic() + ttl_seconds
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value, expires_at = self._entries.get(key, (b"0", None))
+            value = str(int(value) + 1).encode()
+            self._entries[key] = (value, expires_at)
+            return int(value)
+
+    def publish(self, channel: str, message: bytes) -> None:
+        for handler in list(self._handlers.get(channel, ())):
+            handler(message)
+
+    def subscribe(
+        self,
+        channel: str,
+        handler: MessageHandler,
+        on_subscribed: Optional[SubscribedHandler] = None,
+    ) -> None:
+        # In-process delivery never drops messages, so on_subscribed is unused.
+        with self._lock:
+            self._handlers.setdefault(channel, []).append(handler)
@@ -0,0 +1,96 @@
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Callable, Iterable, Optional
+
+from scams_backend.cache.backend import CacheBackendError
+from scams_backend.cache.shared_cache import (
+    SharedCache,
+    cache_backend,
+    invalidation_bus,
+)
+from scams_backend.constants.cache import InvalidationTopic
+from scams_backend.core.config import settings
+from scams_backend.utils.http_cache import EncodedBody
+
+FeedSubject = tuple[str, int]
+
+
+class CalendarFeedCache:
+    """Rendered calendar feeds, kept until the bookings they show change.
+
+    Every feed has a version token in the backend that is replaced whenever
+    one of its bookings changes. Rendered bodies are shared between workers
+    under that token, and each worker also keeps the encoded bodies it served
+    last, so polling an unchanged feed costs a single backend read.
+    """
+
+    def __init__(self, shared_cache: SharedCache, maxsize: int):
+        self.shared_cache: SharedCache = shared_cache
+        self.maxsize: int = maxsize
+        self._bodies: OrderedDict[str, EncodedBody] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def version_key(self, kind: str, subject_id: int) -> str:
+        return f"{self.shared_cache.prefix}:version:{kind}:{subject_id}"
+
+    def current_version(self, kind: str, subject_id: int) -> Optional[str]:
+        key = self.version_key(kind, subject_id)
+        try:
+            version = self.shared_cache.backend.get(key)
+            if version is None:
+                # A fresh token rather than a counter: a version that was
+                # evicted can never bring back a body rendered under it.
+                version = uuid.uuid4().hex.encode()
+                self.shared_cache.backend.set(
+                    key, version, self.shared_cache.ttl_seconds
+                )
+            return f"{self.shared_cache.generation()}:{version.decode()}"
+        except CacheBackendError:
+            return None
+
+    def get_or_render(
+        self, kind: str, subject_id: int, render: Callable[[], bytes]
+    ) -> EncodedBody:
+        version = self.current_version(kind, subject_id)
+        if version is None:
+            return EncodedBody(render())
+
+        key = f"{kind}:{subject_id}:{version}"
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+                return body
+
+        body = EncodedBody(self.shared_cache.get_or_load(key, render))
+        with self._lock:
+            self._bodies[key] = body
+            while len(self._bodies) > self.maxsize:
+                self._bodies.popitem(last=False)
+        return body
+
+    def invalidate(self, subjects: Iterable[FeedSubject]) -> None:
+        for kind, subject_id in subjects:
+            try:
+                self.shared_cache.backend.set(
+                    self.version_key(kind, subject_id),
+                    uuid.uuid4().hex.encode(),
+                    self.shared_cache.ttl_seconds,
+                )
+            except CacheBackendError:
+                # The feed catches up when its cached body expires.
+                pass
+
+
+# Room names appear in every feed, so catalog changes drop all of them.
+calendar_feed_cache = CalendarFeedCache(
+    SharedCache(
+        namespace="calendar_feeds",
+        ttl_seconds=settings.CALENDAR_FEED_CACHE_TTL_SECONDS,
+        backend=cache_backend,
+        invalidation_bus=invalidation_bus,
+        topics=(InvalidationTopic.CATALOG,),
+    ),
+    maxsize=settings.CALENDAR_FEED_LOCAL_CACHE_SIZE,
+)
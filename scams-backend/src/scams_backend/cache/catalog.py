@@ -0,0 +1,236 @@
+import time
+from array import array
+from typing import Iterable, Iterator, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from scams_backend.cache.versioned_cache import VersionedCache, bump_on_commit
+from scams_backend.constants.cache import InvalidationTopic
+from scams_backend.core.config import settings
+from scams_backend.models.building import Building
+from scams_backend.models.device import Device
+from scams_backend.models.room import Room
+from scams_backend.models.room_device import RoomDevice
+from scams_backend.schemas.resource.building import BuildingDetail, BuildingListResponse
+from scams_backend.schemas.resource.device import DeviceDetail, DeviceListResponse
+from scams_backend.utils.http_cache import EncodedBody
+from scams_backend.schemas.room.room_schema import (
+    DeviceInRoomDetailResponse,
+    RoomDetailResponse,
+)
+
+
+class CatalogSnapshot:
+    """Immutable view of buildings, devices, rooms and room devices.
+
+    Reloaded by ``catalog_cache`` when its TTL expires or whenever a session
+    commits changes to one of those tables.
+    """
+
+    __slots__ = (
+        "version",
+        "loaded_at",
+        "buildings",
+        "devices",
+        "rooms",
+        "room_positions",
+        "room_building_ids",
+        "room_capacities",
+        "device_bits",
+        "room_device_masks",
+        "buildings_body",
+        "devices_body",
+        "rooms_json",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        buildings: BuildingListResponse,
+        devices: DeviceListResponse,
+        rooms: list[RoomDetailResponse],
+    ):
+        self.version: int = version
+        self.loaded_at: float = time.monotonic()
+        self.buildings: BuildingListResponse = buildings
+        self.devices: DeviceListResponse = devices
+        self.rooms: tuple[RoomDetailResponse, ...] = tuple(
+            sorted(rooms, key=lambda room: room.id)
+        )
+        self.room_positions: dict[int, int] = {
+            room.id: position for position, room in enumerate(self.rooms)
+        }
+        self.room_building_ids: array = array(
+            "i", (room.building_id for room in self.rooms)
+        )
+        self.room_capacities: array = array("i", (room.capacity for room in self.rooms))
+        self.device_bits: dict[int, int] = {
+            device.id: bit for bit, device in enumerate(devices.devices)
+        }
+        self.room_device_masks: tuple[int, ...] = tuple(
+            self.device_mask(device.id for device in room.devices)
+            for room in self.rooms
+        )
+        self.buildings_body: EncodedBody = EncodedBody(
+            buildings.model_dump_json().encode("utf-8")
+        )
+        self.devices_body: EncodedBody = EncodedBody(
+            devices.model_dump_json().encode("utf-8")
+        )
+        self.rooms_json: tuple[bytes, ...] = tuple(
+            room.model_dump_json().encode("utf-8") for room in self.rooms
+        )
+
+    def get_room(self, room_id: int) -> Optional[RoomDetailResponse]:
+        position = self.room_positions.get(room_id)
+        return None if position is None else self.rooms[position]
+
+    def get_room_json(self, room_id: int) -> Optional[bytes]:
+        position = self.room_positions.get(room_id)
+        return None if position is None else self.rooms_json[position]
+
+    def device_mask(self, device_ids: Iterable[int]) -> int:
+        mask = 0
+        for device_id in device_ids:
+            bit = self.device_bits.get(device_id)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def iter_room_positions(
+        self,
+        building_id: Optional[int] = None,
+        min_capacity: Optional[int] = None,
+        device_ids: Optional[list[int]] = None,
+        any_device_ids: Optional[list[int]] = None,
+    ) -> Iterator[int]:
+        all_mask = self.device_mask(device_ids or ())
+        any_mask = self.device_mask(any_device_ids or ())
+        # A requested device that is not in the catalog can never be satisfied.
+        if device_ids and any(
+            device_id not in self.device_bits for device_id in device_ids
+        ):
+            return
+        if any_device_ids and not any_mask:
+            return
+
+        for position in range(len(self.rooms)):
+            if (
+                building_id is not None
+                and self.room_building_ids[position] != building_id
+            ):
+                continue
+            if (
+                min_capacity is not None
+                and self.room_capacities[position] < min_capacity
+            ):
+                continue
+            room_mask = self.room_device_masks[position]
+            if room_mask & all_mask != all_mask:
+                continue
+            if any_mask and not room_mask & any_mask:
+                continue
+            yield position
+
+    def filter_rooms(
+        self,
+        building_id: Optional[int] = None,
+        min_capacity: Optional[int] = None,
+        device_ids: Optional[list[int]] = None,
+        any_device_ids: Optional[list[int]] = None,
+    ) -> list[RoomDetailResponse]:
+        return [
+            self.rooms[position]
+            for position in self.iter_room_positions(
+                building_id, min_capacity, device_ids, any_device_ids
+            )
+        ]
+
+    def count_rooms_per_device(
+        self,
+        building_id: Optional[int] = None,
+        min_capacity: Optional[int] = None,
+        device_ids: Optional[list[int]] = None,
+        any_device_ids: Optional[list[int]] = None,
+    ) -> tuple[int, list[int]]:
+        total = 0
+        bit_counts = [0] * len(self.device_bits)
+        for position in self.iter_room_positions(
+            building_id, min_capacity, device_ids, any_device_ids
+        ):
+            total += 1
+            room_mask = self.room_device_masks[position]
+            while room_mask:
+                lowest_bit = room_mask & -room_mask
+                bit_counts[lowest_bit.bit_length() - 1] += 1
+                room_mask ^= lowest_bit
+        return total, bit_counts
+
+
+def load_catalog_snapshot(db_session: Session, version: int) -> CatalogSnapshot:
+    buildings = db_session.execute(
+        select(Building.id, Building.name).order_by(Building.id)
+    ).all()
+    devices = db_session.execute(
+        select(Device.id, Device.name).order_by(Device.id)
+    ).all()
+    rooms = db_session.execute(
+        select(
+            Room.id,
+            Room.name,
+            Room.image_url,
+            Room.floor_number,
+            Room.building_id,
+            Room.capacity,
+        ).order_by(Room.id)
+    ).all()
+    room_devices = db_session.execute(
+        select(RoomDevice.room_id, RoomDevice.device_id).order_by(RoomDevice.id)
+    ).all()
+
+    building_names = {building.id: building.name for building in buildings}
+    device_names = {device.id: device.name for device in devices}
+    devices_by_room: dict[int, list[DeviceInRoomDetailResponse]] = {}
+    for room_device in room_devices:
+        device_name = device_names.get(room_device.device_id)
+        if device_name is None:
+            continue
+        devices_by_room.setdefault(room_device.room_id, []).append(
+            DeviceInRoomDetailResponse(id=room_device.device_id, name=device_name)
+        )
+
+    return CatalogSnapshot(
+        version=version,
+        buildings=BuildingListResponse(
+            buildings=[
+                BuildingDetail.model_validate(building) for building in buildings
+            ]
+        ),
+        devices=DeviceListResponse(
+            devices=[DeviceDetail.model_validate(device) for device in devices]
+        ),
+        rooms=[
+            RoomDetailResponse(
+                id=room.id,
+                name=room.name,
+                image_url=room.image_url,
+                floor_number=room.floor_number,
+                building_id=room.building_id,
+                building_name=building_names.get(room.building_id, ""),
+                capacity=room.capacity,
+                devices=devices_by_room.get(room.id, []),
+            )
+            for room in rooms
+        ],
+    )
+
+
+catalog_cache: VersionedCache[CatalogSnapshot] = VersionedCache(
+    name="catalog",
+    loader=load_catalog_snapshot,
+    ttl_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+)
+bump_on_commit(
+    catalog_cache, (Building, Device, Room, RoomDevice), InvalidationTopic.CATALOG
+)
@@ -0,0 +1,110 @@
+import re
+import time
+import unicodedata
+from bisect import bisect_left
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from scams_backend.cache.versioned_cache import VersionedCache, bump_on_commit
+from scams_backend.constants.cache import InvalidationTopic
+from scams_backend.constants.user import UserRole
+from scams_backend.core.config import settings
+from scams_backend.models.user import User
+from scams_backend.schemas.resource.lecturer import (
+    LecturerDetail,
+    LecturerListResponse,
+)
+from scams_backend.utils.encrypt import decrypt_data
+from scams_backend.utils.http_cache import EncodedBody
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def normalize_name(name: str) -> str:
+    """Casefold ``name`` and strip diacritics, so "Nguyễn Đức" matches "nguyen duc"."""
+    decomposed = unicodedata.normalize("NFKD", name.casefold().replace("đ", "d"))
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize_name(name: str) -> list[str]:
+    return TOKEN_PATTERN.findall(normalize_name(name))
+
+
+class LecturerDirectory:
+    """Decrypted lecturer names with a sorted token index for prefix search."""
+
+    __slots__ = (
+        "version",
+        "loaded_at",
+        "lecturers",
+        "names",
+        "tokens",
+        "positions",
+        "lecturers_body",
+    )
+
+    def __init__(self, version: int, lecturers: list[LecturerDetail]):
+        self.version: int = version
+        self.loaded_at: float = time.monotonic()
+        self.lecturers: tuple[LecturerDetail, ...] = tuple(
+            sorted(
+                lecturers,
+                key=lambda lecturer: (normalize_name(lecturer.full_name), lecturer.id),
+            )
+        )
+        self.names: dict[int, str] = {
+            lecturer.id: lecturer.full_name for lecturer in self.lecturers
+        }
+        entries = sorted(
+            (token, position)
+            for position, lecturer in enumerate(self.lecturers)
+            for token in set(tokenize_name(lecturer.full_name))
+        )
+        self.tokens: list[str] = [token for token, _ in entries]
+        self.positions: list[int] = [position for _, position in entries]
+        self.lecturers_body: EncodedBody = EncodedBody(
+            LecturerListResponse(lecturers=list(self.lecturers))
+            .model_dump_json()
+            .encode("utf-8")
+        )
+
+    def get_name(self, lecturer_id: int) -> Optional[str]:
+        return self.names.get(lecturer_id)
+
+    def search(self, query: str) -> list[LecturerDetail]:
+        # Every word of the query has to prefix-match a word of the name.
+        matches: Optional[set[int]] = None
+        for query_token in set(tokenize_name(query)):
+            start = bisect_left(self.tokens, query_token)
+            end = bisect_left(self.tokens, query_token + "\U0010ffff", lo=start)
+            token_matches = set(self.positions[start:end])
+            matches = token_matches if matches is None else matches & token_matches
+            if not matches:
+                return []
+
+        if matches is None:
+            return list(self.lecturers)
+        return [self.lecturers[position] for position in sorted(matches)]
+
+
+def load_lecturer_directory(db_session: Session, version: int) -> LecturerDirectory:
+    rows = db_session.execute(
+        select(User.id, User.full_name).where(User.role == UserRole.LECTURER)
+    ).all()
+    return LecturerDirectory(
+        version=version,
+        lecturers=[
+            LecturerDetail(id=row.id, full_name=decrypt_data(row.full_name))
+            for row in rows
+        ],
+    )
+
+
+lecturer_directory_cache: VersionedCache[LecturerDirectory] = VersionedCache(
+    name="lecturer_directory",
+    loader=load_lecturer_directory,
+    ttl_seconds=settings.LECTURER_DIRECTORY_TTL_SECONDS,
+)
+bump_on_commit(lecturer_directory_cache, (User,), InvalidationTopic.USERS)
@@ -0,0 +1,194 @@
+import socket
+import threading
+import time
+from typing import Optional, Union
+from urllib.parse import urlparse
+from scams_backend.cache.backend import (
+    CacheBackend,
+    CacheBackendError,
+    MessageHandler,
+    SubscribedHandler,
+)
+
+RespValue = Union[None, int, bytes, list]
+
+
+class RespError(Exception):
+    pass
+
+
+class RespConnection:
+    """Minimal blocking client for the Redis serialization protocol (RESP2)."""
+
+    def __init__(self, url: str, timeout: Optional[float]):
+        parsed = urlparse(url)
+        self.host: str = parsed.hostname or "localhost"
+        self.port: int = parsed.port or 6379
+        self.password: Optional[str] = parsed.password
+        self.db: int = int(parsed.path.lstrip("/") or 0)
+        self.timeout: Optional[float] = timeout
+        self._socket: Optional[socket.socket] = None
+        self._reader = None
+
+    def connect(self) -> None:
+        self._socket = socket.create_connection((self.host, self.port), self.timeout)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile("rb")
+        if self.password:
+            self.execute("AUTH", self.password)
+        if self.db:
+            self.execute("SELECT", self.db)
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+        self._socket = None
+        self._reader = None
+
+    def send(self, *args: Union[str, bytes, int, float]) -> None:
+        if self._socket is None:
+            self.connect()
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        self._socket.sendall(b"".join(parts))
+
+    def read_reply(self) -> RespValue:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by the cache server.")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload
+        if kind == b"-":
+            raise RespError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [self.read_reply() for _ in range(length)]
+        raise RespError(f"Unexpected reply type {kind!r}.")
+
+    def execute(self, *args: Union[str, bytes, int, float]) -> RespValue:
+        self.send(*args)
+        return self.read_reply()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache backend for any server speaking the Redis protocol."""
+
+    def __init__(self, url: str, timeout: float = 1.0):
+        self.url: str = url
+        self.timeout: float = timeout
+        self._connection = RespConnection(url, timeout)
+        self._lock = threading.Lock()
+        self._handlers: dict[str, list[MessageHandler]] = {}
+        self._subscribed_handlers: dict[str, list[SubscribedHandler]] = {}
+        self._subscriber: Optional[threading.Thread] = None
+        self._pubsub: Optional[RespConnection] = None
+
+    def execute(self, *args) -> RespValue:
+        with self._lock:
+            # A dropped connection is retried once on a fresh socket.
+            for attempt in range(2):
+                try:
+                    return self._connection.execute(*args)
+                except (OSError, ConnectionError) as e:
+                    self._connection.close()
+                    if attempt:
+                        raise CacheBackendError(str(e)) from e
+                except RespError as e:
+                    raise CacheBackendError(str(e)) from e
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.execute("GET", key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        if ttl_seconds is None:
+            self.execute("SET", key, value)
+        else:
+            self.execute("SET", key, value, "PX", int(ttl_seconds * 1000))
+
+    def delete(self, key: str) -> None:
+        self.execute("DEL", key)
+
+    def incr(self, key: str) -> int:
+        return self.execute("INCR", key)
+
+    def publish(self, channel: str, message: bytes) -> None:
+        self.execute("PUBLISH", channel, message)
+
+    def subscribe(
+        self,
+        channel: str,
+        handler: MessageHandler,
+        on_subscribed: Optional[SubscribedHandler] = None,
+    ) -> None:
+        with self._lock:
+            is_new_channel = channel not in self._handlers
+            self._handlers.setdefault(channel, []).append(handler)
+            if on_subscribed is not None:
+                self._subscribed_handlers.setdefault(channel, []).append(on_subscribed)
+            if self._subscriber is None:
+                self._subscriber = threading.Thread(
+                    target=self.listen, name="cache-subscriber", daemon=True
+                )
+                self._subscriber.start()
+            elif is_new_channel and self._pubsub is not None:
+                try:
+                    self._pubsub.send("SUBSCRIBE", channel)
+                except OSError:
+                    # The listener reconnects and subscribes to every channel.
+                    pass
+
+    def open_pubsub(self) -> RespConnection:
+        with self._lock:
+            # No timeout: the blocking read waits for the next message.
+            connection = RespConnection(self.url, None)
+            connection.send("SUBSCRIBE", *self._handlers)
+            self._pubsub = connection
+            return connection
+
+    def notify(self, handlers, *args) -> None:
+        for handler in list(handlers):
+            try:
+                handler(*args)
+            except Exception:
+                # One broken subscriber must not stop the others.
+                pass
+
+    def listen(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = self.open_pubsub()
+                while True:
+                    reply = connection.read_reply()
+                    if not isinstance(reply, list):
+                        continue
+                    if reply[0] == b"message":
+                        handlers = self._handlers.get(reply[1].decode(), ())
+                        self.notify(handlers, reply[2])
+                    elif reply[0] == b"subscribe":
+                        # Confirmed, also after a reconnect: anything published
+                        # while the connection was down is gone.
+                        self.notify(
+                            self._subscribed_handlers.get(reply[1].decode(), ())
+                        )
+            except (OSError, ConnectionError, RespError):
+                with self._lock:
+                    self._pubsub = None
+                if connection is not None:
+                    connection.close()
+                time.sleep(1.0)
@@ -0,0 +1,179 @@
+"""In-memory stand-in for a Redis server, for local runs and tests.
+
+Implements the subset of commands used by ``RedisCacheBackend``. Start it with
+``python -m scams_backend.cache.resp_server --port 6379``.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Optional, Union
+
+RespValue = Union[None, int, bytes, list, Exception]
+
+
+def encode_reply(value: RespValue) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, Exception):
+        return b"-ERR %s\r\n" % str(value).encode()
+    if isinstance(value, bool) or isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(encode_reply(item) for item in value)
+    raise TypeError(f"Cannot encode {type(value).__name__} as RESP.")
+
+
+async def read_command(reader: asyncio.StreamReader) -> Optional[list[bytes]]:
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b"*"):
+        # Inline command, as sent by telnet or redis-cli --no-raw.
+        return line.split()
+    arguments = []
+    for _ in range(int(line[1:-2])):
+        length = int((await reader.readline())[1:-2])
+        arguments.append((await reader.readexactly(length + 2))[:-2])
+    return arguments
+
+
+class RespServer:
+    def __init__(self, password: Optional[str] = None):
+        self.password: Optional[str] = password
+        self.databases: dict[int, dict[bytes, tuple[bytes, Optional[float]]]] = {}
+        self.channels: dict[bytes, set[asyncio.StreamWriter]] = {}
+
+    def lookup(self, db: int, key: bytes) -> Optional[bytes]:
+        entry = self.databases.setdefault(db, {}).get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.databases[db][key]
+            return None
+        return value
+
+    def set(self, db: int, arguments: list[bytes]) -> RespValue:
+        key, value, options = arguments[0], arguments[1], arguments[2:]
+        expires_at, only_if_missing = None, False
+        index = 0
+        while index < len(options):
+            option = options[index].upper()
+            if option in (b"EX", b"PX"):
+                amount = float(options[index + 1])
+                amount = amount if option == b"EX" else amount / 1000
+                expires_at = time.monotonic() + amount
+                index += 2
+                continue
+            if option == b"NX":
+                only_if_missing = True
+            else:
+                return ValueError("syntax error")
+            index += 1
+        if only_if_missing and self.lookup(db, key) is not None:
+            return None
+        self.databases.setdefault(db, {})[key] = (value, expires_at)
+        return b"OK"
+
+    def incr(self, db: int, key: bytes) -> RespValue:
+        value = self.lookup(db, key)
+        try:
+            number = int(value or 0) + 1
+        except ValueError:
+            return ValueError("value is not an integer or out of range")
+        expires_at = self.databases[db][key][1] if value is not None else None
+        self.databases[db][key] = (str(number).encode(), expires_at)
+        return number
+
+    def publish(self, channel: bytes, message: bytes) -> int:
+        subscribers = self.channels.get(channel, set())
+        for writer in subscribers:
+            writer.write(encode_reply([b"message", channel, message]))
+        return len(subscribers)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        db = 0
+        authenticated = self.password is None
+        subscriptions: set[bytes] = set()
+        try:
+            while True:
+                arguments = await read_command(reader)
+                if arguments is None:
+                    break
+                if not arguments:
+                    continue
+                command, arguments = arguments[0].upper(), arguments[1:]
+
+                if command == b"AUTH":
+                    authenticated = arguments[-1].decode() == self.password
+                    reply = b"OK" if authenticated else ValueError("invalid password")
+                elif not authenticated:
+                    reply = ValueError("NOAUTH Authentication required.")
+                elif command == b"PING":
+                    reply = arguments[0] if arguments else b"PONG"
+                elif command == b"SELECT":
+                    db = int(arguments[0])
+                    reply = b"OK"
+                elif command == b"GET":
+                    reply = self.lookup(db, arguments[0])
+                elif command == b"SET":
+                    reply = self.set(db, arguments)
+                elif command == b"DEL":
+                    keys = self.databases.setdefault(db, {})
+                    reply = sum(
+                        self.lookup(db, key) is not None and keys.pop(key) is not None
+                        for key in arguments
+                    )
+                elif command == b"INCR":
+                    reply = self.incr(db, arguments[0])
+                elif command == b"FLUSHDB":
+                    self.databases.pop(db, None)
+                    reply = b"OK"
+                elif command == b"PUBLISH":
+                    reply = self.publish(arguments[0], arguments[1])
+                elif command == b"SUBSCRIBE":
+                    for channel in arguments:
+                        subscriptions.add(channel)
+                        self.channels.setdefault(channel, set()).add(writer)
+                        writer.write(
+                            encode_reply([b"subscribe", channel, len(subscriptions)])
+                        )
+                    await writer.drain()
+                    continue
+                else:
+                    reply = ValueError(f"unknown command '{command.decode()}'")
+
+                if isinstance(reply, bytes) and reply in (b"OK", b"PONG"):
+                    writer.write(b"+%s\r\n" % reply)
+                else:
+                    writer.write(encode_reply(reply))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            for channel in subscriptions:
+                self.channels.get(channel, set()).discard(writer)
+            writer.close()
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--password", default=None)
+    arguments = parser.parse_args()
+    asyncio.run(RespServer(arguments.password).serve(arguments.host, arguments.port))
+
+
+if __name__ == "__main__":
+    main()
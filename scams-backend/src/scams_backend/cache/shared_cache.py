@@ -0,0 +1,197 @@
+import json
+import os
+import threading
+import uuid
+from typing import Callable, Optional
+from scams_backend.cache.backend import (
+    CacheBackend,
+    CacheBackendError,
+    MemoryCacheBackend,
+)
+from scams_backend.cache.redis_backend import RedisCacheBackend
+from scams_backend.core.config import settings
+from scams_backend.metrics.registry import CACHE_REQUESTS
+
+InvalidationHandler = Callable[[bool], None]
+
+
+def create_cache_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(
+            settings.CACHE_REDIS_URL, timeout=settings.CACHE_TIMEOUT_SECONDS
+        )
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend(maxsize=settings.CACHE_MEMORY_MAXSIZE)
+    raise ValueError(f"Unknown CACHE_BACKEND '{settings.CACHE_BACKEND}'.")
+
+
+class InvalidationBus:
+    """Broadcasts that a topic's data changed to every worker.
+
+    Handlers run in the publishing process straight away with ``local=True``
+    and in the other processes with ``local=False`` once the message arrives.
+    Whenever the subscription is (re)established every topic is dispatched
+    with ``local=False``, since messages sent while it was down are lost.
+    """
+
+    def __init__(self, backend: CacheBackend, channel: str):
+        self.backend: CacheBackend = backend
+        self.channel: str = channel
+        self.origin: str = f"{os.getpid()}-{uuid.uuid4().hex}"
+        self._handlers: dict[str, list[InvalidationHandler]] = {}
+        self._subscribed: bool = False
+        self._lock = threading.Lock()
+
+    def subscribe(self, topic: str, handler: InvalidationHandler) -> None:
+        with self._lock:
+            self._handlers.setdefault(topic, []).append(handler)
+            if not self._subscribed:
+                self.backend.subscribe(
+                    self.channel, self.receive, on_subscribed=self.resubscribed
+                )
+                self._subscribed = True
+
+    def publish(self, *topics: str) -> None:
+        for topic in topics:
+            self.dispatch(topic, local=True)
+        message = json.dumps({"origin": self.origin, "topics": topics}).encode()
+        try:
+            self.backend.publish(self.channel, message)
+        except CacheBackendError:
+            # Other workers catch up when their entries expire.
+            pass
+
+    def receive(self, message: bytes) -> None:
+        payload = json.loads(message)
+        if payload["origin"] == self.origin:
+            return
+        for topic in payload["topics"]:
+            self.dispatch(topic, local=False)
+
+    def resubscribed(self) -> None:
+        for topic in list(self._handlers):
+            self.dispatch(topic, local=False)
+
+    def dispatch(self, topic: str, local: bool) -> None:
+        for handler in list(self._handlers.get(topic, ())):
+            handler(local)
+
+
+class SharedCache:
+    """Namespaced view of the cache backend with single-flight loading.
+
+    Keys embed a namespace generation stored in the backend; invalidating the
+    namespace bumps the generation, which orphans every existing entry at
+    once. Backend failures are treated as cache misses.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: Optional[float],
+        backend: CacheBackend,
+        invalidation_bus: InvalidationBus,
+        topics: tuple[str, ...] = (),
+    ):
+        self.namespace: str = namespace
+        self.ttl_seconds: Optional[float] = ttl_seconds
+        self.backend: CacheBackend = backend
+        self.prefix: str = f"{settings.CACHE_KEY_PREFIX}:{namespace}"
+        self._generation: Optional[int] = None
+        self._flights: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._hits = CACHE_REQUESTS.labels(namespace, "hit")
+        self._misses = CACHE_REQUESTS.labels(namespace, "miss")
+        for topic in topics:
+            invalidation_bus.subscribe(topic, self.on_invalidated)
+
+    def generation(self) -> int:
+        generation = self._generation
+        if generation is None:
+            generation = int(self.backend.get(f"{self.prefix}:generation") or 0)
+            self._generation = generation
+        return generation
+
+    def make_key(self, key: str) -> str:
+        return f"{self.prefix}:{self.generation()}:{key}"
+
+    def read(self, namespaced_key: Optional[str]) -> Optional[bytes]:
+        value = None
+        if namespaced_key is not None:
+            try:
+                value = self.backend.get(namespaced_key)
+            except CacheBackendError:
+                pass
+        (self._misses if value is None else self._hits).inc()
+        return value
+
+    def write(self, namespaced_key: Optional[str], value: bytes) -> None:
+        if namespaced_key is None:
+            return
+        try:
+            self.backend.set(namespaced_key, value, self.ttl_seconds)
+        except CacheBackendError:
+            pass
+
+    def try_make_key(self, key: str) -> Optional[str]:
+        try:
+            return self.make_key(key)
+        except CacheBackendError:
+            return None
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.read(self.try_make_key(key))
+
+    def set(self, key: str, value: bytes) -> None:
+        self.write(self.try_make_key(key), value)
+
+    def get_or_load(self, key: str, loader: Callable[[], bytes]) -> bytes:
+        # The generation is read once, before loading: a value loaded while
+        # the namespace is invalidated lands under the orphaned generation
+        # instead of being served as fresh under the new one.
+        namespaced_key = self.try_make_key(key)
+        value = self.read(namespaced_key)
+        if value is not None:
+            return value
+        if namespaced_key is None:
+            return loader()
+
+        # Only one thread per process loads a missing key; the rest wait for it.
+        with self._lock:
+            flight = self._flights.get(namespaced_key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[namespaced_key] = threading.Event()
+        if not is_leader:
+            flight.wait(settings.CACHE_LOAD_TIMEOUT_SECONDS)
+            value = self.read(namespaced_key)
+            return value if value is not None else loader()
+
+        try:
+            value = loader()
+            self.write(namespaced_key, value)
+            return value
+        finally:
+            with self._lock:
+                del self._flights[namespaced_key]
+            flight.set()
+
+    def invalidate(self) -> None:
+        try:
+            self._generation = self.backend.incr(f"{self.prefix}:generation")
+        except CacheBackendError:
+            self._generation = None
+
+    def on_invalidated(self, local: bool) -> None:
+        # The publishing worker bumps the shared generation; the others only
+        # drop the generation they remembered.
+        if local:
+            self.invalidate()
+        else:
+            self._generation = None
+
+
+cache_backend: CacheBackend = create_cache_backend()
+invalidation_bus = InvalidationBus(
+    cache_backend, channel=f"{settings.CACHE_KEY_PREFIX}:invalidations"
+)
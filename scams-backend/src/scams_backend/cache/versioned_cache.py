@@ -0,0 +1,100 @@
+import threading
+import time
+from typing import Callable, Generic, Optional, Protocol, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from scams_backend.cache.shared_cache import invalidation_bus
+from scams_backend.metrics.registry import CACHE_REQUESTS
+
+
+class Snapshot(Protocol):
+    version: int
+    loaded_at: float
+
+
+SnapshotT = TypeVar("SnapshotT", bound=Snapshot)
+
+
+class VersionedCache(Generic[SnapshotT]):
+    """Process-local holder of a snapshot loaded from the database.
+
+    The snapshot is reloaded when its TTL expires or after ``bump_version``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[Session, int], SnapshotT],
+        ttl_seconds: int,
+    ):
+        self.name: str = name
+        self.loader: Callable[[Session, int], SnapshotT] = loader
+        self.ttl_seconds: int = ttl_seconds
+        self._hits = CACHE_REQUESTS.labels(name, "hit")
+        self._misses = CACHE_REQUESTS.labels(name, "miss")
+        self._version: int = 0
+        self._snapshot: Optional[SnapshotT] = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump_version(self) -> int:
+        with self._lock:
+            self._version += 1
+            return self._version
+
+    def is_fresh(self, snapshot: SnapshotT) -> bool:
+        return (
+            snapshot.version == self._version
+            and time.monotonic() - snapshot.loaded_at < self.ttl_seconds
+        )
+
+    def get(self, db_session: Session) -> SnapshotT:
+        snapshot = self._snapshot
+        if snapshot is not None and self.is_fresh(snapshot):
+            self._hits.inc()
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or not self.is_fresh(snapshot):
+                self._misses.inc()
+                snapshot = self.loader(db_session, self._version)
+                self._snapshot = snapshot
+            else:
+                self._hits.inc()
+            return snapshot
+
+    def reload(self, db_session: Session) -> SnapshotT:
+        with self._lock:
+            self._snapshot = self.loader(db_session, self._version)
+            return self._snapshot
+
+
+def bump_on_invalidation(cache: VersionedCache, topic: str) -> None:
+    """Bump ``cache`` in every worker whenever ``topic`` is invalidated."""
+    invalidation_bus.subscribe(topic, lambda local: cache.bump_version())
+
+
+def bump_on_commit(cache: VersionedCache, models: tuple[type, ...], topic: str) -> None:
+    """Invalidate ``topic`` whenever a session commits changes to any of ``models``."""
+    bump_on_invalidation(cache, topic)
+    info_key = ("cache_changed", id(cache))
+
+    @event.listens_for(Session, "after_flush")
+    def mark_changes(session: Session, flush_context) -> None:
+        for instance in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(instance, models):
+                session.info[info_key] = True
+                return
+
+    @event.listens_for(Session, "after_commit")
+    def bump_version(session: Session) -> None:
+        if session.info.pop(info_key, False):
+            invalidation_bus.publish(topic)
+
+    @event.listens_for(Session, "after_rollback")
+    def discard_changes(session: Session) -> None:
+        session.info.pop(info_key, None)
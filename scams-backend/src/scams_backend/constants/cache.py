@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class InvalidationTopic(str, Enum):
+    CATALOG = "catalog"
+    SCHEDULES = "schedules"
+    USERS = "users"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class CalendarFeedKind(str, Enum):
+    LECTURER = "lecturer"
+    ROOM = "room"
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class CancellationScope(str, Enum):
+    # Only the given hourly slot
+    SLOT = "slot"
+    # Every slot booked together with it
+    BOOKING = "booking"
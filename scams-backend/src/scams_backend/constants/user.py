@@ -4,3 +4,5 @@ from enum import Enum
 class UserRole(str, Enum):
     STUDENT = "student"
     LECTURER = "lecturer"
+    # Granted with scripts/set_user_role.py, never through sign-up.
+    ADMIN = "admin"
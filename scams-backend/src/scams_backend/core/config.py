@@ -14,6 +14,98 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     AES_KEY: str = "your_aes_key"
 
+    # Booking settings
+    BOOKING_DAY_START_HOUR: int = 7
+    BOOKING_DAY_END_HOUR: int = 22
+    SLOT_SEARCH_MAX_DAYS: int = 31
+    FREE_BUSY_MAX_DAYS: int = 31
+
+    # Cache settings
+    CATALOG_CACHE_TTL_SECONDS: int = 300
+    ANALYTICS_CACHE_TTL_SECONDS: int = 3600
+    LECTURER_DIRECTORY_TTL_SECONDS: int = 600
+    REFERENCE_DATA_MAX_AGE_SECONDS: int = 60
+
+    # Compression settings
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Health check settings
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+    HEALTH_CHECK_MAX_AGE_SECONDS: float = 15.0
+    ALEMBIC_CONFIG_PATH: str = "alembic.ini"
+
+    # Load shedding settings, keyed by route class (see core/route_classes.py)
+    LOAD_SHEDDING_ENABLED: bool = True
+    CONCURRENCY_LIMITS: dict[str, int] = {
+        "auth": 8,
+        "heavy": 16,
+        "export": 2,
+        "default": 64,
+    }
+    CONCURRENCY_QUEUE_SIZES: dict[str, int] = {
+        "auth": 32,
+        "heavy": 32,
+        "export": 4,
+        "default": 128,
+    }
+    LATENCY_TARGETS_SECONDS: dict[str, float] = {
+        "auth": 1.0,
+        "heavy": 0.5,
+        "export": 60.0,
+        "default": 0.2,
+    }
+    CONCURRENCY_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    LOAD_SHEDDING_RETRY_AFTER_SECONDS: int = 2
+
+    # Request deadlines by route class, also applied as statement_timeout
+    REQUEST_DEADLINES_SECONDS: dict[str, float] = {
+        "auth": 5.0,
+        "heavy": 5.0,
+        "export": 300.0,
+        "default": 2.0,
+    }
+
+    # Idempotency settings
+    IDEMPOTENCY_KEY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_LOCK_TIMEOUT_SECONDS: int = 60
+
+    # Shared cache settings; CACHE_BACKEND is "memory" or "redis"
+    CACHE_BACKEND: str = "memory"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_KEY_PREFIX: str = "scams"
+    CACHE_MEMORY_MAXSIZE: int = 1024
+    CACHE_TIMEOUT_SECONDS: float = 0.5
+    CACHE_LOAD_TIMEOUT_SECONDS: float = 10.0
+
+    # Schedule export settings
+    EXPORT_MAX_DAYS: int = 400
+    EXPORT_BATCH_SIZE: int = 10000
+
+    # Calendar feed settings; CALENDAR_TIMEZONE is the campus time zone that
+    # schedule dates and times are in
+    CALENDAR_FEED_SECRET: str = "your_calendar_feed_secret"
+    CALENDAR_TIMEZONE: str = "Asia/Ho_Chi_Minh"
+    CALENDAR_FEED_PAST_DAYS: int = 30
+    CALENDAR_FEED_CACHE_TTL_SECONDS: int = 86400
+    CALENDAR_FEED_LOCAL_CACHE_SIZE: int = 1024
+    CALENDAR_FEED_MAX_AGE_SECONDS: int = 300
+
+    # Schedule cancellation settings
+    CANCELLATION_MAX_DAYS: int = 400
+
+    # Analytics settings
+    ANALYTICS_MAX_DAYS: int = 366
+
+    # Schedule partitioning (PostgreSQL); SCHEDULE_ARCHIVE_MODE is "file" or
+    # "table"
+    SCHEDULE_PARTITION_MONTHS_AHEAD: int = 12
+    SCHEDULE_PARTITION_CHECK_INTERVAL_SECONDS: float = 3600.0
+    SCHEDULE_ARCHIVE_AFTER_MONTHS: int = 12
+    SCHEDULE_ARCHIVE_MODE: str = "file"
+    SCHEDULE_ARCHIVE_DIR: str = "archive"
+
     class Config:
         env_file = ".env"
         extra = "ignore"
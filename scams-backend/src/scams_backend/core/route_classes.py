@@ -0,0 +1,41 @@
+import re
+from typing import Optional
+from starlette.types import Scope
+
+AUTH = "auth"
+HEAVY = "heavy"
+EXPORT = "export"
+DEFAULT = "default"
+
+# First match wins. Paths are relative to the application's root path.
+ROUTE_CLASS_RULES: tuple[tuple[str, re.Pattern, str], ...] = (
+    ("POST", re.compile(r"^/sign(in|up)/?$"), AUTH),
+    ("GET", re.compile(r"^/schedules(/|/me/?)?$"), HEAVY),
+    ("GET", re.compile(r"^/schedules/export/?$"), EXPORT),
+    ("POST", re.compile(r"^/schedules/cancellations/?$"), HEAVY),
+    ("GET", re.compile(r"^/rooms/?$"), HEAVY),
+    ("GET", re.compile(r"^/rooms/available-slots/?$"), HEAVY),
+    ("GET", re.compile(r"^/analytics/"), HEAVY),
+)
+# Probes and scrapes must keep working while the service sheds load.
+UNCLASSIFIED_PATHS = re.compile(r"^/(health|metrics)(/|$)")
+
+
+def route_path(scope: Scope) -> str:
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path) :]
+    return path or "/"
+
+
+def route_class(scope: Scope) -> Optional[str]:
+    """Budget class of a request, or None for probes that are never limited."""
+    path = route_path(scope)
+    if UNCLASSIFIED_PATHS.match(path):
+        return None
+    method = scope["method"]
+    for rule_method, pattern, name in ROUTE_CLASS_RULES:
+        if method == rule_method and pattern.match(path):
+            return name
+    return DEFAULT
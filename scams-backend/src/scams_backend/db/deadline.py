@@ -0,0 +1,87 @@
+import asyncio
+import time
+from typing import Callable, TypeVar
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.requests import Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from scams_backend.core.route_classes import DEFAULT, route_class
+from scams_backend.metrics.registry import REQUEST_TIMEOUTS
+
+DEADLINE_KEY = "deadline"
+# SQLSTATE query_canceled, raised by Postgres when statement_timeout expires.
+QUERY_CANCELED = "57014"
+
+T = TypeVar("T")
+
+
+class DeadlineExceededException(HTTPException):
+    def __init__(self, message: str = "The request did not finish in time."):
+        super().__init__(status_code=504, detail=message)
+
+
+def set_session_deadline(db_session: Session, deadline: float) -> None:
+    """Bound every statement ``db_session`` runs by ``deadline`` (monotonic)."""
+    db_session.info[DEADLINE_KEY] = deadline
+
+
+def is_statement_timeout(error: BaseException) -> bool:
+    return (
+        isinstance(error, DBAPIError)
+        and getattr(error.orig, "pgcode", None) == QUERY_CANCELED
+    )
+
+
+def is_deadline_error(error: BaseException) -> bool:
+    """Whether ``error`` means the request ran out of time, i.e. a 504."""
+    return isinstance(error, DeadlineExceededException) or is_statement_timeout(error)
+
+
+async def run_in_threadpool_to_completion(func: Callable[..., T], *args) -> T:
+    """Run ``func`` in the threadpool and wait for it even if cancelled.
+
+    A worker thread cannot be interrupted, so when the request is cancelled,
+    e.g. by DeadlineMiddleware, it would keep using the request's session
+    while DBMiddleware closes it. The cancellation is delivered only once the
+    worker has finished; statement_timeout bounds how long that takes.
+    """
+    worker = asyncio.ensure_future(run_in_threadpool(func, *args))
+    cancelled = False
+    while not worker.done():
+        try:
+            await asyncio.wait([worker])
+        except asyncio.CancelledError:
+            cancelled = True
+    if cancelled:
+        raise asyncio.CancelledError()
+    return worker.result()
+
+
+async def statement_timeout_exception_handler(
+    request: Request, exc: DBAPIError
+) -> JSONResponse:
+    if not is_statement_timeout(exc):
+        raise exc
+    REQUEST_TIMEOUTS.labels(
+        route_class(request.scope) or DEFAULT, "statement_timeout"
+    ).inc()
+    return JSONResponse(
+        content={"detail": "The request did not finish in time."}, status_code=504
+    )
+
+
+@event.listens_for(Session, "after_begin")
+def apply_statement_timeout(db_session: Session, transaction, connection) -> None:
+    deadline = db_session.info.get(DEADLINE_KEY)
+    if deadline is None:
+        return
+    remaining_ms = int((deadline - time.monotonic()) * 1000)
+    if remaining_ms <= 0:
+        raise DeadlineExceededException()
+    if connection.dialect.name == "postgresql":
+        # SET LOCAL lasts until the end of the transaction, so every new
+        # transaction of the request gets what is left of its deadline.
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {remaining_ms}")
@@ -2,9 +2,15 @@ from scams_backend.core import config
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from scams_backend.web_app import initialize_app
+from scams_backend.utils.responses import FastJSONResponse
+from scams_backend.web_app import initialize_app, lifespan
 
-app = FastAPI(title="Smart Campus System API", root_path="/api/v1")
+app = FastAPI(
+    title="Smart Campus System API",
+    root_path="/api/v1",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 
 origins = [
     "http://localhost:5173",
@@ -0,0 +1,44 @@
+import time
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from scams_backend.metrics.registry import DB_POOL_CONNECTIONS, DB_STATEMENT_DURATION
+
+STATEMENT_OPERATIONS = frozenset(
+    ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK")
+)
+START_TIMES_KEY = "metrics_statement_start_times"
+
+
+def statement_operation(statement: str) -> str:
+    operation = statement.lstrip()[:8].split(None, 1)
+    operation = operation[0].upper() if operation else ""
+    return operation.lower() if operation in STATEMENT_OPERATIONS else "other"
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record statement timings and pool connection counts for ``engine``."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(START_TIMES_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def observe_statement(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info[START_TIMES_KEY].pop()
+        DB_STATEMENT_DURATION.labels(statement_operation(statement)).observe(
+            time.perf_counter() - started
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def discard_timer(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get(START_TIMES_KEY):
+            connection.info[START_TIMES_KEY].pop()
+
+    open_connections = DB_POOL_CONNECTIONS.labels("open")
+    checked_out_connections = DB_POOL_CONNECTIONS.labels("checked_out")
+    event.listen(engine, "connect", lambda *_: open_connections.inc())
+    event.listen(engine, "close", lambda *_: open_connections.dec())
+    event.listen(engine, "close_detached", lambda *_: open_connections.dec())
+    event.listen(engine, "checkout", lambda *_: checked_out_connections.inc())
+    event.listen(engine, "checkin", lambda *_: checked_out_connections.dec())
@@ -0,0 +1,105 @@
+import os
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    Summary,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+# Metrics are per process. With several uvicorn/gunicorn workers, point
+# PROMETHEUS_MULTIPROC_DIR at an empty directory shared by the workers before
+# they start; every worker then writes its values there and /metrics sums them.
+MULTIPROCESS_ENABLED = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+HTTP_REQUEST_DURATION = Histogram(
+    "scams_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status_code"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "scams_http_requests_in_progress",
+    "HTTP requests currently being served.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_STATEMENT_DURATION = Histogram(
+    "scams_db_statement_duration_seconds",
+    "Database statement execution time by statement type.",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "scams_db_pool_connections",
+    "Database connections held by the pool, by state (open or checked_out).",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+
+AES_OPERATION_DURATION = Summary(
+    "scams_aes_operation_duration_seconds",
+    "Time spent in AES-GCM encryption and decryption.",
+    ["operation"],
+)
+BCRYPT_OPERATION_DURATION = Summary(
+    "scams_bcrypt_operation_duration_seconds",
+    "Time spent hashing and verifying passwords.",
+    ["operation"],
+)
+BCRYPT_OPERATIONS_IN_PROGRESS = Gauge(
+    "scams_bcrypt_operations_in_progress",
+    "Password hash operations waiting or running.",
+    multiprocess_mode="livesum",
+)
+
+CACHE_REQUESTS = Counter(
+    "scams_cache_requests_total",
+    "Cache lookups by cache and result (hit or miss).",
+    ["cache", "result"],
+)
+
+LOAD_SHEDDING_REQUESTS = Counter(
+    "scams_load_shedding_requests_total",
+    "Requests by route class and outcome (admitted, queue_full or queue_timeout).",
+    ["route_class", "outcome"],
+)
+CONCURRENCY_LIMIT = Gauge(
+    "scams_concurrency_limit",
+    "Current adaptive concurrency limit by route class.",
+    ["route_class"],
+    multiprocess_mode="livesum",
+)
+CONCURRENCY_QUEUE_DEPTH = Gauge(
+    "scams_concurrency_queue_depth",
+    "Requests waiting for a concurrency slot by route class.",
+    ["route_class"],
+    multiprocess_mode="livesum",
+)
+
+REQUEST_TIMEOUTS = Counter(
+    "scams_request_timeouts_total",
+    "Requests that overran their deadline, by route class and source "
+    "(deadline or statement_timeout).",
+    ["route_class", "source"],
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if MULTIPROCESS_ENABLED:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop a dead worker's live gauges; call from gunicorn's child_exit hook."""
+    if MULTIPROCESS_ENABLED:
+        multiprocess.mark_process_dead(pid)
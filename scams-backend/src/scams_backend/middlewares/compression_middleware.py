@@ -0,0 +1,139 @@
+from typing import Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from scams_backend.core.config import settings
+from scams_backend.utils.compression import (
+    StreamCompressor,
+    compress,
+    negotiate_encoding,
+    stream_compressor,
+)
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+STREAMING_TYPES = ("application/x-ndjson", "text/event-stream")
+
+
+def is_compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "").lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
+
+
+class CompressionMiddleware:
+    """Compress responses with the best coding the client accepts.
+
+    Bodies smaller than ``minimum_size`` and responses that already carry a
+    Content-Encoding, such as the pre-compressed reference data, pass through
+    untouched. Larger streamed responses and NDJSON streams are compressed
+    chunk by chunk.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size: int = (
+            settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self.downstream_send: Send = send
+        self.encoding: str = encoding
+        self.minimum_size: int = minimum_size
+        self.start_message: Optional[Message] = None
+        self.passthrough: bool = False
+        self.compressor: Optional[StreamCompressor] = None
+        self.buffer: bytearray = bytearray()
+        self.streaming: bool = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows how to encode it.
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                message["status"] < 200
+                or message["status"] in (204, 304)
+                or "content-encoding" in headers
+                or not is_compressible(headers)
+            )
+            # Line-delimited streams are compressed from the first chunk.
+            self.streaming = headers.get("content-type", "").startswith(STREAMING_TYPES)
+            return
+
+        if message["type"] != "http.response.body":
+            await self.downstream_send(message)
+            return
+
+        if self.passthrough:
+            await self.flush_start()
+            await self.downstream_send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            # Small bodies may still arrive in several chunks, so they are
+            # buffered until the threshold is reached or the body ends.
+            self.buffer += body
+            if not more_body:
+                await self.send_buffered()
+                return
+            if len(self.buffer) < self.minimum_size and not self.streaming:
+                return
+            self.compressor = stream_compressor(self.encoding)
+            self.set_encoding_headers(content_length=None)
+            await self.flush_start()
+            body = bytes(self.buffer)
+            self.buffer.clear()
+
+        body = self.compressor.compress(body) if body else b""
+        if not more_body:
+            body += self.compressor.finish()
+        await self.downstream_send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
+
+    async def send_buffered(self) -> None:
+        body = bytes(self.buffer)
+        if len(body) >= self.minimum_size:
+            body = compress(body, self.encoding)
+            self.set_encoding_headers(content_length=len(body))
+        await self.flush_start()
+        await self.downstream_send({"type": "http.response.body", "body": body})
+
+    def set_encoding_headers(self, content_length: Optional[int] = None) -> None:
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if content_length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(content_length)
+        # A strong validator no longer matches the transformed bytes.
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def flush_start(self) -> None:
+        if self.start_message is not None:
+            await self.downstream_send(self.start_message)
+            self.start_message = None
@@ -2,11 +2,15 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 from scams_backend.db.session import SessionLocal
+from scams_backend.db.deadline import DEADLINE_KEY, set_session_deadline
 
 
 class DBMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next) -> Response:
         request.state.db = SessionLocal()
+        deadline = getattr(request.state, DEADLINE_KEY, None)
+        if deadline is not None:
+            set_session_deadline(request.state.db, deadline)
 
         try:
             response = await call_next(request)
@@ -0,0 +1,57 @@
+import asyncio
+import time
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from scams_backend.core.config import settings
+from scams_backend.core.route_classes import route_class
+from scams_backend.db.deadline import DEADLINE_KEY
+from scams_backend.metrics.registry import REQUEST_TIMEOUTS
+
+
+class DeadlineMiddleware:
+    """Give each request its route class's deadline and enforce it.
+
+    The deadline is stored in the request state, from where DBMiddleware
+    propagates it into the session's statement_timeout. Work still running
+    when it passes is cancelled and the caller gets a 504, unless the
+    response has already started. Handlers running session work in the
+    threadpool use run_in_threadpool_to_completion, so the cancellation
+    waits for the worker instead of closing the session under it.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        name = route_class(scope)
+        timeout = settings.REQUEST_DEADLINES_SECONDS.get(name)
+        if timeout is None:
+            await self.app(scope, receive, send)
+            return
+
+        scope.setdefault("state", {})[DEADLINE_KEY] = time.monotonic() + timeout
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await asyncio.wait_for(
+                self.app(scope, receive, send_tracking_start), timeout
+            )
+        except asyncio.TimeoutError:
+            REQUEST_TIMEOUTS.labels(name, "deadline").inc()
+            if response_started:
+                raise
+            response = JSONResponse(
+                content={"detail": "The request did not finish in time."},
+                status_code=504,
+            )
+            await response(scope, receive, send)
@@ -0,0 +1,73 @@
+import time
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from scams_backend.core.config import settings
+from scams_backend.core.route_classes import route_class
+from scams_backend.metrics.registry import (
+    CONCURRENCY_LIMIT,
+    CONCURRENCY_QUEUE_DEPTH,
+    LOAD_SHEDDING_REQUESTS,
+)
+from scams_backend.utils.concurrency_limiter import AdaptiveConcurrencyLimiter
+
+
+class LoadSheddingMiddleware:
+    """Admit requests through a per-route-class adaptive concurrency limit.
+
+    Requests that find the class's wait queue full, or that wait longer than
+    CONCURRENCY_QUEUE_TIMEOUT_SECONDS, are rejected with 503 and Retry-After
+    instead of piling up behind slow work.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.limiters: dict[str, AdaptiveConcurrencyLimiter] = {
+            name: AdaptiveConcurrencyLimiter(
+                max_limit=limit,
+                queue_size=settings.CONCURRENCY_QUEUE_SIZES.get(name, limit),
+                queue_timeout=settings.CONCURRENCY_QUEUE_TIMEOUT_SECONDS,
+                latency_target=settings.LATENCY_TARGETS_SECONDS.get(name, 1.0),
+            )
+            for name, limit in settings.CONCURRENCY_LIMITS.items()
+        }
+        for name, limiter in self.limiters.items():
+            CONCURRENCY_LIMIT.labels(name).set(limiter.limit)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.LOAD_SHEDDING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        name = route_class(scope)
+        limiter = self.limiters.get(name)
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        queue_depth = CONCURRENCY_QUEUE_DEPTH.labels(name)
+        queue_depth.inc()
+        try:
+            rejection = await limiter.acquire()
+        finally:
+            queue_depth.dec()
+        if rejection is not None:
+            LOAD_SHEDDING_REQUESTS.labels(name, rejection).inc()
+            response = JSONResponse(
+                content={"detail": "Server is busy, please retry later."},
+                status_code=503,
+                headers={
+                    "Retry-After": str(settings.LOAD_SHEDDING_RETRY_AFTER_SECONDS)
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        LOAD_SHEDDING_REQUESTS.labels(name, "admitted").inc()
+        started = time.perf_counter()
+        latency = None
+        try:
+            await self.app(scope, receive, send)
+            latency = time.perf_counter() - started
+        finally:
+            limiter.release(latency)
+            CONCURRENCY_LIMIT.labels(name).set(limiter.limit)
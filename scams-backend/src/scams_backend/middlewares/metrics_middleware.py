@@ -0,0 +1,40 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from scams_backend.metrics.registry import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+)
+
+
+class MetricsMiddleware:
+    """Record request latency by route template and requests in flight."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            # Unmatched paths share one label so they cannot blow up cardinality.
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method, route.path if route is not None else "unmatched", status_code
+            ).observe(time.perf_counter() - started)
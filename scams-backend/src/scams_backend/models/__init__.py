@@ -4,3 +4,6 @@ from scams_backend.models.building import Building
 from scams_backend.models.room import Room
 from scams_backend.models.room_device import RoomDevice
 from scams_backend.models.device import Device
+from scams_backend.models.idempotency_key import IdempotencyKey
+from scams_backend.models.room_day_occupancy import RoomDayOccupancy
+from scams_backend.models.schedule_cancellation import ScheduleCancellation
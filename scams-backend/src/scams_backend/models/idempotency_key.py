@@ -0,0 +1,32 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    ForeignKey,
+    UniqueConstraint,
+)
+from scams_backend.db.base import Base
+from sqlalchemy import func
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        UniqueConstraint("user_id", "key", name="uq_idempotency_keys_user_id_key"),
+    )
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    key = Column(String(255), nullable=False)
+    request_fingerprint = Column(String(64), nullable=False)
+
+    # Both stay NULL while the first request holding the key is in progress.
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)
+
+    locked_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(
+        DateTime, nullable=False, server_default=func.current_timestamp()
+    )
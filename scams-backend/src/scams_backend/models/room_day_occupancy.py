@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, Date, ForeignKey
+from scams_backend.db.base import Base
+
+
+class RoomDayOccupancy(Base):
+    # Summary of schedules, one row per booked room-day; kept in step by
+    # services/schedule/occupancy_summary_service.py.
+    __tablename__ = "room_day_occupancy"
+    room_id = Column(Integer, ForeignKey("rooms.id"), primary_key=True)
+    date = Column(Date, primary_key=True, index=True)
+    # Bit h is set when the slot starting at h:00 is booked.
+    booked_mask = Column(Integer, nullable=False)
+    booked_hours = Column(Integer, nullable=False)
@@ -1,11 +1,30 @@
-from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from scams_backend.db.base import Base
 from sqlalchemy import func
 
 
 class Schedule(Base):
+    # On PostgreSQL the table is range partitioned by month on date, with the
+    # primary key (id, date); see services/schedule/schedule_partition_service.py.
     __tablename__ = "schedules"
+    __table_args__ = (
+        Index(
+            "ix_schedules_room_id_date_start_time",
+            "room_id",
+            "date",
+            "start_time",
+            unique=True,
+        ),
+        # Lecturer conflicts and free/busy look up a lecturer's day. Not unique:
+        # CreateScheduleService.lock_lecturer serializes a lecturer's bookings.
+        Index(
+            "ix_schedules_lecturer_id_date_start_time",
+            "lecturer_id",
+            "date",
+            "start_time",
+        ),
+    )
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     room_id = Column(Integer, ForeignKey("rooms.id"), nullable=False)
     # purpose = Column(String(255), nullable=False)
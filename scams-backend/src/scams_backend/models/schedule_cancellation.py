@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey, DateTime
+from scams_backend.db.base import Base
+from sqlalchemy import func
+
+
+class ScheduleCancellation(Base):
+    # Audit copy of a cancelled schedule row; the row itself is deleted, so
+    # readers of schedules and its unique slot index need no deleted flag.
+    __tablename__ = "schedule_cancellations"
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    # Shared by every row cancelled by the same request.
+    cancellation_id = Column(String(36), nullable=False, index=True)
+    schedule_id = Column(Integer, nullable=False)
+    room_id = Column(Integer, ForeignKey("rooms.id"), nullable=False)
+    lecturer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    date = Column(Date, nullable=False, index=True)
+    start_time = Column(Time, nullable=False)
+    purpose = Column(String(512), nullable=False)  # encrypted
+    team_members = Column(String(1024), nullable=True)  # encrypted
+    created_at = Column(DateTime, nullable=False)
+
+    cancelled_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+    reason = Column(String(255), nullable=True)
+    cancelled_at = Column(
+        DateTime, nullable=False, server_default=func.current_timestamp()
+    )
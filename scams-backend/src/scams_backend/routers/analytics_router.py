@@ -0,0 +1,42 @@
+from fastapi import APIRouter, status, Depends, Query
+from fastapi.responses import JSONResponse
+from fastapi.requests import Request
+from scams_backend.dependencies.auth import get_current_user
+from typing import Optional
+import datetime
+from scams_backend.schemas.analytics.occupancy_schema import OccupancyAnalyticsResponse
+from scams_backend.schemas.user.user_claims import UserClaims
+from scams_backend.services.analytics.occupancy_analytics_service import (
+    OccupancyAnalyticsService,
+)
+
+router = APIRouter(tags=["Analytics"], prefix="/analytics")
+
+
+@router.get(
+    "/occupancy",
+    status_code=status.HTTP_200_OK,
+    response_class=JSONResponse,
+    summary="Get occupancy heatmaps and utilization",
+    description="Aggregate booked hours per building, weekday and hour, and "
+    "utilization per building and room over a date range.",
+)
+async def get_occupancy(
+    request: Request,
+    current_user: UserClaims = Depends(get_current_user),
+    start_date: datetime.date = Query(
+        ..., description="First date of the range (YYYY-MM-DD)"
+    ),
+    end_date: datetime.date = Query(
+        ..., description="Last date of the range (YYYY-MM-DD)"
+    ),
+    building_id: Optional[int] = Query(None, description="Filter by building ID"),
+) -> OccupancyAnalyticsResponse:
+    occupancy_analytics_service = OccupancyAnalyticsService(
+        start_date=start_date,
+        end_date=end_date,
+        building_id=building_id,
+        db_session=request.state.db,
+    )
+    occupancy = occupancy_analytics_service.invoke()
+    return occupancy
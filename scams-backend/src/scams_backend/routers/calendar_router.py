@@ -0,0 +1,123 @@
+from fastapi import APIRouter, status, Depends, Query
+from fastapi.requests import Request
+from fastapi.responses import Response
+from scams_backend.core.config import settings
+from scams_backend.constants.calendar import CalendarFeedKind
+from scams_backend.constants.user import UserRole
+from scams_backend.dependencies.auth import get_current_user
+from scams_backend.schemas.calendar.calendar_feed import CalendarFeedLinkResponse
+from scams_backend.schemas.user.user_claims import UserClaims
+from scams_backend.services.calendar.calendar_feed_service import (
+    CalendarFeedLinkService,
+    CalendarFeedService,
+)
+from scams_backend.services.user.exception import PermissionException
+from scams_backend.utils.http_cache import encoded_body_response
+from scams_backend.utils.responses import FastJSONResponse
+
+router = APIRouter(tags=["Calendar"], prefix="/calendar")
+
+CALENDAR_MEDIA_TYPE = "text/calendar; charset=utf-8"
+
+
+def feed_link_response(
+    request: Request, route_name: str, token: str, **path_params
+) -> FastJSONResponse:
+    url = request.url_for(route_name, **path_params).include_query_params(token=token)
+    return FastJSONResponse(content=CalendarFeedLinkResponse(url=str(url), token=token))
+
+
+@router.get(
+    "/me/feed",
+    status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
+    summary="Get my calendar feed link",
+    description="The iCalendar feed URL of the current lecturer's bookings, for "
+    "subscribing from Google Calendar, Outlook or any other calendar client.",
+)
+async def get_my_calendar_feed_link(
+    request: Request, current_user: UserClaims = Depends(get_current_user)
+) -> CalendarFeedLinkResponse:
+    if current_user.role != UserRole.LECTURER:
+        raise PermissionException("Only lecturers have a calendar feed.")
+    token = CalendarFeedLinkService(
+        kind=CalendarFeedKind.LECTURER,
+        subject_id=current_user.id,
+        db_session=request.state.db,
+    ).invoke()
+    return feed_link_response(
+        request,
+        "get_lecturer_calendar_feed",
+        token,
+        lecturer_id=current_user.id,
+    )
+
+
+@router.get(
+    "/rooms/{room_id}/feed",
+    status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
+    summary="Get a room's calendar feed link",
+    description="The iCalendar feed URL of a room's bookings.",
+)
+async def get_room_calendar_feed_link(
+    request: Request, room_id: int, current_user: UserClaims = Depends(get_current_user)
+) -> CalendarFeedLinkResponse:
+    token = CalendarFeedLinkService(
+        kind=CalendarFeedKind.ROOM, subject_id=room_id, db_session=request.state.db
+    ).invoke()
+    return feed_link_response(request, "get_room_calendar_feed", token, room_id=room_id)
+
+
+@router.get(
+    "/lecturers/{lecturer_id}.ics",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    summary="Lecturer calendar feed",
+    description="iCalendar feed of a lecturer's bookings. Authenticated by the "
+    "token of the feed link instead of a cookie; supports ETag revalidation.",
+)
+async def get_lecturer_calendar_feed(
+    request: Request,
+    lecturer_id: int,
+    token: str = Query(..., description="The access token of the feed"),
+) -> Response:
+    calendar_feed_service = CalendarFeedService(
+        kind=CalendarFeedKind.LECTURER,
+        subject_id=lecturer_id,
+        token=token,
+        db_session=request.state.db,
+    )
+    return encoded_body_response(
+        request,
+        calendar_feed_service.invoke(),
+        max_age=settings.CALENDAR_FEED_MAX_AGE_SECONDS,
+        media_type=CALENDAR_MEDIA_TYPE,
+    )
+
+
+@router.get(
+    "/rooms/{room_id}.ics",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    summary="Room calendar feed",
+    description="iCalendar feed of a room's bookings. Authenticated by the token "
+    "of the feed link instead of a cookie; supports ETag revalidation.",
+)
+async def get_room_calendar_feed(
+    request: Request,
+    room_id: int,
+    token: str = Query(..., description="The access token of the feed"),
+) -> Response:
+    calendar_feed_service = CalendarFeedService(
+        kind=CalendarFeedKind.ROOM,
+        subject_id=room_id,
+        token=token,
+        db_session=request.state.db,
+    )
+    return encoded_body_response(
+        request,
+        calendar_feed_service.invoke(),
+        max_age=settings.CALENDAR_FEED_MAX_AGE_SECONDS,
+        media_type=CALENDAR_MEDIA_TYPE,
+    )
@@ -1,5 +1,8 @@
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
+from scams_backend.schemas.health.readiness_schema import ReadinessResponse
+from scams_backend.services.health.readiness_service import readiness_service
+from scams_backend.utils.responses import FastJSONResponse
 
 router = APIRouter(prefix="/health", tags=["Health"])
 
@@ -7,3 +10,35 @@ router = APIRouter(prefix="/health", tags=["Health"])
 @router.get("", status_code=status.HTTP_200_OK, response_class=JSONResponse)
 async def health_check():
     return JSONResponse(content={"status": "healthy"}, status_code=status.HTTP_200_OK)
+
+
+@router.get(
+    "/live",
+    status_code=status.HTTP_200_OK,
+    response_class=JSONResponse,
+    summary="Liveness probe",
+    description="Succeeds while the process can serve requests; checks no dependencies.",
+)
+async def liveness_check():
+    return JSONResponse(content={"status": "alive"}, status_code=status.HTTP_200_OK)
+
+
+@router.get(
+    "/ready",
+    status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
+    summary="Readiness probe",
+    description="Report the cached result of the database, migration and AES key "
+    "checks. Responds 503 when any check fails or the result is stale.",
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+)
+async def readiness_check() -> ReadinessResponse:
+    readiness = readiness_service.invoke()
+    return FastJSONResponse(
+        content=readiness,
+        status_code=(
+            status.HTTP_200_OK
+            if readiness.status == "ready"
+            else status.HTTP_503_SERVICE_UNAVAILABLE
+        ),
+    )
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, status
+from fastapi.responses import Response
+from scams_backend.metrics.registry import render_metrics
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    summary="Prometheus metrics",
+    include_in_schema=False,
+)
+async def get_metrics() -> Response:
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
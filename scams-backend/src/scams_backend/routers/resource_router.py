@@ -1,13 +1,21 @@
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, status, Depends, Query
 from fastapi.responses import JSONResponse
 from fastapi.requests import Request
+from scams_backend.core.config import settings
 from scams_backend.dependencies.auth import get_current_user
 from scams_backend.schemas.resource.building import BuildingListResponse
 from scams_backend.schemas.resource.device import DeviceListResponse
-from scams_backend.schemas.resource.lecturer import LecturerListResponse
+from scams_backend.schemas.resource.lecturer import (
+    LecturerListResponse,
+    LecturerSearchResponse,
+)
 from scams_backend.services.resource.building_service import BuildingService
 from scams_backend.services.resource.device_service import DeviceService
-from scams_backend.services.resource.lecturer_service import LecturerService
+from scams_backend.utils.http_cache import encoded_body_response
+from scams_backend.services.resource.lecturer_service import (
+    LecturerService,
+    LecturerSearchService,
+)
 
 router = APIRouter(tags=["Resources"])
 
@@ -17,8 +25,11 @@ async def get_buildings(
     request: Request, current_user=Depends(get_current_user)
 ) -> BuildingListResponse:
     building_service = BuildingService(db_session=request.state.db)
-    building_response: BuildingListResponse = building_service.invoke()
-    return building_response
+    return encoded_body_response(
+        request,
+        building_service.invoke_body(),
+        max_age=settings.REFERENCE_DATA_MAX_AGE_SECONDS,
+    )
 
 
 @router.get("/devices", status_code=status.HTTP_200_OK, response_class=JSONResponse)
@@ -26,8 +37,11 @@ async def get_devices(
     request: Request, current_user=Depends(get_current_user)
 ) -> DeviceListResponse:
     device_service = DeviceService(db_session=request.state.db)
-    device_response: DeviceListResponse = device_service.invoke()
-    return device_response
+    return encoded_body_response(
+        request,
+        device_service.invoke_body(),
+        max_age=settings.REFERENCE_DATA_MAX_AGE_SECONDS,
+    )
 
 
 @router.get("/lecturers", status_code=status.HTTP_200_OK, response_class=JSONResponse)
@@ -35,5 +49,30 @@ async def get_lecturers(
     request: Request, current_user=Depends(get_current_user)
 ) -> LecturerListResponse:
     lecturer_service = LecturerService(db_session=request.state.db)
-    lecturer_response: LecturerListResponse = lecturer_service.invoke()
-    return lecturer_response
+    return encoded_body_response(
+        request,
+        lecturer_service.invoke_body(),
+        max_age=settings.REFERENCE_DATA_MAX_AGE_SECONDS,
+    )
+
+
+@router.get(
+    "/lecturers/search",
+    status_code=status.HTTP_200_OK,
+    response_class=JSONResponse,
+    summary="Search lecturers by name prefix",
+)
+async def search_lecturers(
+    request: Request,
+    current_user=Depends(get_current_user),
+    q: str = Query(
+        "", description="Name prefixes to match, e.g. 'ngu al'", max_length=100
+    ),
+    limit: int = Query(20, description="Number of lecturers to return", ge=1, le=100),
+    offset: int = Query(0, description="Number of lecturers to skip", ge=0),
+) -> LecturerSearchResponse:
+    lecturer_search_service = LecturerSearchService(
+        query=q, limit=limit, offset=offset, db_session=request.state.db
+    )
+    lecturer_search_response = lecturer_search_service.invoke()
+    return lecturer_search_response
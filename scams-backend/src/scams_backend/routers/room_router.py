@@ -1,5 +1,5 @@
 from fastapi import APIRouter, status, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.requests import Request
 from scams_backend.dependencies.auth import get_current_user
 from typing import Optional
@@ -7,8 +7,15 @@ from scams_backend.schemas.room.room_schema import RoomDetailResponse, RoomListR
 from scams_backend.services.room.room_list_service import RoomListService
 from scams_backend.services.room.room_detail_service import RoomDetailService
 from scams_backend.services.room.room_schedule_service import RoomScheduleService
+from scams_backend.services.room.room_facet_service import RoomFacetService
+from scams_backend.services.room.room_slot_finder_service import (
+    RoomSlotFinderService,
+)
 from scams_backend.schemas.user.user_claims import UserClaims
 from scams_backend.schemas.room.room_schedule_schema import RoomScheduleResponse
+from scams_backend.schemas.room.room_slot_schema import RoomSlotListResponse
+from scams_backend.schemas.room.room_facet_schema import RoomFacetResponse
+from scams_backend.utils.responses import FastJSONResponse
 
 router = APIRouter(tags=["Rooms"], prefix="/rooms")
 
@@ -17,12 +24,15 @@ from typing import Optional, List
 import datetime
 
 
-@router.get("/", status_code=status.HTTP_200_OK, response_class=JSONResponse)
+@router.get("/", status_code=status.HTTP_200_OK, response_class=FastJSONResponse)
 async def list_rooms(
     request: Request,
     current_user: UserClaims = Depends(get_current_user),
     building_id: Optional[int] = Query(None, description="Filter by building ID"),
     device_ids: Optional[List[int]] = Query(None, description="List of device IDs"),
+    any_device_ids: Optional[List[int]] = Query(
+        None, description="Rooms must have at least one of these device IDs"
+    ),
     min_capacity: Optional[int] = Query(None, description="Minimum room capacity"),
     start_time: Optional[datetime.datetime] = Query(
         None, description="Start of time window (ISO format)"
@@ -30,24 +40,109 @@ async def list_rooms(
     end_time: Optional[datetime.datetime] = Query(
         None, description="End of time window (ISO format)"
     ),
+    min_free_hours: Optional[int] = Query(
+        None,
+        description="Instead of requiring the whole window to be free, require at "
+        "least this many consecutive free bookable hours within it",
+        ge=1,
+        le=23,
+    ),
     limit: Optional[int] = Query(100, description="Limit number of results"),
     offset: Optional[int] = Query(0, description="Offset for results"),
 ) -> RoomListResponse:
     room_list_service = RoomListService(
         building_id=building_id,
         device_ids=device_ids,
+        any_device_ids=any_device_ids,
         min_capacity=min_capacity,
         start_time=start_time,
         end_time=end_time,
+        min_free_hours=min_free_hours,
         limit=limit,
         offset=offset,
         db_session=request.state.db,
     )
     room_list = room_list_service.invoke()
-    return room_list
+    return FastJSONResponse(content=room_list)
+
+
+@router.get(
+    "/facets",
+    status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
+    summary="Count matching rooms per device",
+)
+async def get_room_facets(
+    request: Request,
+    current_user: UserClaims = Depends(get_current_user),
+    building_id: Optional[int] = Query(None, description="Filter by building ID"),
+    device_ids: Optional[List[int]] = Query(None, description="List of device IDs"),
+    any_device_ids: Optional[List[int]] = Query(
+        None, description="Rooms must have at least one of these device IDs"
+    ),
+    min_capacity: Optional[int] = Query(None, description="Minimum room capacity"),
+) -> RoomFacetResponse:
+    room_facet_service = RoomFacetService(
+        building_id=building_id,
+        device_ids=device_ids,
+        any_device_ids=any_device_ids,
+        min_capacity=min_capacity,
+        db_session=request.state.db,
+    )
+    room_facets = room_facet_service.invoke()
+    return FastJSONResponse(content=room_facets)
 
 
-@router.get("/{room_id}", status_code=status.HTTP_200_OK, response_class=JSONResponse)
+@router.get(
+    "/available-slots",
+    status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
+    summary="Find the earliest free slots",
+    description="Find the earliest free slots of the requested length across rooms "
+    "matching the filters, ordered by time then by closest capacity fit.",
+)
+async def find_available_slots(
+    request: Request,
+    current_user: UserClaims = Depends(get_current_user),
+    building_id: Optional[int] = Query(None, description="Filter by building ID"),
+    device_ids: Optional[List[int]] = Query(None, description="List of device IDs"),
+    min_capacity: Optional[int] = Query(None, description="Minimum room capacity"),
+    start_date: Optional[datetime.date] = Query(
+        None, description="First date to search (YYYY-MM-DD), None for today"
+    ),
+    end_date: Optional[datetime.date] = Query(
+        None, description="Last date to search (YYYY-MM-DD), None for a week ahead"
+    ),
+    duration_hours: int = Query(
+        1, description="Number of consecutive free hours", ge=1, le=23
+    ),
+    earliest_hour: Optional[int] = Query(
+        None, description="Earliest start hour of a slot", ge=0, le=23
+    ),
+    latest_hour: Optional[int] = Query(
+        None, description="Hour by which a slot must end", ge=1, le=23
+    ),
+    limit: int = Query(10, description="Number of slots to return", ge=1, le=100),
+) -> RoomSlotListResponse:
+    room_slot_finder_service = RoomSlotFinderService(
+        building_id=building_id,
+        device_ids=device_ids,
+        min_capacity=min_capacity,
+        start_date=start_date,
+        end_date=end_date,
+        duration_hours=duration_hours,
+        earliest_hour=earliest_hour,
+        latest_hour=latest_hour,
+        limit=limit,
+        db_session=request.state.db,
+    )
+    room_slots = room_slot_finder_service.invoke()
+    return FastJSONResponse(content=room_slots)
+
+
+@router.get(
+    "/{room_id}", status_code=status.HTTP_200_OK, response_class=FastJSONResponse
+)
 async def get_room_detail(
     request: Request,
     room_id: int,
@@ -56,16 +151,17 @@ async def get_room_detail(
     room_detail_service = RoomDetailService(
         room_id=room_id, db_session=request.state.db
     )
-    room_detail = room_detail_service.invoke()
-    return room_detail
+    return Response(
+        content=room_detail_service.invoke_json(), media_type="application/json"
+    )
 
 
 @router.get(
     "/{room_id}/schedule",
     status_code=status.HTTP_200_OK,
-    response_class=JSONResponse,
+    response_class=FastJSONResponse,
 )
-def get_room_schedule(
+async def get_room_schedule(
     room_id: int,
     request: Request,
     current_user=Depends(get_current_user),
@@ -77,4 +173,4 @@ def get_room_schedule(
         room_id=room_id, date=date, db_session=request.state.db
     )
     room_schedule = room_schedule_service.invoke()
-    return room_schedule
+    return FastJSONResponse(content=room_schedule)
@@ -1,15 +1,21 @@
-from fastapi import APIRouter, status, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, status, Depends, Header, Query
+from fastapi.responses import Response, StreamingResponse
+import pydantic_core
 from fastapi.requests import Request
 from scams_backend.dependencies.auth import get_current_user
-from typing import Optional
+from typing import Iterator, Optional
 import datetime
+from sqlalchemy.orm import Session
 from scams_backend.schemas.schedule.schedule_schema import (
+    CancelSchedulesRequest,
+    CancelSchedulesResponse,
     CreateScheduleRequest,
     CreateScheduleResponse,
+    LecturerFreeBusyResponse,
     ListSchedulesResponse,
     PersonalListSchedulesResponse,
 )
+from scams_backend.utils.responses import FastJSONResponse
 from scams_backend.schemas.user.user_claims import UserClaims
 from scams_backend.services.schedule.create_schedule_service import (
     CreateScheduleService,
@@ -20,6 +26,33 @@ from scams_backend.services.schedule.list_all_schedules_service import (
 from scams_backend.services.schedule.get_my_schedules_service import (
     GetMySchedulesService,
 )
+from scams_backend.services.schedule.export_schedules_service import (
+    MEDIA_TYPES,
+    ExportSchedulesService,
+)
+from scams_backend.services.schedule.cancel_schedule_service import (
+    CancelScheduleService,
+    CancelSchedulesInRangeService,
+)
+from scams_backend.services.schedule.lecturer_free_busy_service import (
+    LecturerFreeBusyService,
+)
+from scams_backend.services.user.exception import PermissionException
+from scams_backend.constants.export import ExportFormat
+from scams_backend.constants.schedule import CancellationScope
+from scams_backend.constants.user import UserRole
+from scams_backend.db.session import SessionLocal
+from scams_backend.db.deadline import (
+    DEADLINE_KEY,
+    run_in_threadpool_to_completion,
+    set_session_deadline,
+)
+from scams_backend.services.idempotency.idempotency_service import (
+    IdempotencyService,
+    StoredResponse,
+    idempotency_flights,
+    request_fingerprint,
+)
 
 router = APIRouter(tags=["Schedules"], prefix="/schedules")
 
@@ -27,25 +60,82 @@ router = APIRouter(tags=["Schedules"], prefix="/schedules")
 @router.post(
     "/",
     status_code=status.HTTP_201_CREATED,
+    response_class=FastJSONResponse,
     summary="Create a new schedule",
+    description="Send an Idempotency-Key header to make retries safe: a repeated "
+    "request with the same key gets the stored response instead of booking again.",
 )
 async def create_schedule(
     request: Request,
     schedule_data: CreateScheduleRequest,
     current_user: UserClaims = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        description="Client-generated key identifying this booking attempt",
+        min_length=1,
+        max_length=255,
+    ),
 ) -> CreateScheduleResponse:
-    create_schedule_service = CreateScheduleService(
-        create_schedule_request=schedule_data,
+    if idempotency_key is None:
+        create_schedule_service = CreateScheduleService(
+            create_schedule_request=schedule_data,
+            user_id=current_user.id,
+            db_session=request.state.db,
+        )
+        create_schedule_response: CreateScheduleResponse = (
+            create_schedule_service.invoke()
+        )
+        return FastJSONResponse(
+            content=create_schedule_response, status_code=status.HTTP_201_CREATED
+        )
+
+    fingerprint = request_fingerprint(request.url.path, schedule_data)
+    idempotency_service = IdempotencyService(
+        key=idempotency_key,
         user_id=current_user.id,
+        request_fingerprint=fingerprint,
         db_session=request.state.db,
     )
-    create_schedule_response: CreateScheduleResponse = create_schedule_service.invoke()
-    return create_schedule_response
+
+    def to_stored_response(response: CreateScheduleResponse) -> StoredResponse:
+        return StoredResponse(status.HTTP_201_CREATED, pydantic_core.to_json(response))
+
+    def create_schedule_once() -> StoredResponse:
+        # The response is stored under the key in the booking's own
+        # transaction, so a crash can never leave a booking without it.
+        create_schedule_service = CreateScheduleService(
+            create_schedule_request=schedule_data,
+            user_id=current_user.id,
+            db_session=request.state.db,
+            before_commit=lambda response: idempotency_service.record_response(
+                to_stored_response(response)
+            ),
+        )
+        return to_stored_response(create_schedule_service.invoke())
+
+    # Only identical requests are coalesced; a different body under the same
+    # key runs on its own and gets the fingerprint mismatch.
+    stored_response, shared = await idempotency_flights.run(
+        (current_user.id, idempotency_key, fingerprint),
+        lambda: run_in_threadpool_to_completion(
+            idempotency_service.invoke, create_schedule_once
+        ),
+    )
+    return Response(
+        content=stored_response.body,
+        status_code=stored_response.status_code,
+        media_type="application/json",
+        headers={
+            "Idempotent-Replayed": str(stored_response.replayed or shared).lower()
+        },
+    )
 
 
 @router.get(
     "/me",
     status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
     summary="Get my schedules",
     description="Fetch schedules for the current lecturer user. Sorted by latest created first.",
 )
@@ -62,12 +152,13 @@ async def get_my_schedules(
         db_session=request.state.db,
     )
     personal_schedules = get_my_schedules_service.invoke()
-    return personal_schedules
+    return FastJSONResponse(content=personal_schedules)
 
 
 @router.get(
     "/",
     status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
     summary="Get all schedules",
     description="Fetch all schedules with optional filters. If no date is provided, fetch today's schedules.",
 )
@@ -90,4 +181,139 @@ async def get_all_schedules(
         db_session=request.state.db,
     )
     schedules = list_all_schedules_service.invoke()
-    return schedules
+    return FastJSONResponse(content=schedules)
+
+
+@router.get(
+    "/lecturers/{lecturer_id}/free-busy",
+    status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
+    summary="Get a lecturer's free/busy times",
+    description="Hours the lecturer is booked in any room and the bookable hours "
+    "they are free, for every date from start_date to end_date.",
+)
+async def get_lecturer_free_busy(
+    request: Request,
+    lecturer_id: int,
+    current_user: UserClaims = Depends(get_current_user),
+    start_date: datetime.date = Query(..., description="First date"),
+    end_date: Optional[datetime.date] = Query(
+        None, description="Last date, start_date if not provided"
+    ),
+) -> LecturerFreeBusyResponse:
+    lecturer_free_busy_service = LecturerFreeBusyService(
+        lecturer_id=lecturer_id,
+        start_date=start_date,
+        end_date=end_date or start_date,
+        db_session=request.state.db,
+    )
+    return FastJSONResponse(content=lecturer_free_busy_service.invoke())
+
+
+def close_when_done(content: Iterator[bytes], db_session: Session) -> Iterator[bytes]:
+    try:
+        yield from content
+    finally:
+        db_session.close()
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    summary="Export schedules",
+    description="Stream every schedule between start_date and end_date as CSV or "
+    "Parquet, ordered by date, start time and room. Admins only.",
+)
+async def export_schedules(
+    request: Request,
+    current_user: UserClaims = Depends(get_current_user),
+    start_date: datetime.date = Query(..., description="First date to export"),
+    end_date: datetime.date = Query(..., description="Last date to export"),
+    file_format: ExportFormat = Query(
+        ExportFormat.CSV, alias="format", description="csv or parquet"
+    ),
+    room_id: Optional[int] = Query(None, description="Only export this room"),
+    building_id: Optional[int] = Query(
+        None, description="Only export rooms of this building"
+    ),
+) -> StreamingResponse:
+    if current_user.role != UserRole.ADMIN:
+        raise PermissionException("Only admins can export schedules.")
+
+    # The body streams after DBMiddleware has closed request.state.db, so the
+    # export runs on a session of its own.
+    db_session = SessionLocal()
+    deadline = getattr(request.state, DEADLINE_KEY, None)
+    if deadline is not None:
+        set_session_deadline(db_session, deadline)
+    try:
+        content = ExportSchedulesService(
+            start_date=start_date,
+            end_date=end_date,
+            room_id=room_id,
+            building_id=building_id,
+            file_format=file_format,
+            db_session=db_session,
+        ).invoke()
+    except Exception:
+        db_session.close()
+        raise
+
+    filename = f"schedules_{start_date}_{end_date}.{file_format.value}"
+    return StreamingResponse(
+        close_when_done(content, db_session),
+        media_type=MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.delete(
+    "/{schedule_id}",
+    status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
+    summary="Cancel a schedule",
+    description="Cancel one hourly slot, or with scope=booking every slot booked "
+    "together with it. Lecturers can cancel their own bookings, admins any.",
+)
+async def cancel_schedule(
+    request: Request,
+    schedule_id: int,
+    current_user: UserClaims = Depends(get_current_user),
+    scope: CancellationScope = Query(
+        CancellationScope.SLOT, description="slot or booking"
+    ),
+    reason: Optional[str] = Query(
+        None, max_length=255, description="Why the booking is cancelled"
+    ),
+) -> CancelSchedulesResponse:
+    cancel_schedule_service = CancelScheduleService(
+        schedule_id=schedule_id,
+        scope=scope,
+        user_id=current_user.id,
+        reason=reason,
+        db_session=request.state.db,
+    )
+    return FastJSONResponse(content=cancel_schedule_service.invoke())
+
+
+@router.post(
+    "/cancellations",
+    status_code=status.HTTP_200_OK,
+    response_class=FastJSONResponse,
+    summary="Cancel schedules in bulk",
+    description="Cancel every booking of a date range matching the filters, e.g. "
+    "a room or building under maintenance (admins) or a weekly series by weekday "
+    "and time of day (lecturers, own bookings only).",
+)
+async def cancel_schedules(
+    request: Request,
+    cancel_request: CancelSchedulesRequest,
+    current_user: UserClaims = Depends(get_current_user),
+) -> CancelSchedulesResponse:
+    cancel_schedules_service = CancelSchedulesInRangeService(
+        cancel_request=cancel_request,
+        user_id=current_user.id,
+        db_session=request.state.db,
+    )
+    return FastJSONResponse(content=cancel_schedules_service.invoke())
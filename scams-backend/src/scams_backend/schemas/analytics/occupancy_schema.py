@@ -0,0 +1,67 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+import datetime
+
+
+class BuildingOccupancy(BaseModel):
+    building_id: int = Field(..., description="The unique identifier of the building")
+    building_name: str = Field(..., description="The name of the building")
+    room_count: int = Field(..., description="The number of rooms in the building")
+    booked_hours: int = Field(
+        ..., description="Booked room-hours within the bookable hours of the range"
+    )
+    utilization: float = Field(
+        ..., description="Booked room-hours as a percentage of bookable room-hours"
+    )
+    peak_weekday: Optional[int] = Field(
+        None, description="The busiest weekday (0 = Monday), None without bookings"
+    )
+    peak_hour: Optional[int] = Field(
+        None, description="The busiest hour of the day, None without bookings"
+    )
+    heatmap: list[list[float]] = Field(
+        ...,
+        description="Occupancy percentage per weekday (rows, Monday first) and hour "
+        "(columns, 0-23)",
+    )
+    daily_heatmap: list[list[float]] = Field(
+        ...,
+        description="Occupancy percentage per date (rows, start_date first) and hour "
+        "(columns, 0-23)",
+    )
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RoomUtilization(BaseModel):
+    room_id: int = Field(..., description="The unique identifier of the room")
+    room_name: str = Field(..., description="The name of the room")
+    building_id: int = Field(..., description="The unique identifier of the building")
+    booked_hours: int = Field(
+        ..., description="Booked hours within the bookable hours of the range"
+    )
+    utilization: float = Field(
+        ..., description="Booked hours as a percentage of bookable hours"
+    )
+    model_config = ConfigDict(from_attributes=True)
+
+
+class OccupancyAnalyticsResponse(BaseModel):
+    start_date: datetime.date = Field(..., description="First date of the range")
+    end_date: datetime.date = Field(..., description="Last date of the range")
+    building_id: Optional[int] = Field(None, description="The building filter, if any")
+    bookable_hours_per_day: int = Field(
+        ..., description="Bookable hours per room and day used for utilization"
+    )
+    hourly_bookings: list[int] = Field(
+        ..., description="Booked room-hours per hour of the day (0-23)"
+    )
+    peak_hour: Optional[int] = Field(
+        None, description="The busiest hour of the day, None without bookings"
+    )
+    buildings: list[BuildingOccupancy] = Field(
+        ..., description="Occupancy heatmaps and utilization per building"
+    )
+    rooms: list[RoomUtilization] = Field(
+        ..., description="Utilization per room, highest first"
+    )
+    model_config = ConfigDict(from_attributes=True)
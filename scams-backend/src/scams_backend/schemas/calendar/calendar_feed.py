@@ -0,0 +1,8 @@
+from pydantic import BaseModel, Field
+
+
+class CalendarFeedLinkResponse(BaseModel):
+    url: str = Field(
+        ..., description="The iCalendar feed URL to subscribe to, token included"
+    )
+    token: str = Field(..., description="The access token of the feed")
@@ -0,0 +1,21 @@
+import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class DependencyCheck(BaseModel):
+    ok: bool = Field(..., description="Whether the dependency check passed")
+    detail: Optional[str] = Field(
+        None, description="Why the check failed or was skipped"
+    )
+    duration_ms: float = Field(..., description="How long the check took")
+
+
+class ReadinessResponse(BaseModel):
+    status: str = Field(..., description="Either 'ready' or 'not_ready'")
+    checked_at: Optional[datetime.datetime] = Field(
+        None, description="When the dependency checks last ran"
+    )
+    checks: dict[str, DependencyCheck] = Field(
+        default_factory=dict, description="Result of each dependency check"
+    )
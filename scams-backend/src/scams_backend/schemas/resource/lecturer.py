@@ -12,3 +12,12 @@ class LecturerListResponse(BaseModel):
     lecturers: list[LecturerDetail] = Field(..., description="List of lecturers")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class LecturerSearchResponse(BaseModel):
+    total: int = Field(..., description="The number of lecturers matching the query")
+    lecturers: list[LecturerDetail] = Field(
+        ..., description="The requested page of matching lecturers"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class DeviceFacet(BaseModel):
+    device_id: int = Field(..., description="The unique identifier of the device")
+    device_name: str = Field(..., description="The name of the device")
+    room_count: int = Field(
+        ..., description="The number of matching rooms equipped with the device"
+    )
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RoomFacetResponse(BaseModel):
+    total_rooms: int = Field(..., description="The number of matching rooms")
+    devices: list[DeviceFacet] = Field(
+        ..., description="Per-device room counts among the matching rooms"
+    )
+    model_config = ConfigDict(from_attributes=True)
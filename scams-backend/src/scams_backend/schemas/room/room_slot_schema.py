@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field, ConfigDict
+import datetime
+
+
+class RoomSlot(BaseModel):
+    room_id: int = Field(..., description="The unique identifier of the room")
+    room_name: str = Field(..., description="The name of the room")
+    building_id: int = Field(..., description="The unique identifier of the building")
+    building_name: str = Field(..., description="The building name of the room")
+    capacity: int = Field(..., description="The capacity of the room")
+    date: datetime.date = Field(..., description="The date of the free slot")
+    start_time: datetime.time = Field(
+        ..., description="The start time of the free slot"
+    )
+    end_time: datetime.time = Field(..., description="The end time of the free slot")
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RoomSlotListResponse(BaseModel):
+    slots: list[RoomSlot] = Field(
+        ..., description="The earliest free slots, ordered by time then capacity fit"
+    )
+    model_config = ConfigDict(from_attributes=True)
@@ -71,3 +71,72 @@ class PersonalListSchedulesResponse(BaseModel):
     )
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class CancelSchedulesRequest(BaseModel):
+    start_date: datetime.date = Field(..., description="First date to cancel")
+    end_date: datetime.date = Field(..., description="Last date to cancel")
+    room_id: Optional[int] = Field(
+        None, description="Only cancel bookings of this room"
+    )
+    building_id: Optional[int] = Field(
+        None, description="Only cancel bookings of rooms in this building"
+    )
+    lecturer_id: Optional[int] = Field(
+        None,
+        description="Only cancel bookings of this lecturer; lecturers can only "
+        "cancel their own",
+    )
+    weekdays: Optional[list[int]] = Field(
+        None,
+        description="Only cancel bookings on these ISO weekdays (1 = Monday, "
+        "7 = Sunday), e.g. to cancel a weekly series",
+    )
+    start_time: Optional[datetime.time] = Field(
+        None, description="Only cancel slots starting at or after this time"
+    )
+    end_time: Optional[datetime.time] = Field(
+        None, description="Only cancel slots starting before this time"
+    )
+    reason: Optional[str] = Field(
+        None, max_length=255, description="Why the bookings are cancelled"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CancelSchedulesResponse(BaseModel):
+    cancellation_id: str = Field(
+        ..., description="Identifies the audit rows of this cancellation"
+    )
+    cancelled_count: int = Field(..., description="The number of cancelled slots")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TimeInterval(BaseModel):
+    start_time: datetime.time = Field(..., description="The start of the interval")
+    end_time: datetime.time = Field(..., description="The end of the interval")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LecturerDayFreeBusy(BaseModel):
+    date: datetime.date = Field(..., description="The date")
+    busy: list[TimeInterval] = Field(
+        ..., description="The intervals the lecturer is booked in any room"
+    )
+    free: list[TimeInterval] = Field(
+        ..., description="The bookable intervals the lecturer has no booking in"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class LecturerFreeBusyResponse(BaseModel):
+    lecturer_id: int = Field(..., description="The unique identifier of the lecturer")
+    days: list[LecturerDayFreeBusy] = Field(
+        ..., description="Busy and free intervals for every date of the range"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
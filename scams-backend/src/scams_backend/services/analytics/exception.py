@@ -0,0 +1,6 @@
+from fastapi import HTTPException
+
+
+class InvalidAnalyticsRangeException(HTTPException):
+    def __init__(self, message: str = "Invalid analytics date range."):
+        super().__init__(status_code=400, detail=message)
@@ -0,0 +1,271 @@
+import datetime
+from typing import Optional
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from scams_backend.cache.catalog import CatalogSnapshot, catalog_cache
+from scams_backend.cache.shared_cache import (
+    SharedCache,
+    cache_backend,
+    invalidation_bus,
+)
+from scams_backend.constants.cache import InvalidationTopic
+from scams_backend.core.config import settings
+from scams_backend.models.room import Room
+from scams_backend.models.room_day_occupancy import RoomDayOccupancy
+from scams_backend.schemas.analytics.occupancy_schema import (
+    BuildingOccupancy,
+    OccupancyAnalyticsResponse,
+    RoomUtilization,
+)
+from scams_backend.services.analytics.exception import InvalidAnalyticsRangeException
+from scams_backend.utils.slot_mask import HOURS_PER_DAY
+
+DAYS_PER_WEEK = 7
+# Part of the cache key; bump it when the cached response format changes.
+RESPONSE_VERSION = 2
+
+# Only ranges that ended before today are cached; the cache is still dropped
+# whenever schedules or rooms change.
+occupancy_cache = SharedCache(
+    namespace="occupancy_analytics",
+    ttl_seconds=settings.ANALYTICS_CACHE_TTL_SECONDS,
+    backend=cache_backend,
+    invalidation_bus=invalidation_bus,
+    topics=(InvalidationTopic.SCHEDULES, InvalidationTopic.CATALOG),
+)
+
+
+class OccupancyAnalyticsService:
+    def __init__(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        building_id: Optional[int],
+        db_session: Session,
+    ):
+        self.start_date: datetime.date = start_date
+        self.end_date: datetime.date = end_date
+        self.building_id: Optional[int] = building_id
+        self.db_session: Session = db_session
+        self.catalog: Optional[CatalogSnapshot] = None
+        self.bookable_hours_per_day: int = (
+            settings.BOOKING_DAY_END_HOUR - settings.BOOKING_DAY_START_HOUR
+        )
+        self.day_count: int = (end_date - start_date).days + 1
+        self.daily_slots: np.ndarray = np.zeros(0)
+        self.room_hours: dict[int, int] = {}
+
+    def validate_request(self) -> None:
+        if self.end_date < self.start_date:
+            raise InvalidAnalyticsRangeException(
+                "end_date must not be before start_date."
+            )
+        if self.day_count > settings.ANALYTICS_MAX_DAYS:
+            raise InvalidAnalyticsRangeException(
+                f"Date range cannot exceed {settings.ANALYTICS_MAX_DAYS} days."
+            )
+
+    def is_cacheable(self) -> bool:
+        return self.end_date < datetime.date.today()
+
+    def fetch_slots(self) -> None:
+        stmt = (
+            select(
+                RoomDayOccupancy.room_id,
+                Room.building_id,
+                RoomDayOccupancy.date,
+                RoomDayOccupancy.booked_mask,
+            )
+            .join(Room, RoomDayOccupancy.room_id == Room.id)
+            .where(
+                RoomDayOccupancy.date >= self.start_date,
+                RoomDayOccupancy.date <= self.end_date,
+            )
+        )
+        if self.building_id is not None:
+            stmt = stmt.where(Room.building_id == self.building_id)
+        rows = self.db_session.execute(stmt).all()
+
+        building_index = self.building_index()
+        self.daily_slots = np.zeros(
+            (len(building_index), self.day_count, HOURS_PER_DAY), dtype=np.int64
+        )
+        self.room_hours = {}
+        rows = [row for row in rows if row[1] in building_index]
+        if not rows:
+            return
+
+        # One row per room-day; its mask is expanded into the 24 hour slots.
+        room_ids, building_ids, dates, masks = zip(*rows)
+        days = (
+            np.array(dates, dtype="datetime64[D]") - np.datetime64(self.start_date, "D")
+        ).astype(np.int64)
+        booked = (
+            np.array(masks, dtype=np.int64)[:, None] >> np.arange(HOURS_PER_DAY)
+        ) & 1
+        np.add.at(
+            self.daily_slots,
+            (
+                np.fromiter(
+                    (building_index[building_id] for building_id in building_ids),
+                    dtype=np.int64,
+                    count=len(building_ids),
+                )[:, None],
+                days[:, None],
+                np.arange(HOURS_PER_DAY)[None, :],
+            ),
+            booked,
+        )
+
+        # Utilization only counts hours that could have been booked.
+        unique_room_ids, room_rows = np.unique(
+            np.array(room_ids, dtype=np.int64), return_inverse=True
+        )
+        room_hours = np.bincount(
+            room_rows, weights=booked[:, self.bookable_hours()].sum(axis=1)
+        )
+        self.room_hours = {
+            int(room_id): int(hours)
+            for room_id, hours in zip(unique_room_ids, room_hours)
+        }
+
+    def bookable_hours(self) -> slice:
+        return slice(settings.BOOKING_DAY_START_HOUR, settings.BOOKING_DAY_END_HOUR)
+
+    def building_index(self) -> dict[int, int]:
+        return {building.id: index for index, building in enumerate(self.buildings())}
+
+    def buildings(self) -> list:
+        return [
+            building
+            for building in self.catalog.buildings.buildings
+            if self.building_id is None or building.id == self.building_id
+        ]
+
+    def build_response(self) -> OccupancyAnalyticsResponse:
+        buildings = self.buildings()
+        building_index = self.building_index()
+        rooms = [
+            room for room in self.catalog.rooms if room.building_id in building_index
+        ]
+        room_counts = np.bincount(
+            np.fromiter(
+                (building_index[room.building_id] for room in rooms),
+                dtype=np.int64,
+                count=len(rooms),
+            ),
+            minlength=len(buildings),
+        )
+        day_weekdays = weekday_of(
+            np.arange(
+                np.datetime64(self.start_date, "D"),
+                np.datetime64(self.end_date, "D") + 1,
+            )
+        )
+        weekday_counts = np.bincount(day_weekdays, minlength=DAYS_PER_WEEK)
+        weekday_slots = np.stack(
+            [
+                self.daily_slots[:, day_weekdays == weekday].sum(axis=1)
+                for weekday in range(DAYS_PER_WEEK)
+            ],
+            axis=1,
+        )
+
+        # Slots available per building, weekday and hour: rooms x occurrences
+        # of that weekday in the range.
+        available = room_counts[:, None, None] * weekday_counts[None, :, None]
+        heatmaps = np.divide(
+            weekday_slots * 100.0,
+            available,
+            out=np.zeros(weekday_slots.shape),
+            where=available > 0,
+        )
+        daily_heatmaps = np.divide(
+            self.daily_slots * 100.0,
+            room_counts[:, None, None],
+            out=np.zeros(self.daily_slots.shape),
+            where=room_counts[:, None, None] > 0,
+        )
+        # Bookings outside the bookable hours (e.g. after the window changed)
+        # would push utilization past 100%, so they are left out.
+        booked_hours = self.daily_slots[:, :, self.bookable_hours()].sum(axis=(1, 2))
+        bookable_hours = room_counts * self.day_count * self.bookable_hours_per_day
+        utilization = np.divide(
+            booked_hours * 100.0,
+            bookable_hours,
+            out=np.zeros(len(buildings)),
+            where=bookable_hours > 0,
+        )
+        hourly_bookings = weekday_slots.sum(axis=(0, 1))
+
+        building_occupancy = []
+        for index, building in enumerate(buildings):
+            peak_weekday, peak_hour = None, None
+            if booked_hours[index]:
+                peak_weekday, peak_hour = np.unravel_index(
+                    int(weekday_slots[index].argmax()),
+                    (DAYS_PER_WEEK, HOURS_PER_DAY),
+                )
+            building_occupancy.append(
+                BuildingOccupancy(
+                    building_id=building.id,
+                    building_name=building.name,
+                    room_count=int(room_counts[index]),
+                    booked_hours=int(booked_hours[index]),
+                    utilization=round(float(utilization[index]), 2),
+                    peak_weekday=None if peak_weekday is None else int(peak_weekday),
+                    peak_hour=None if peak_hour is None else int(peak_hour),
+                    heatmap=np.round(heatmaps[index], 2).tolist(),
+                    daily_heatmap=np.round(daily_heatmaps[index], 2).tolist(),
+                )
+            )
+
+        room_bookable_hours = self.day_count * self.bookable_hours_per_day
+        room_utilization = [
+            RoomUtilization(
+                room_id=room.id,
+                room_name=room.name,
+                building_id=room.building_id,
+                booked_hours=self.room_hours.get(room.id, 0),
+                utilization=round(
+                    self.room_hours.get(room.id, 0) * 100.0 / room_bookable_hours, 2
+                ),
+            )
+            for room in rooms
+        ]
+        room_utilization.sort(key=lambda room: (-room.booked_hours, room.room_id))
+
+        return OccupancyAnalyticsResponse(
+            start_date=self.start_date,
+            end_date=self.end_date,
+            building_id=self.building_id,
+            bookable_hours_per_day=self.bookable_hours_per_day,
+            hourly_bookings=hourly_bookings.tolist(),
+            peak_hour=int(hourly_bookings.argmax()) if hourly_bookings.any() else None,
+            buildings=building_occupancy,
+            rooms=room_utilization,
+        )
+
+    def invoke(self) -> OccupancyAnalyticsResponse:
+        self.validate_request()
+        self.catalog = catalog_cache.get(self.db_session)
+        if not self.is_cacheable():
+            return self.compute_response()
+
+        cache_key = (
+            f"v{RESPONSE_VERSION}:{self.start_date}:{self.end_date}:{self.building_id}"
+        )
+        cached_response = occupancy_cache.get_or_load(
+            cache_key, lambda: self.compute_response().model_dump_json().encode()
+        )
+        return OccupancyAnalyticsResponse.model_validate_json(cached_response)
+
+    def compute_response(self) -> OccupancyAnalyticsResponse:
+        self.fetch_slots()
+        return self.build_response()
+
+
+def weekday_of(dates: np.ndarray) -> np.ndarray:
+    # 1970-01-01 was a Thursday (weekday 3 with Monday = 0).
+    return (dates.astype(np.int64) + 3) % DAYS_PER_WEEK
@@ -0,0 +1,231 @@
+import datetime
+from typing import Iterator, Optional
+from zoneinfo import ZoneInfo
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from scams_backend.cache.calendar_feed import calendar_feed_cache
+from scams_backend.cache.catalog import CatalogSnapshot, catalog_cache
+from scams_backend.cache.lecturer_directory import (
+    LecturerDirectory,
+    lecturer_directory_cache,
+)
+from scams_backend.constants.calendar import CalendarFeedKind
+from scams_backend.core.config import settings
+from scams_backend.models.schedule import Schedule
+from scams_backend.services.calendar.exception import CalendarFeedNotFoundException
+from scams_backend.utils.encrypt import decrypt_batch
+from scams_backend.utils.feed_token import create_feed_token, verify_feed_token
+from scams_backend.utils.http_cache import EncodedBody
+from scams_backend.utils.ical import (
+    escape_text,
+    fold_line,
+    format_utc,
+    render_component,
+)
+
+SLOT_LENGTH = datetime.timedelta(hours=1)
+FEED_BATCH_SIZE = 1000
+
+
+class CalendarEvent:
+    """One booking: consecutive hourly slots with the same details."""
+
+    __slots__ = (
+        "schedule_id",
+        "room_id",
+        "lecturer_id",
+        "purpose",
+        "team_members",
+        "created_at",
+        "start",
+        "end",
+    )
+
+    def __init__(
+        self,
+        schedule_id: int,
+        room_id: int,
+        lecturer_id: int,
+        purpose: str,
+        team_members: str,
+        created_at: datetime.datetime,
+        start: datetime.datetime,
+    ):
+        self.schedule_id: int = schedule_id
+        self.room_id: int = room_id
+        self.lecturer_id: int = lecturer_id
+        self.purpose: str = purpose
+        self.team_members: str = team_members
+        self.created_at: datetime.datetime = created_at
+        self.start: datetime.datetime = start
+        self.end: datetime.datetime = start + SLOT_LENGTH
+
+    def extend(self, other: "CalendarEvent") -> bool:
+        """Absorbs ``other`` if it is the next slot of the same booking."""
+        if (
+            other.start != self.end
+            or other.room_id != self.room_id
+            or other.lecturer_id != self.lecturer_id
+            or other.created_at != self.created_at
+            or other.purpose != self.purpose
+            or other.team_members != self.team_members
+        ):
+            return False
+        self.end = other.end
+        return True
+
+
+class CalendarFeedService:
+    """Renders the iCalendar feed of a lecturer's or a room's bookings.
+
+    Slots are read in batches from CALENDAR_FEED_PAST_DAYS ago onwards and
+    turned into events as they arrive. The rendered body is cached until one
+    of the feed's bookings changes (see cache/calendar_feed.py), so polling
+    clients mostly get a stored body or a 304.
+    """
+
+    def __init__(
+        self,
+        kind: CalendarFeedKind,
+        subject_id: int,
+        token: str,
+        db_session: Session,
+    ):
+        self.kind: CalendarFeedKind = kind
+        self.subject_id: int = subject_id
+        self.token: str = token
+        self.db_session: Session = db_session
+        self.timezone: ZoneInfo = ZoneInfo(settings.CALENDAR_TIMEZONE)
+        self.catalog: Optional[CatalogSnapshot] = None
+        self.lecturer_directory: Optional[LecturerDirectory] = None
+
+    def verify_feed(self) -> None:
+        if not verify_feed_token(self.kind.value, self.subject_id, self.token):
+            raise CalendarFeedNotFoundException()
+        self.catalog = catalog_cache.get(self.db_session)
+        self.lecturer_directory = lecturer_directory_cache.get(self.db_session)
+        if self.feed_name() is None:
+            raise CalendarFeedNotFoundException()
+
+    def feed_name(self) -> Optional[str]:
+        if self.kind == CalendarFeedKind.LECTURER:
+            return self.lecturer_directory.get_name(self.subject_id)
+        room = self.catalog.get_room(self.subject_id)
+        return None if room is None else f"{room.name}, {room.building_name}"
+
+    def build_statement(self):
+        since = datetime.date.today() - datetime.timedelta(
+            days=settings.CALENDAR_FEED_PAST_DAYS
+        )
+        stmt = (
+            select(
+                Schedule.id,
+                Schedule.date,
+                Schedule.start_time,
+                Schedule.room_id,
+                Schedule.lecturer_id,
+                Schedule.purpose,
+                Schedule.team_members,
+                Schedule.created_at,
+            )
+            .where(Schedule.date >= since)
+            .order_by(Schedule.date, Schedule.room_id, Schedule.start_time)
+        )
+        if self.kind == CalendarFeedKind.LECTURER:
+            return stmt.where(Schedule.lecturer_id == self.subject_id)
+        return stmt.where(Schedule.room_id == self.subject_id)
+
+    def iter_slots(self) -> Iterator[CalendarEvent]:
+        connection = self.db_session.connection().execution_options(
+            yield_per=FEED_BATCH_SIZE
+        )
+        result = connection.execute(self.build_statement())
+        for rows in result.partitions():
+            purposes = decrypt_batch([row.purpose for row in rows])
+            team_members = decrypt_batch([row.team_members or "" for row in rows])
+            for row, purpose, members in zip(rows, purposes, team_members):
+                yield CalendarEvent(
+                    schedule_id=row.id,
+                    room_id=row.room_id,
+                    lecturer_id=row.lecturer_id,
+                    purpose=purpose,
+                    team_members=members,
+                    created_at=row.created_at,
+                    start=datetime.datetime.combine(row.date, row.start_time),
+                )
+
+    def iter_events(self) -> Iterator[CalendarEvent]:
+        event: Optional[CalendarEvent] = None
+        for slot in self.iter_slots():
+            if event is not None and event.extend(slot):
+                continue
+            if event is not None:
+                yield event
+            event = slot
+        if event is not None:
+            yield event
+
+    def to_utc(self, value: datetime.datetime) -> str:
+        return format_utc(value.replace(tzinfo=self.timezone))
+
+    def render_event(self, event: CalendarEvent) -> str:
+        room = self.catalog.get_room(event.room_id)
+        description = []
+        if self.kind == CalendarFeedKind.ROOM:
+            lecturer_name = self.lecturer_directory.get_name(event.lecturer_id)
+            description.append(f"Lecturer: {lecturer_name or 'Unknown'}")
+        if event.team_members:
+            description.append(f"Team members: {event.team_members}")
+        properties = [
+            ("UID", f"schedule-{event.schedule_id}@scams"),
+            # created_at is the database's CURRENT_TIMESTAMP, kept in UTC.
+            (
+                "DTSTAMP",
+                format_utc(event.created_at.replace(tzinfo=datetime.timezone.utc)),
+            ),
+            ("DTSTART", self.to_utc(event.start)),
+            ("DTEND", self.to_utc(event.end)),
+            ("SUMMARY", escape_text(event.purpose)),
+        ]
+        if room is not None:
+            properties.append(
+                ("LOCATION", escape_text(f"{room.name}, {room.building_name}"))
+            )
+        if description:
+            properties.append(("DESCRIPTION", escape_text("\n".join(description))))
+        return render_component("VEVENT", properties)
+
+    def render(self) -> bytes:
+        parts = [
+            "BEGIN:VCALENDAR\r\n",
+            "VERSION:2.0\r\n",
+            "PRODID:-//SCAMS//Room bookings//EN\r\n",
+            "CALSCALE:GREGORIAN\r\n",
+            "METHOD:PUBLISH\r\n",
+            fold_line(f"X-WR-CALNAME:{escape_text(self.feed_name())}"),
+            fold_line(f"X-WR-TIMEZONE:{settings.CALENDAR_TIMEZONE}"),
+        ]
+        parts.extend(self.render_event(event) for event in self.iter_events())
+        parts.append("END:VCALENDAR\r\n")
+        return "".join(parts).encode()
+
+    def invoke(self) -> EncodedBody:
+        self.verify_feed()
+        return calendar_feed_cache.get_or_render(
+            self.kind.value, self.subject_id, self.render
+        )
+
+
+class CalendarFeedLinkService:
+    def __init__(self, kind: CalendarFeedKind, subject_id: int, db_session: Session):
+        self.kind: CalendarFeedKind = kind
+        self.subject_id: int = subject_id
+        self.db_session: Session = db_session
+
+    def invoke(self) -> str:
+        if (
+            self.kind == CalendarFeedKind.ROOM
+            and catalog_cache.get(self.db_session).get_room(self.subject_id) is None
+        ):
+            raise CalendarFeedNotFoundException()
+        return create_feed_token(self.kind.value, self.subject_id)
@@ -0,0 +1,8 @@
+from fastapi import HTTPException
+
+
+class CalendarFeedNotFoundException(HTTPException):
+    def __init__(self):
+        # Unknown feeds and wrong tokens look the same, so feed ids cannot be
+        # probed.
+        super().__init__(status_code=404, detail="Calendar feed not found.")
@@ -0,0 +1,155 @@
+import asyncio
+import base64
+import datetime
+import logging
+import os
+import time
+from typing import Optional
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from scams_backend.core.config import settings
+from scams_backend.db.session import SessionLocal
+from scams_backend.schemas.health.readiness_schema import (
+    DependencyCheck,
+    ReadinessResponse,
+)
+from scams_backend.utils.encrypt import decrypt_data, encrypt_data
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessService:
+    """Runs the readiness checks in the background and caches the outcome.
+
+    Probes only read ``report``, so they never touch the database themselves.
+    A report older than ``max_age_seconds`` counts as not ready, which also
+    covers checks that hang, e.g. while waiting on an exhausted pool.
+    """
+
+    def __init__(self, interval_seconds: float, max_age_seconds: float):
+        self.interval_seconds: float = interval_seconds
+        self.max_age_seconds: float = max_age_seconds
+        self.report: Optional[ReadinessResponse] = None
+        self.reported_at: float = 0.0
+        self.expected_head: Optional[str] = None
+        self.expected_head_error: Optional[str] = None
+
+    def load_expected_head(self) -> None:
+        if not os.path.exists(settings.ALEMBIC_CONFIG_PATH):
+            self.expected_head_error = (
+                f"{settings.ALEMBIC_CONFIG_PATH} not found, migration head unknown."
+            )
+            return
+        try:
+            script = ScriptDirectory.from_config(Config(settings.ALEMBIC_CONFIG_PATH))
+            self.expected_head = script.get_current_head()
+        except Exception:
+            logger.exception("Could not read the migration head.")
+            self.expected_head_error = "Migration head could not be read."
+
+    def check_database_and_migrations(self) -> tuple[DependencyCheck, DependencyCheck]:
+        started = time.perf_counter()
+        try:
+            with SessionLocal() as db_session:
+                db_session.execute(text("SELECT 1"))
+                database_check = passed(started)
+                migration_check = self.check_migrations(db_session)
+        except SQLAlchemyError:
+            # The error names the host and port; keep it out of the probe.
+            logger.exception("Readiness database check failed.")
+            database_check = failed(started, "Database unavailable.")
+            migration_check = failed(started, "Database unavailable.")
+        return database_check, migration_check
+
+    def check_migrations(self, db_session: Session) -> DependencyCheck:
+        started = time.perf_counter()
+        if self.expected_head is None:
+            return failed(
+                started, self.expected_head_error or "Migration head unknown."
+            )
+        try:
+            current = db_session.execute(
+                text("SELECT version_num FROM alembic_version")
+            ).scalar()
+        except SQLAlchemyError:
+            return failed(started, "alembic_version table is missing.")
+        if current != self.expected_head:
+            return failed(
+                started,
+                f"Database is at revision {current}, expected {self.expected_head}.",
+            )
+        return passed(started)
+
+    def check_aes_key(self) -> DependencyCheck:
+        started = time.perf_counter()
+        try:
+            key = base64.urlsafe_b64decode(settings.AES_KEY)
+            if len(key) not in (16, 24, 32):
+                return failed(started, "AES_KEY must decode to 16, 24 or 32 bytes.")
+            if decrypt_data(encrypt_data("readiness")) != "readiness":
+                return failed(started, "AES_KEY round trip failed.")
+        except ValueError:
+            return failed(started, "AES_KEY is not valid base64.")
+        return passed(started)
+
+    def run_checks(self) -> ReadinessResponse:
+        database_check, migration_check = self.check_database_and_migrations()
+        checks = {
+            "database": database_check,
+            "migrations": migration_check,
+            "aes_key": self.check_aes_key(),
+        }
+        return ReadinessResponse(
+            status=(
+                "ready" if all(check.ok for check in checks.values()) else "not_ready"
+            ),
+            checked_at=datetime.datetime.now(datetime.timezone.utc),
+            checks=checks,
+        )
+
+    def refresh(self) -> ReadinessResponse:
+        if self.expected_head is None:
+            # Retried every round, e.g. until a deployment adds alembic.ini.
+            self.load_expected_head()
+        report = self.run_checks()
+        self.report = report
+        self.reported_at = time.monotonic()
+        return report
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception:
+                # The report goes stale and the probe reports not ready.
+                logger.exception("Readiness checks failed.")
+            await asyncio.sleep(self.interval_seconds)
+
+    def invoke(self) -> ReadinessResponse:
+        report = self.report
+        if report is None:
+            return ReadinessResponse(status="not_ready")
+        if time.monotonic() - self.reported_at > self.max_age_seconds:
+            return report.model_copy(update={"status": "not_ready"})
+        return report
+
+
+def elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def passed(started: float) -> DependencyCheck:
+    return DependencyCheck(ok=True, duration_ms=elapsed_ms(started))
+
+
+def failed(started: float, detail: str) -> DependencyCheck:
+    return DependencyCheck(ok=False, detail=detail, duration_ms=elapsed_ms(started))
+
+
+readiness_service = ReadinessService(
+    interval_seconds=settings.HEALTH_CHECK_INTERVAL_SECONDS,
+    max_age_seconds=settings.HEALTH_CHECK_MAX_AGE_SECONDS,
+)
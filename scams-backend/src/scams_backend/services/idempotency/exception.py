@@ -0,0 +1,18 @@
+from fastapi import HTTPException
+
+
+class IdempotencyKeyMismatchException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=422,
+            detail="Idempotency-Key was already used with a different request.",
+        )
+
+
+class IdempotencyKeyInProgressException(HTTPException):
+    def __init__(self, retry_after: int = 1):
+        super().__init__(
+            status_code=409,
+            detail="A request with this Idempotency-Key is still in progress.",
+            headers={"Retry-After": str(retry_after)},
+        )
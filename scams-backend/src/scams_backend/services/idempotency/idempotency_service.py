@@ -0,0 +1,162 @@
+import datetime
+import hashlib
+import json
+from typing import Callable, NamedTuple, Optional
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from scams_backend.core.config import settings
+from scams_backend.models.idempotency_key import IdempotencyKey
+from scams_backend.services.idempotency.exception import (
+    IdempotencyKeyInProgressException,
+    IdempotencyKeyMismatchException,
+)
+from scams_backend.utils.single_flight import SingleFlight
+
+
+class StoredResponse(NamedTuple):
+    status_code: int
+    body: bytes
+    replayed: bool = False
+
+
+# Duplicates arriving at this worker while the first request is running wait
+# for its outcome; duplicates on other workers see the in-progress row.
+idempotency_flights: SingleFlight[StoredResponse] = SingleFlight()
+
+
+def request_fingerprint(path: str, body: BaseModel) -> str:
+    return hashlib.sha256(f"{path}\n{body.model_dump_json()}".encode()).hexdigest()
+
+
+class IdempotencyService:
+    def __init__(
+        self,
+        key: str,
+        user_id: int,
+        request_fingerprint: str,
+        db_session: Session,
+    ):
+        self.key: str = key
+        self.user_id: int = user_id
+        self.request_fingerprint: str = request_fingerprint
+        self.db_session: Session = db_session
+        self.record: Optional[IdempotencyKey] = None
+        self.response_recorded: bool = False
+
+    def find_record(self) -> Optional[IdempotencyKey]:
+        return (
+            self.db_session.query(IdempotencyKey)
+            .filter_by(user_id=self.user_id, key=self.key)
+            .first()
+        )
+
+    def reserve(self) -> Optional[StoredResponse]:
+        """Claim the key, or return the response stored by its first use."""
+        now = datetime.datetime.now()
+        self.db_session.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == self.user_id,
+                IdempotencyKey.key == self.key,
+                IdempotencyKey.expires_at < now,
+            )
+        )
+        record = IdempotencyKey(
+            user_id=self.user_id,
+            key=self.key,
+            request_fingerprint=self.request_fingerprint,
+            locked_at=now,
+            expires_at=now
+            + datetime.timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS),
+        )
+        self.db_session.add(record)
+        try:
+            self.db_session.commit()
+            self.record = record
+            return None
+        except IntegrityError:
+            self.db_session.rollback()
+
+        existing = self.find_record()
+        if existing is None:
+            raise IdempotencyKeyInProgressException()
+        if existing.request_fingerprint != self.request_fingerprint:
+            raise IdempotencyKeyMismatchException()
+        if existing.status_code is not None:
+            return StoredResponse(
+                existing.status_code,
+                existing.response_body.encode("utf-8"),
+                replayed=True,
+            )
+
+        # The worker holding the key died without finishing; take it over.
+        lock_timeout = datetime.timedelta(
+            seconds=settings.IDEMPOTENCY_LOCK_TIMEOUT_SECONDS
+        )
+        if existing.locked_at < now - lock_timeout:
+            result = self.db_session.execute(
+                update(IdempotencyKey)
+                .where(
+                    IdempotencyKey.id == existing.id,
+                    IdempotencyKey.locked_at == existing.locked_at,
+                )
+                .values(locked_at=now)
+            )
+            self.db_session.commit()
+            if result.rowcount == 1:
+                self.record = existing
+                return None
+        raise IdempotencyKeyInProgressException()
+
+    def record_response(self, stored_response: StoredResponse) -> None:
+        """Stage the response in the handler's transaction without committing.
+
+        Handlers call this right before their own commit, so the key's
+        response and the work it describes are stored atomically.
+        """
+        self.record.status_code = stored_response.status_code
+        self.record.response_body = stored_response.body.decode("utf-8")
+        self.response_recorded = True
+
+    def complete(self, stored_response: StoredResponse) -> None:
+        self.record_response(stored_response)
+        self.db_session.commit()
+
+    def release(self) -> None:
+        self.db_session.rollback()
+        self.db_session.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.id == self.record.id)
+        )
+        self.db_session.commit()
+
+    def invoke(self, handler: Callable[[], StoredResponse]) -> StoredResponse:
+        stored_response = self.reserve()
+        if stored_response is not None:
+            return stored_response
+
+        try:
+            stored_response = handler()
+        except HTTPException as e:
+            # Client errors are final answers and are replayed as well; server
+            # errors free the key so that a retry can run the request again.
+            if e.status_code >= 500:
+                self.release()
+                raise
+            self.db_session.rollback()
+            self.complete(
+                StoredResponse(
+                    e.status_code,
+                    json.dumps({"detail": e.detail}, separators=(",", ":")).encode(
+                        "utf-8"
+                    ),
+                )
+            )
+            raise
+        except Exception:
+            self.release()
+            raise
+        if not self.response_recorded:
+            self.complete(stored_response)
+        return stored_response
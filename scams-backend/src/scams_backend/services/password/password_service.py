@@ -1,13 +1,21 @@
 import bcrypt
+from scams_backend.metrics.registry import (
+    BCRYPT_OPERATION_DURATION,
+    BCRYPT_OPERATIONS_IN_PROGRESS,
+)
 
 
 class PasswordService:
     @staticmethod
+    @BCRYPT_OPERATIONS_IN_PROGRESS.track_inprogress()
+    @BCRYPT_OPERATION_DURATION.labels("hash").time()
     def hash_password(password: str) -> str:
         hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
         return hashed.decode("utf-8")
 
     @staticmethod
+    @BCRYPT_OPERATIONS_IN_PROGRESS.track_inprogress()
+    @BCRYPT_OPERATION_DURATION.labels("verify").time()
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         return bcrypt.checkpw(
             plain_password.encode("utf-8"), hashed_password.encode("utf-8")
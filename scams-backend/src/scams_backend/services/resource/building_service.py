@@ -1,20 +1,22 @@
+from typing import Optional
 from sqlalchemy.orm import Session
-from scams_backend.schemas.resource.building import BuildingDetail, BuildingListResponse
-from scams_backend.models.building import Building
+from scams_backend.schemas.resource.building import BuildingListResponse
+from scams_backend.cache.catalog import CatalogSnapshot, catalog_cache
+from scams_backend.utils.http_cache import EncodedBody
 
 
 class BuildingService:
     def __init__(self, db_session: Session):
         self.db_session: Session = db_session
-        self.buildings = []
+        self.catalog: Optional[CatalogSnapshot] = None
 
     def get_buildings(self):
-        self.buildings = self.db_session.query(Building.id, Building.name).all()
+        self.catalog = catalog_cache.get(self.db_session)
 
-    def invoke(self):
+    def invoke(self) -> BuildingListResponse:
         self.get_buildings()
-        return BuildingListResponse(
-            buildings=[
-                BuildingDetail.model_validate(building) for building in self.buildings
-            ]
-        )
+        return self.catalog.buildings
+
+    def invoke_body(self) -> EncodedBody:
+        self.get_buildings()
+        return self.catalog.buildings_body
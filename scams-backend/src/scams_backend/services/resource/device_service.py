@@ -1,18 +1,22 @@
+from typing import Optional
 from sqlalchemy.orm import Session
-from scams_backend.schemas.resource.device import DeviceDetail, DeviceListResponse
-from scams_backend.models.device import Device
+from scams_backend.schemas.resource.device import DeviceListResponse
+from scams_backend.cache.catalog import CatalogSnapshot, catalog_cache
+from scams_backend.utils.http_cache import EncodedBody
 
 
 class DeviceService:
     def __init__(self, db_session: Session):
         self.db_session: Session = db_session
-        self.devices = []
+        self.catalog: Optional[CatalogSnapshot] = None
 
     def get_devices(self):
-        self.devices = self.db_session.query(Device.id, Device.name).all()
+        self.catalog = catalog_cache.get(self.db_session)
 
-    def invoke(self):
+    def invoke(self) -> DeviceListResponse:
         self.get_devices()
-        return DeviceListResponse(
-            devices=[DeviceDetail.model_validate(device) for device in self.devices]
-        )
+        return self.catalog.devices
+
+    def invoke_body(self) -> EncodedBody:
+        self.get_devices()
+        return self.catalog.devices_body
@@ -1,25 +1,44 @@
+from typing import Optional
 from sqlalchemy.orm import Session
-from scams_backend.schemas.resource.lecturer import LecturerDetail, LecturerListResponse
-from scams_backend.models.user import User
-from scams_backend.constants.user import UserRole
+from scams_backend.schemas.resource.lecturer import (
+    LecturerListResponse,
+    LecturerSearchResponse,
+)
+from scams_backend.cache.lecturer_directory import (
+    LecturerDirectory,
+    lecturer_directory_cache,
+)
+from scams_backend.utils.http_cache import EncodedBody
 
 
 class LecturerService:
     def __init__(self, db_session: Session):
         self.db_session: Session = db_session
-        self.lecturers = []
+        self.directory: Optional[LecturerDirectory] = None
 
     def get_lecturers(self):
-        self.lecturers = (
-            self.db_session.query(User.id, User.full_name)
-            .filter(User.role == UserRole.LECTURER)
-            .all()
-        )
+        self.directory = lecturer_directory_cache.get(self.db_session)
+
+    def invoke(self) -> LecturerListResponse:
+        self.get_lecturers()
+        return LecturerListResponse(lecturers=list(self.directory.lecturers))
 
-    def invoke(self):
+    def invoke_body(self) -> EncodedBody:
         self.get_lecturers()
-        return LecturerListResponse(
-            lecturers=[
-                LecturerDetail.model_validate(lecturer) for lecturer in self.lecturers
-            ]
+        return self.directory.lecturers_body
+
+
+class LecturerSearchService:
+    def __init__(self, query: str, limit: int, offset: int, db_session: Session):
+        self.query: str = query
+        self.limit: int = limit
+        self.offset: int = offset
+        self.db_session: Session = db_session
+
+    def invoke(self) -> LecturerSearchResponse:
+        directory = lecturer_directory_cache.get(self.db_session)
+        matches = directory.search(self.query)
+        return LecturerSearchResponse(
+            total=len(matches),
+            lecturers=matches[self.offset : self.offset + self.limit],
         )
@@ -4,3 +4,13 @@ from fastapi import HTTPException
 class RoomNotFoundException(HTTPException):
     def __init__(self, room_id: int):
         super().__init__(status_code=404, detail=f"Room with ID {room_id} not found.")
+
+
+class InvalidSlotSearchException(HTTPException):
+    def __init__(self, message: str = "Invalid slot search parameters."):
+        super().__init__(status_code=400, detail=message)
+
+
+class InvalidAvailabilityWindowException(HTTPException):
+    def __init__(self, message: str = "Invalid availability window."):
+        super().__init__(status_code=400, detail=message)
@@ -1,9 +1,6 @@
-from sqlalchemy import select
+from typing import Optional
 from sqlalchemy.orm import Session
-from scams_backend.models.room import Room
-from scams_backend.models.building import Building
-from scams_backend.models.device import Device
-from scams_backend.models.room_device import RoomDevice
+from scams_backend.cache.catalog import catalog_cache
 from scams_backend.schemas.room.room_schema import RoomDetailResponse
 from scams_backend.services.room.exception import RoomNotFoundException
 
@@ -12,51 +9,22 @@ class RoomDetailService:
     def __init__(self, room_id: int, db_session: Session):
         self.room_id = room_id
         self.db_session: Session = db_session
-        self.room_detail = None
+        self.room_detail: Optional[RoomDetailResponse] = None
+        self.room_detail_json: Optional[bytes] = None
 
     def get_room_detail(self) -> None:
-        stmt = (
-            select(
-                Room.id,
-                Room.building_id,
-                Room.image_url,
-                Room.name,
-                Room.floor_number,
-                Room.capacity,
-                Building.name.label("building_name"),
-                Device.id.label("device_id"),
-                Device.name.label("device_name"),
-            )
-            .join(Building, Room.building_id == Building.id, isouter=True)
-            .join(RoomDevice, Room.id == RoomDevice.room_id, isouter=True)
-            .join(Device, RoomDevice.device_id == Device.id, isouter=True)
-            .where(Room.id == self.room_id)
-        )
-        results = self.db_session.execute(stmt).all()
+        catalog = catalog_cache.get(self.db_session)
+        self.room_detail = catalog.get_room(self.room_id)
 
-        if not results:
+        if self.room_detail is None:
             raise RoomNotFoundException(self.room_id)
 
-        room_info = results[0]
-
-        devices = [
-            {"id": row.device_id, "name": row.device_name}
-            for row in results
-            if row.device_id and row.device_name
-        ]
-
-        self.room_detail = {
-            "id": room_info.id,
-            "name": room_info.name,
-            "image_url": room_info.image_url,
-            "building_id": room_info.building_id,
-            "floor_number": room_info.floor_number,
-            "capacity": room_info.capacity,
-            "building_name": room_info.building_name,
-            "devices": devices,
-        }
+        self.room_detail_json = catalog.get_room_json(self.room_id)
 
     def invoke(self) -> RoomDetailResponse:
         self.get_room_detail()
+        return self.room_detail
 
-        return RoomDetailResponse.model_validate(self.room_detail)
+    def invoke_json(self) -> bytes:
+        self.get_room_detail()
+        return self.room_detail_json
@@ -0,0 +1,40 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from scams_backend.cache.catalog import catalog_cache
+from scams_backend.schemas.room.room_facet_schema import DeviceFacet, RoomFacetResponse
+
+
+class RoomFacetService:
+    def __init__(
+        self,
+        building_id: Optional[int],
+        device_ids: Optional[list[int]],
+        any_device_ids: Optional[list[int]],
+        min_capacity: Optional[int],
+        db_session: Session,
+    ):
+        self.building_id: Optional[int] = building_id
+        self.device_ids: Optional[list[int]] = device_ids
+        self.any_device_ids: Optional[list[int]] = any_device_ids
+        self.min_capacity: Optional[int] = min_capacity
+        self.db_session: Session = db_session
+
+    def invoke(self) -> RoomFacetResponse:
+        catalog = catalog_cache.get(self.db_session)
+        total_rooms, device_counts = catalog.count_rooms_per_device(
+            building_id=self.building_id,
+            min_capacity=self.min_capacity,
+            device_ids=self.device_ids,
+            any_device_ids=self.any_device_ids,
+        )
+        return RoomFacetResponse(
+            total_rooms=total_rooms,
+            devices=[
+                DeviceFacet(
+                    device_id=device.id,
+                    device_name=device.name,
+                    room_count=device_counts[catalog.device_bits[device.id]],
+                )
+                for device in catalog.devices.devices
+            ],
+        )
@@ -1,16 +1,16 @@
 from sqlalchemy import select
 from sqlalchemy.orm import Session
-from scams_backend.models.room import Room
-from scams_backend.models.building import Building
-from scams_backend.models.device import Device
-from scams_backend.models.schedule import Schedule
-from scams_backend.models.room_device import RoomDevice
+from scams_backend.cache.catalog import catalog_cache
+from scams_backend.core.config import settings
+from scams_backend.models.room_day_occupancy import RoomDayOccupancy
 from scams_backend.schemas.room.room_schema import RoomDetailResponse
 from scams_backend.schemas.room.room_schema import RoomListResponse
-from scams_backend.services.room.room_detail_service import RoomDetailService
+from scams_backend.services.room.exception import InvalidAvailabilityWindowException
+from scams_backend.utils.slot_mask import HOURS_PER_DAY, first_free_run
 from typing import Optional
-from datetime import datetime
-from sqlalchemy import func
+from datetime import date, datetime, time, timedelta
+
+SLOT_LENGTH = timedelta(hours=1)
 
 
 class RoomListService:
@@ -18,66 +18,140 @@ class RoomListService:
         self,
         building_id: Optional[int],
         device_ids: Optional[list[int]],
+        any_device_ids: Optional[list[int]],
         min_capacity: Optional[int],
         start_time: Optional[datetime],
         end_time: Optional[datetime],
+        min_free_hours: Optional[int],
         limit: Optional[int],
         offset: Optional[int],
         db_session: Session,
     ):
         self.building_id: Optional[int] = building_id
         self.device_ids: Optional[list[int]] = device_ids
+        self.any_device_ids: Optional[list[int]] = any_device_ids
         self.min_capacity: Optional[int] = min_capacity
         self.start_time: Optional[datetime] = start_time
         self.end_time: Optional[datetime] = end_time
+        self.min_free_hours: Optional[int] = min_free_hours
         self.db_session: Session = db_session
-        self.room_ids: list[int] = []
         self.rooms: list[RoomDetailResponse] = []
         self.limit: Optional[int] = limit
         self.offset: Optional[int] = offset
 
     def get_filtered_rooms(self) -> None:
-        stmt = select(Room.id)
+        catalog = catalog_cache.get(self.db_session)
+        self.rooms = catalog.filter_rooms(
+            building_id=self.building_id,
+            min_capacity=self.min_capacity,
+            device_ids=self.device_ids,
+            any_device_ids=self.any_device_ids,
+        )
 
-        if self.building_id is not None:
-            stmt = stmt.where(Room.building_id == self.building_id)
+    def validate_window(self) -> None:
+        if not (self.start_time and self.end_time):
+            if self.min_free_hours is not None:
+                raise InvalidAvailabilityWindowException(
+                    "min_free_hours requires start_time and end_time."
+                )
+            return
+        if self.end_time <= self.start_time:
+            raise InvalidAvailabilityWindowException(
+                "end_time must be after start_time."
+            )
+        if (self.end_time - self.start_time).days >= settings.SLOT_SEARCH_MAX_DAYS:
+            raise InvalidAvailabilityWindowException(
+                f"Window cannot exceed {settings.SLOT_SEARCH_MAX_DAYS} days."
+            )
 
-        if self.min_capacity is not None:
-            stmt = stmt.where(Room.capacity >= self.min_capacity)
+    def fetch_busy_masks(self) -> dict[tuple[int, date], int]:
+        # An hourly slot starting at S covers [S, S + 1h), so it overlaps the
+        # window when start_time - 1h < S < end_time.
+        lower = self.start_time - SLOT_LENGTH
+        stmt = select(
+            RoomDayOccupancy.room_id,
+            RoomDayOccupancy.date,
+            RoomDayOccupancy.booked_mask,
+        ).where(
+            RoomDayOccupancy.room_id.in_([room.id for room in self.rooms]),
+            RoomDayOccupancy.date >= lower.date(),
+            RoomDayOccupancy.date <= self.end_time.date(),
+        )
+        return {
+            (room_id, day): booked_mask
+            for room_id, day, booked_mask in self.db_session.execute(stmt)
+        }
 
-        if self.device_ids:
-            subq = (
-                select(RoomDevice.room_id)
-                .where(RoomDevice.device_id.in_(self.device_ids))
-                .group_by(RoomDevice.room_id)
-                .having(func.count(RoomDevice.device_id) == len(self.device_ids))
-            )
-            stmt = stmt.where(Room.id.in_(subq))
+    def overlap_mask(self, day: date) -> int:
+        """Slots of ``day`` that overlap the window."""
+        lower = self.start_time - SLOT_LENGTH
+        mask = 0
+        for hour in range(HOURS_PER_DAY):
+            if lower < datetime.combine(day, time(hour)) < self.end_time:
+                mask |= 1 << hour
+        return mask
 
-        if self.start_time and self.end_time:
-            overlap_subq = select(Schedule.room_id).where(
-                Schedule.date == self.start_time.date(),
-                Schedule.start_time < self.end_time.time(),
-                Schedule.start_time >= self.start_time.time(),
-            )
-            stmt = stmt.where(~Room.id.in_(overlap_subq))
+    def exclude_booked_rooms(self) -> None:
+        if not (self.start_time and self.end_time) or not self.rooms:
+            return
 
-        if self.limit:
-            stmt = stmt.limit(self.limit)
-        if self.offset:
-            stmt = stmt.offset(self.offset)
-        result = self.db_session.execute(stmt).scalars().all()
-        self.room_ids = result
+        busy_masks = self.fetch_busy_masks()
+        if self.min_free_hours is None:
+            overlap_masks: dict[date, int] = {}
+            booked_room_ids = set()
+            for (room_id, day), booked_mask in busy_masks.items():
+                if day not in overlap_masks:
+                    overlap_masks[day] = self.overlap_mask(day)
+                if booked_mask & overlap_masks[day]:
+                    booked_room_ids.add(room_id)
+            self.rooms = [room for room in self.rooms if room.id not in booked_room_ids]
+            return
 
-    def get_room_details(self) -> None:
-        for room_id in self.room_ids:
-            room_detail_service = RoomDetailService(
-                room_id=room_id, db_session=self.db_session
+        day_windows = self.day_windows()
+        self.rooms = [
+            room
+            for room in self.rooms
+            if any(
+                first_free_run(
+                    busy_masks.get((room.id, day), 0),
+                    self.min_free_hours,
+                    start_hour,
+                    end_hour,
+                )
+                is not None
+                for day, start_hour, end_hour in day_windows
             )
-            room_detail = room_detail_service.invoke()
-            self.rooms.append(room_detail)
+        ]
+
+    def day_windows(self) -> list[tuple[date, int, int]]:
+        # Whole bookable hours of every day touched by the window.
+        first_hour = self.start_time.replace(minute=0, second=0, microsecond=0)
+        if first_hour < self.start_time:
+            first_hour += SLOT_LENGTH
+        last_hour = self.end_time.replace(minute=0, second=0, microsecond=0)
+
+        windows = []
+        day = first_hour.date()
+        while day <= last_hour.date():
+            start_hour = settings.BOOKING_DAY_START_HOUR
+            end_hour = settings.BOOKING_DAY_END_HOUR
+            if day == first_hour.date():
+                start_hour = max(start_hour, first_hour.hour)
+            if day == last_hour.date():
+                end_hour = min(end_hour, last_hour.hour)
+            if end_hour > start_hour:
+                windows.append((day, start_hour, end_hour))
+            day += timedelta(days=1)
+        return windows
+
+    def paginate(self) -> None:
+        start = self.offset or 0
+        end = start + self.limit if self.limit else None
+        self.rooms = self.rooms[start:end]
 
     def invoke(self) -> RoomListResponse:
+        self.validate_window()
         self.get_filtered_rooms()
-        self.get_room_details()
-        return RoomListResponse(rooms=self.rooms)
+        self.exclude_booked_rooms()
+        self.paginate()
+        return RoomListResponse.model_construct(rooms=self.rooms)
@@ -1,8 +1,10 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 import datetime
 from typing import Optional
-from scams_backend.models.schedule import Schedule
+from scams_backend.models.room_day_occupancy import RoomDayOccupancy
 from scams_backend.schemas.room.room_schedule_schema import RoomScheduleResponse
+from scams_backend.utils.slot_mask import HOURS_PER_DAY
 
 
 class RoomScheduleService:
@@ -12,22 +14,22 @@ class RoomScheduleService:
         self.room_id: int = room_id
         self.date: datetime.date = date or datetime.date.today()
         self.db_session: Session = db_session
-        self.scheduled_slots: list[Schedule] = []
+        self.booked_mask: int = 0
 
-    def fetch_scheduled_slots(self) -> None:
-        stmt = (
-            self.db_session.query(Schedule)
-            .filter(
-                Schedule.room_id == self.room_id,
-                Schedule.date == self.date,
-            )
-            .order_by(Schedule.start_time)
+    def fetch_booked_mask(self) -> None:
+        stmt = select(RoomDayOccupancy.booked_mask).where(
+            RoomDayOccupancy.room_id == self.room_id,
+            RoomDayOccupancy.date == self.date,
         )
-        self.scheduled_slots = stmt.all()
+        self.booked_mask = self.db_session.execute(stmt).scalar() or 0
 
     def invoke(self) -> RoomScheduleResponse:
-        self.fetch_scheduled_slots()
-        booked_times = [slot.start_time for slot in self.scheduled_slots]
+        self.fetch_booked_mask()
+        booked_times = [
+            datetime.time(hour)
+            for hour in range(HOURS_PER_DAY)
+            if self.booked_mask >> hour & 1
+        ]
 
         room_schedule_response = RoomScheduleResponse(
             room_id=self.room_id,
@@ -0,0 +1,127 @@
+import datetime
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from scams_backend.cache.catalog import catalog_cache
+from scams_backend.core.config import settings
+from scams_backend.models.room_day_occupancy import RoomDayOccupancy
+from scams_backend.schemas.room.room_schema import RoomDetailResponse
+from scams_backend.schemas.room.room_slot_schema import RoomSlot, RoomSlotListResponse
+from scams_backend.services.room.exception import InvalidSlotSearchException
+from scams_backend.utils.slot_mask import first_free_run
+
+
+class RoomSlotFinderService:
+    def __init__(
+        self,
+        building_id: Optional[int],
+        device_ids: Optional[list[int]],
+        min_capacity: Optional[int],
+        start_date: Optional[datetime.date],
+        end_date: Optional[datetime.date],
+        duration_hours: int,
+        earliest_hour: Optional[int],
+        latest_hour: Optional[int],
+        limit: int,
+        db_session: Session,
+    ):
+        self.building_id: Optional[int] = building_id
+        self.device_ids: Optional[list[int]] = device_ids
+        self.min_capacity: Optional[int] = min_capacity
+        self.start_date: datetime.date = start_date or datetime.date.today()
+        self.end_date: datetime.date = end_date or self.start_date + datetime.timedelta(
+            days=6
+        )
+        self.duration_hours: int = duration_hours
+        self.earliest_hour: int = (
+            settings.BOOKING_DAY_START_HOUR if earliest_hour is None else earliest_hour
+        )
+        self.latest_hour: int = (
+            settings.BOOKING_DAY_END_HOUR if latest_hour is None else latest_hour
+        )
+        self.limit: int = limit
+        self.db_session: Session = db_session
+        self.rooms: list[RoomDetailResponse] = []
+        self.busy_masks: dict[tuple[int, datetime.date], int] = {}
+        self.slots: list[RoomSlot] = []
+
+    def validate_request(self) -> None:
+        if self.end_date < self.start_date:
+            raise InvalidSlotSearchException("end_date must not be before start_date.")
+        if (self.end_date - self.start_date).days >= settings.SLOT_SEARCH_MAX_DAYS:
+            raise InvalidSlotSearchException(
+                f"Search window cannot exceed {settings.SLOT_SEARCH_MAX_DAYS} days."
+            )
+        if self.latest_hour - self.earliest_hour < self.duration_hours:
+            raise InvalidSlotSearchException(
+                "duration_hours does not fit between earliest_hour and latest_hour."
+            )
+
+    def get_candidate_rooms(self) -> None:
+        catalog = catalog_cache.get(self.db_session)
+        self.rooms = catalog.filter_rooms(
+            building_id=self.building_id,
+            min_capacity=self.min_capacity,
+            device_ids=self.device_ids,
+        )
+
+    def fetch_busy_masks(self) -> None:
+        if not self.rooms:
+            return
+
+        stmt = select(
+            RoomDayOccupancy.room_id,
+            RoomDayOccupancy.date,
+            RoomDayOccupancy.booked_mask,
+        ).where(
+            RoomDayOccupancy.room_id.in_([room.id for room in self.rooms]),
+            RoomDayOccupancy.date >= self.start_date,
+            RoomDayOccupancy.date <= self.end_date,
+        )
+        for room_id, date, booked_mask in self.db_session.execute(stmt):
+            self.busy_masks[(room_id, date)] = booked_mask
+
+    def find_slots(self) -> None:
+        # Candidates are ranked by (date, start hour, capacity), so a day's
+        # results are final once every room has been checked for that day.
+        rooms = sorted(self.rooms, key=lambda room: (room.capacity, room.id))
+        now = datetime.datetime.now()
+        date = self.start_date
+        while date <= self.end_date and len(self.slots) < self.limit:
+            earliest_hour = self.earliest_hour
+            if date == now.date():
+                earliest_hour = max(earliest_hour, now.hour + 1)
+
+            day_candidates = []
+            for room in rooms:
+                start_hour = first_free_run(
+                    self.busy_masks.get((room.id, date), 0),
+                    self.duration_hours,
+                    earliest_hour,
+                    self.latest_hour,
+                )
+                if start_hour is not None:
+                    day_candidates.append((start_hour, room))
+
+            day_candidates.sort(key=lambda candidate: candidate[0])
+            for start_hour, room in day_candidates[: self.limit - len(self.slots)]:
+                self.slots.append(
+                    RoomSlot.model_construct(
+                        room_id=room.id,
+                        room_name=room.name,
+                        building_id=room.building_id,
+                        building_name=room.building_name,
+                        capacity=room.capacity,
+                        date=date,
+                        start_time=datetime.time(start_hour),
+                        end_time=datetime.time(start_hour + self.duration_hours),
+                    )
+                )
+            date += datetime.timedelta(days=1)
+
+    def invoke(self) -> RoomSlotListResponse:
+        self.validate_request()
+        self.get_candidate_rooms()
+        self.fetch_busy_masks()
+        self.find_slots()
+        return RoomSlotListResponse.model_construct(slots=self.slots)
@@ -0,0 +1,196 @@
+import datetime
+from typing import Optional
+from sqlalchemy import extract, select
+from sqlalchemy.orm import Session
+from scams_backend.cache.catalog import catalog_cache
+from scams_backend.constants.schedule import CancellationScope
+from scams_backend.constants.user import UserRole
+from scams_backend.core.config import settings
+from scams_backend.models.schedule import Schedule
+from scams_backend.models.user import User
+from scams_backend.schemas.schedule.schedule_schema import (
+    CancelSchedulesRequest,
+    CancelSchedulesResponse,
+)
+from scams_backend.services.schedule.exception import (
+    InvalidCancellationException,
+    ScheduleNotFoundException,
+)
+from scams_backend.services.schedule.schedule_canceller import ScheduleCanceller
+from scams_backend.services.user.exception import PermissionException
+
+
+def fetch_user_role(db_session: Session, user_id: int) -> Optional[str]:
+    user = db_session.query(User).filter_by(id=user_id).first()
+    return user.role if user else None
+
+
+class CancelScheduleService:
+    """Cancels one slot, or the whole booking it belongs to.
+
+    A booking is the run of slots created by one request: same room,
+    lecturer and date, inserted in the same transaction.
+    """
+
+    def __init__(
+        self,
+        schedule_id: int,
+        scope: CancellationScope,
+        user_id: int,
+        reason: Optional[str],
+        db_session: Session,
+    ):
+        self.schedule_id: int = schedule_id
+        self.scope: CancellationScope = scope
+        self.user_id: int = user_id
+        self.reason: Optional[str] = reason
+        self.db_session: Session = db_session
+        self.schedule: Optional[Schedule] = None
+
+    def fetch_schedule(self) -> None:
+        self.schedule = (
+            self.db_session.query(Schedule).filter_by(id=self.schedule_id).first()
+        )
+        if not self.schedule:
+            raise ScheduleNotFoundException(self.schedule_id)
+
+    def verify_permission(self) -> None:
+        if self.schedule.lecturer_id == self.user_id:
+            return
+        if fetch_user_role(self.db_session, self.user_id) != UserRole.ADMIN:
+            raise PermissionException("You can only cancel your own bookings.")
+
+    def verify_not_past(self) -> None:
+        if self.schedule.date < datetime.date.today():
+            raise InvalidCancellationException("Past bookings cannot be cancelled.")
+
+    def build_conditions(self) -> list:
+        # The date lets a partitioned schedules table skip other months.
+        conditions = [Schedule.date == self.schedule.date]
+        if self.scope == CancellationScope.SLOT:
+            return conditions + [Schedule.id == self.schedule.id]
+        # created_at is compared in SQL, as stored, rather than round-tripped
+        # through Python.
+        created_at = (
+            select(Schedule.created_at)
+            .where(Schedule.id == self.schedule.id, Schedule.date == self.schedule.date)
+            .scalar_subquery()
+        )
+        return conditions + [
+            Schedule.room_id == self.schedule.room_id,
+            Schedule.lecturer_id == self.schedule.lecturer_id,
+            Schedule.created_at == created_at,
+        ]
+
+    def invoke(self) -> CancelSchedulesResponse:
+        self.fetch_schedule()
+        self.verify_permission()
+        self.verify_not_past()
+        return ScheduleCanceller(self.db_session).cancel(
+            self.build_conditions(), cancelled_by=self.user_id, reason=self.reason
+        )
+
+
+class CancelSchedulesInRangeService:
+    """Cancels every booking matching a filter over a date range.
+
+    Admins can cancel any room, building or lecturer, e.g. for maintenance;
+    lecturers only their own bookings, e.g. a weekly series by weekday and
+    time of day.
+    """
+
+    def __init__(
+        self,
+        cancel_request: CancelSchedulesRequest,
+        user_id: int,
+        db_session: Session,
+    ):
+        self.cancel_request: CancelSchedulesRequest = cancel_request
+        self.user_id: int = user_id
+        self.db_session: Session = db_session
+        self.lecturer_id: Optional[int] = cancel_request.lecturer_id
+
+    def validate_request(self) -> None:
+        request = self.cancel_request
+        if request.end_date < request.start_date:
+            raise InvalidCancellationException(
+                "end_date must not be before start_date."
+            )
+        if (request.end_date - request.start_date).days >= (
+            settings.CANCELLATION_MAX_DAYS
+        ):
+            raise InvalidCancellationException(
+                f"Date range cannot exceed {settings.CANCELLATION_MAX_DAYS} days."
+            )
+        if request.start_date < datetime.date.today():
+            raise InvalidCancellationException("Past bookings cannot be cancelled.")
+        if request.weekdays is not None and not all(
+            1 <= weekday <= 7 for weekday in request.weekdays
+        ):
+            raise InvalidCancellationException("weekdays must be between 1 and 7.")
+        if (
+            request.start_time is not None
+            and request.end_time is not None
+            and request.end_time <= request.start_time
+        ):
+            raise InvalidCancellationException("end_time must be after start_time.")
+
+    def verify_permission(self) -> None:
+        role = fetch_user_role(self.db_session, self.user_id)
+        if role == UserRole.ADMIN:
+            if (
+                self.cancel_request.room_id is None
+                and self.cancel_request.building_id is None
+                and self.cancel_request.lecturer_id is None
+            ):
+                raise InvalidCancellationException(
+                    "Give a room_id, building_id or lecturer_id to cancel."
+                )
+        elif role == UserRole.LECTURER:
+            if self.lecturer_id not in (None, self.user_id):
+                raise PermissionException("You can only cancel your own bookings.")
+            self.lecturer_id = self.user_id
+        else:
+            raise PermissionException("Only lecturers and admins can cancel bookings.")
+
+    def build_conditions(self) -> list:
+        request = self.cancel_request
+        conditions = [
+            Schedule.date >= request.start_date,
+            Schedule.date <= request.end_date,
+        ]
+        if request.room_id is not None:
+            conditions.append(Schedule.room_id == request.room_id)
+        if request.building_id is not None:
+            conditions.append(
+                Schedule.room_id.in_(
+                    [
+                        room.id
+                        for room in catalog_cache.get(self.db_session).rooms
+                        if room.building_id == request.building_id
+                    ]
+                )
+            )
+        if self.lecturer_id is not None:
+            conditions.append(Schedule.lecturer_id == self.lecturer_id)
+        if request.weekdays is not None:
+            # dow counts from Sunday = 0; ISO weekdays from Monday = 1.
+            conditions.append(
+                extract("dow", Schedule.date).in_(
+                    sorted({weekday % 7 for weekday in request.weekdays})
+                )
+            )
+        if request.start_time is not None:
+            conditions.append(Schedule.start_time >= request.start_time)
+        if request.end_time is not None:
+            conditions.append(Schedule.start_time < request.end_time)
+        return conditions
+
+    def invoke(self) -> CancelSchedulesResponse:
+        self.validate_request()
+        self.verify_permission()
+        return ScheduleCanceller(self.db_session).cancel(
+            self.build_conditions(),
+            cancelled_by=self.user_id,
+            reason=self.cancel_request.reason,
+        )
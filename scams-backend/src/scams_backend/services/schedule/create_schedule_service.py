@@ -1,21 +1,38 @@
+from typing import Callable, Optional
+from sqlalchemy import or_, select, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from scams_backend.models.schedule import Schedule
 from scams_backend.schemas.schedule.schedule_schema import (
     CreateScheduleRequest,
     CreateScheduleResponse,
-    ScheduleDetail,
 )
 from scams_backend.models.user import User
 from scams_backend.constants.user import UserRole
-from scams_backend.models.room import Room
 from scams_backend.services.user.exception import PermissionException
+from scams_backend.services.room.exception import RoomNotFoundException
 from scams_backend.services.schedule.exception import (
     ScheduleTimeConflictException,
     ScheduleCreationException,
 )
 
-from datetime import datetime
-from scams_backend.utils.encrypt import encrypt_data, decrypt_data
+from datetime import datetime, time
+from scams_backend.services.schedule.schedule_detail_builder import (
+    ScheduleDetailBuilder,
+)
+from scams_backend.services.schedule.occupancy_summary_service import (
+    OccupancySummaryService,
+)
+from scams_backend.utils.slot_mask import hour_range_mask
+from scams_backend.utils.encrypt import encrypt_data
+from scams_backend.db.deadline import is_deadline_error
+from scams_backend.cache.shared_cache import invalidation_bus
+from scams_backend.constants.cache import InvalidationTopic
+from scams_backend.cache.calendar_feed import calendar_feed_cache
+from scams_backend.cache.catalog import catalog_cache
+from scams_backend.constants.calendar import CalendarFeedKind
+
+ROOM_SLOT_COLUMNS = "room_id_date_start_time"
 
 
 class CreateScheduleService:
@@ -24,11 +41,18 @@ class CreateScheduleService:
         create_schedule_request: CreateScheduleRequest,
         user_id: int,
         db_session: Session,
+        before_commit: Optional[Callable[[CreateScheduleResponse], None]] = None,
     ):
         self.create_schedule_request: CreateScheduleRequest = create_schedule_request
         self.user_id: int = user_id
         self.db_session: Session = db_session
+        # Runs inside the booking's transaction with the response about to be
+        # returned, e.g. to store it under an Idempotency-Key atomically.
+        self.before_commit: Optional[Callable[[CreateScheduleResponse], None]] = (
+            before_commit
+        )
         self.schedules: list[Schedule] = []
+        self.response: Optional[CreateScheduleResponse] = None
 
     def verify_lecturer_exists(self) -> None:
         lecturer = self.db_session.query(User).filter_by(id=self.user_id).first()
@@ -38,32 +62,52 @@ class CreateScheduleService:
             )
 
     def verify_room_exists(self) -> None:
-        room = (
-            self.db_session.query(Room)
-            .filter(Room.id == self.create_schedule_request.room_id)
-            .first()
+        room_id = self.create_schedule_request.room_id
+        if catalog_cache.get(self.db_session).get_room(room_id) is None:
+            raise RoomNotFoundException(room_id)
+
+    def lock_lecturer(self) -> None:
+        # Rooms are protected by a unique index; lecturers are not, so two
+        # concurrent bookings by one lecturer are serialized here until the
+        # commit of create_schedule_entries releases the lock.
+        if self.db_session.get_bind().dialect.name != "postgresql":
+            return
+        self.db_session.execute(
+            text(
+                "SELECT pg_advisory_xact_lock("
+                "hashtext('schedules_lecturer'), :lecturer_id)"
+            ),
+            {"lecturer_id": self.user_id},
         )
-        if not room:
-            raise ScheduleCreationException("Room does not exist.")
 
     def verify_time_conflict(self) -> None:
+        # One query finds both the room's and the lecturer's bookings over the
+        # whole requested range; room conflicts are reported first.
         start_hour = self.create_schedule_request.start_time.hour
         end_hour = self.create_schedule_request.end_time.hour
-        for hour in range(start_hour, end_hour):
-            conflict = (
-                self.db_session.query(Schedule)
-                .filter(
+        conflicts = self.db_session.execute(
+            select(Schedule.room_id, Schedule.start_time)
+            .where(
+                Schedule.date == self.create_schedule_request.date,
+                Schedule.start_time >= time(start_hour),
+                Schedule.start_time < time(end_hour),
+                or_(
                     Schedule.room_id == self.create_schedule_request.room_id,
-                    Schedule.date == self.create_schedule_request.date,
-                    Schedule.start_time
-                    == datetime.strptime(f"{hour:02d}:00", "%H:%M").time(),
-                )
-                .first()
+                    Schedule.lecturer_id == self.user_id,
+                ),
             )
-            if conflict:
+            .order_by(Schedule.start_time)
+        ).all()
+        for room_id, start_time in conflicts:
+            if room_id == self.create_schedule_request.room_id:
                 raise ScheduleTimeConflictException(
-                    f"Time slot {hour}:00 already booked for this room."
+                    f"Time slot {start_time.hour}:00 already booked for this room."
                 )
+        if conflicts:
+            raise ScheduleTimeConflictException(
+                f"Lecturer is already booked in another room at "
+                f"{conflicts[0].start_time.hour}:00."
+            )
 
     def create_schedule_entries(self) -> None:
         try:
@@ -85,45 +129,77 @@ class CreateScheduleService:
                 )
                 self.db_session.add(schedule)
                 self.schedules.append(schedule)
-            self.db_session.commit()
+            # Flushed first, so a taken slot fails on the unique index before
+            # the summary is touched.
+            self.db_session.flush()
+            OccupancySummaryService(self.db_session).add_hours(
+                room_id=self.create_schedule_request.room_id,
+                date=self.create_schedule_request.date,
+                mask=hour_range_mask(start_hour, end_hour),
+            )
             for schedule in self.schedules:
                 self.db_session.refresh(schedule)
+            self.response = self.build_response()
+            if self.before_commit is not None:
+                self.before_commit(self.response)
+            self.db_session.commit()
+        except IntegrityError as e:
+            self.db_session.rollback()
+            if not is_room_slot_taken(e):
+                raise ScheduleCreationException(
+                    f"An error occurred while creating schedule entries: {str(e)}"
+                )
+            # Lost a race with a concurrent booking of the same slot.
+            raise ScheduleTimeConflictException(
+                "Time slot was booked by another request in the meantime."
+            )
         except Exception as e:
             self.db_session.rollback()
+            if is_deadline_error(e):
+                raise
             raise ScheduleCreationException(
                 f"An error occurred while creating schedule entries: {str(e)}"
             )
 
+    def build_response(self) -> CreateScheduleResponse:
+        # The plaintext is already known, so the new rows are not decrypted.
+        schedule_detail_builder = ScheduleDetailBuilder(self.db_session)
+        schedule_details = [
+            schedule_detail_builder.build(
+                schedule,
+                purpose=self.create_schedule_request.purpose,
+                team_members=self.create_schedule_request.team_members or "",
+            )
+            for schedule in self.schedules
+        ]
+        return CreateScheduleResponse.model_construct(schedule=schedule_details)
+
     def invoke(self) -> CreateScheduleResponse:
         self.verify_lecturer_exists()
+        self.verify_room_exists()
+        self.lock_lecturer()
         self.verify_time_conflict()
         self.create_schedule_entries()
+        invalidation_bus.publish(InvalidationTopic.SCHEDULES)
+        calendar_feed_cache.invalidate(
+            [
+                (CalendarFeedKind.LECTURER.value, self.user_id),
+                (CalendarFeedKind.ROOM.value, self.create_schedule_request.room_id),
+            ]
+        )
+        return self.response
 
-        schedule_details = []
-        for schedule in self.schedules:
-            # Use relationships to get related info
-            room = schedule.room
-            lecturer = schedule.lecturer
-            building = room.building if room else None
 
-            schedule_details.append(
-                ScheduleDetail(
-                    id=schedule.id,
-                    room_id=schedule.room_id,
-                    room_name=room.name if room else "",
-                    lecturer_id=schedule.lecturer_id,
-                    lecturer_name=decrypt_data(lecturer.full_name) if lecturer else "",
-                    building_id=building.id if building else None,
-                    building_name=building.name if building else "",
-                    date=schedule.date,
-                    start_time=schedule.start_time,
-                    purpose=decrypt_data(schedule.purpose),
-                    team_members=(
-                        decrypt_data(schedule.team_members)
-                        if schedule.team_members
-                        else ""
-                    ),
-                    created_at=schedule.created_at,
-                )
-            )
-        return CreateScheduleResponse(schedule=schedule_details)
+def is_room_slot_taken(error: IntegrityError) -> bool:
+    """Whether ``error`` violates the unique (room_id, date, start_time) index.
+
+    On PostgreSQL the violated index may be the copy on a monthly partition,
+    e.g. ``schedules_y2026m10_room_id_date_start_time_idx``.
+    """
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None:
+        return ROOM_SLOT_COLUMNS in (diag.constraint_name or "")
+    return (
+        "UNIQUE constraint failed: schedules.room_id, schedules.date, "
+        "schedules.start_time" in str(error.orig)
+    )
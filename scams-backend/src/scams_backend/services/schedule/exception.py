@@ -16,3 +16,38 @@ class ScheduleTimeConflictException(HTTPException):
 class ScheduleCreationException(HTTPException):
     def __init__(self, message: str = "Failed to create schedule entries."):
         super().__init__(status_code=500, detail=message)
+
+
+class InvalidExportRangeException(HTTPException):
+    def __init__(self, message: str = "Invalid export date range."):
+        super().__init__(status_code=400, detail=message)
+
+
+class ExportFormatUnavailableException(HTTPException):
+    def __init__(self, file_format: str):
+        super().__init__(
+            status_code=501,
+            detail=f"Export format '{file_format}' is not available on this server.",
+        )
+
+
+class ScheduleNotFoundException(HTTPException):
+    def __init__(self, schedule_id: int):
+        super().__init__(
+            status_code=404, detail=f"Schedule with ID '{schedule_id}' does not exist."
+        )
+
+
+class InvalidCancellationException(HTTPException):
+    def __init__(self, message: str = "Invalid cancellation request."):
+        super().__init__(status_code=400, detail=message)
+
+
+class ScheduleCancellationException(HTTPException):
+    def __init__(self, message: str = "Failed to cancel schedule entries."):
+        super().__init__(status_code=500, detail=message)
+
+
+class InvalidFreeBusyRangeException(HTTPException):
+    def __init__(self, message: str = "Invalid free/busy date range."):
+        super().__init__(status_code=400, detail=message)
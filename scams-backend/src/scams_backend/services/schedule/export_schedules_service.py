@@ -0,0 +1,248 @@
+import csv
+import datetime
+import io
+from typing import Iterator, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from scams_backend.cache.catalog import CatalogSnapshot, catalog_cache
+from scams_backend.cache.lecturer_directory import (
+    LecturerDirectory,
+    lecturer_directory_cache,
+)
+from scams_backend.constants.export import ExportFormat
+from scams_backend.core.config import settings
+from scams_backend.models.schedule import Schedule
+from scams_backend.services.schedule.exception import (
+    ExportFormatUnavailableException,
+    InvalidExportRangeException,
+)
+from scams_backend.utils.encrypt import decrypt_batch
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is an optional extra: pip install scams-backend[export]
+    pa = None
+    pq = None
+
+EXPORT_COLUMNS: tuple[str, ...] = (
+    "id",
+    "date",
+    "start_time",
+    "room_id",
+    "room_name",
+    "building_id",
+    "building_name",
+    "lecturer_id",
+    "lecturer_name",
+    "purpose",
+    "team_members",
+    "created_at",
+)
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+Columns = dict[str, list]
+
+
+def parquet_schema():
+    return pa.schema(
+        [
+            ("id", pa.int32()),
+            ("date", pa.date32()),
+            ("start_time", pa.time32("s")),
+            ("room_id", pa.int32()),
+            ("room_name", pa.string()),
+            ("building_id", pa.int32()),
+            ("building_name", pa.string()),
+            ("lecturer_id", pa.int32()),
+            ("lecturer_name", pa.string()),
+            ("purpose", pa.string()),
+            ("team_members", pa.string()),
+            ("created_at", pa.timestamp("us")),
+        ]
+    )
+
+
+def format_repeated(values: list) -> list[str]:
+    formatted = {value: str(value) for value in set(values)}
+    return [formatted[value] for value in values]
+
+
+class ChunkSink:
+    """Write-only file object whose contents are taken out as they come."""
+
+    def __init__(self):
+        self.chunks: list[bytes] = []
+        self.closed: bool = False
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+class ExportSchedulesService:
+    """Streams the schedules of a date range as CSV or Parquet.
+
+    Rows are read month by month through a server-side cursor in batches of
+    ``batch_size`` and turned into columns: names come from the in-memory
+    catalog and lecturer directory, and each batch is decrypted in one go.
+    Only one batch is held at a time, whatever the size of the range.
+    """
+
+    def __init__(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        room_id: Optional[int],
+        building_id: Optional[int],
+        file_format: ExportFormat,
+        db_session: Session,
+        batch_size: Optional[int] = None,
+    ):
+        self.start_date: datetime.date = start_date
+        self.end_date: datetime.date = end_date
+        self.room_id: Optional[int] = room_id
+        self.building_id: Optional[int] = building_id
+        self.file_format: ExportFormat = file_format
+        self.db_session: Session = db_session
+        self.batch_size: int = batch_size or settings.EXPORT_BATCH_SIZE
+        self.catalog: Optional[CatalogSnapshot] = None
+        self.lecturer_directory: Optional[LecturerDirectory] = None
+
+    def validate_request(self) -> None:
+        if self.end_date < self.start_date:
+            raise InvalidExportRangeException("end_date must not be before start_date.")
+        if (self.end_date - self.start_date).days >= settings.EXPORT_MAX_DAYS:
+            raise InvalidExportRangeException(
+                f"Date range cannot exceed {settings.EXPORT_MAX_DAYS} days."
+            )
+        if self.file_format == ExportFormat.PARQUET and pa is None:
+            raise ExportFormatUnavailableException(self.file_format.value)
+
+    def month_ranges(self) -> Iterator[tuple[datetime.date, datetime.date]]:
+        # One sorted query per month keeps each sort small and lets a
+        # partitioned schedules table scan a single partition at a time.
+        start = self.start_date
+        while start <= self.end_date:
+            next_month = (start.replace(day=1) + datetime.timedelta(days=32)).replace(
+                day=1
+            )
+            end = min(self.end_date, next_month - datetime.timedelta(days=1))
+            yield start, end
+            start = next_month
+
+    def build_statement(self, start: datetime.date, end: datetime.date):
+        stmt = (
+            select(
+                Schedule.id,
+                Schedule.date,
+                Schedule.start_time,
+                Schedule.room_id,
+                Schedule.lecturer_id,
+                Schedule.purpose,
+                Schedule.team_members,
+                Schedule.created_at,
+            )
+            .where(Schedule.date >= start, Schedule.date <= end)
+            .order_by(Schedule.date, Schedule.start_time, Schedule.room_id)
+        )
+        if self.room_id is not None:
+            stmt = stmt.where(Schedule.room_id == self.room_id)
+        if self.building_id is not None:
+            stmt = stmt.where(
+                Schedule.room_id.in_(
+                    [
+                        room.id
+                        for room in self.catalog.rooms
+                        if room.building_id == self.building_id
+                    ]
+                )
+            )
+        return stmt
+
+    def iter_batches(self) -> Iterator[Columns]:
+        # Core execution on the session's connection: plain rows, no ORM
+        # loading. yield_per makes it a server-side cursor on PostgreSQL.
+        connection = self.db_session.connection().execution_options(
+            yield_per=self.batch_size
+        )
+        for start, end in self.month_ranges():
+            result = connection.execute(self.build_statement(start, end))
+            for rows in result.partitions():
+                yield self.build_columns(rows)
+
+    def build_columns(self, rows) -> Columns:
+        (
+            ids,
+            dates,
+            start_times,
+            room_ids,
+            lecturer_ids,
+            purposes,
+            team_members,
+            created_ats,
+        ) = map(list, zip(*rows))
+        rooms = [self.catalog.get_room(room_id) for room_id in room_ids]
+        return {
+            "id": ids,
+            "date": dates,
+            "start_time": start_times,
+            "room_id": room_ids,
+            "room_name": [room.name if room else "" for room in rooms],
+            "building_id": [room.building_id if room else None for room in rooms],
+            "building_name": [room.building_name if room else "" for room in rooms],
+            "lecturer_id": lecturer_ids,
+            "lecturer_name": [
+                self.lecturer_directory.get_name(lecturer_id) or ""
+                for lecturer_id in lecturer_ids
+            ],
+            "purpose": decrypt_batch(purposes),
+            "team_members": decrypt_batch(team_members),
+            "created_at": created_ats,
+        }
+
+    def iter_csv(self) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(EXPORT_COLUMNS)
+        for columns in self.iter_batches():
+            # Dates and times repeat across a batch; format each value once.
+            for name in ("date", "start_time", "created_at"):
+                columns[name] = format_repeated(columns[name])
+            writer.writerows(zip(*(columns[name] for name in EXPORT_COLUMNS)))
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        yield buffer.getvalue().encode()
+
+    def iter_parquet(self) -> Iterator[bytes]:
+        schema = parquet_schema()
+        sink = ChunkSink()
+        # Each batch becomes one row group, flushed to the client right away.
+        with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+            for columns in self.iter_batches():
+                writer.write_batch(pa.record_batch(columns, schema=schema))
+                yield sink.drain()
+        yield sink.drain()
+
+    def invoke(self) -> Iterator[bytes]:
+        self.validate_request()
+        self.catalog = catalog_cache.get(self.db_session)
+        self.lecturer_directory = lecturer_directory_cache.get(self.db_session)
+        if self.file_format == ExportFormat.PARQUET:
+            return self.iter_parquet()
+        return self.iter_csv()
@@ -0,0 +1,99 @@
+import datetime
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from scams_backend.cache.lecturer_directory import lecturer_directory_cache
+from scams_backend.core.config import settings
+from scams_backend.models.schedule import Schedule
+from scams_backend.schemas.schedule.schedule_schema import (
+    LecturerDayFreeBusy,
+    LecturerFreeBusyResponse,
+    TimeInterval,
+)
+from scams_backend.services.schedule.exception import (
+    InvalidFreeBusyRangeException,
+    LecturerDoesNotExistException,
+)
+from scams_backend.utils.slot_mask import HOURS_PER_DAY, hour_range_mask, mask_runs
+
+
+def hour_to_time(hour: int) -> datetime.time:
+    return datetime.time(hour) if hour < HOURS_PER_DAY else datetime.time.max
+
+
+def to_intervals(mask: int) -> list[TimeInterval]:
+    return [
+        TimeInterval.model_construct(
+            start_time=hour_to_time(start), end_time=hour_to_time(end)
+        )
+        for start, end in mask_runs(mask)
+    ]
+
+
+class LecturerFreeBusyService:
+    """Busy and free hours of a lecturer across all rooms, day by day.
+
+    The lecturer's slots come from one range scan of the
+    (lecturer_id, date, start_time) index; only times are exposed, not rooms
+    or purposes.
+    """
+
+    def __init__(
+        self,
+        lecturer_id: int,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        db_session: Session,
+    ):
+        self.lecturer_id: int = lecturer_id
+        self.start_date: datetime.date = start_date
+        self.end_date: datetime.date = end_date
+        self.db_session: Session = db_session
+        self.busy_masks: dict[datetime.date, int] = {}
+
+    def validate_request(self) -> None:
+        if self.end_date < self.start_date:
+            raise InvalidFreeBusyRangeException(
+                "end_date must not be before start_date."
+            )
+        if (self.end_date - self.start_date).days >= settings.FREE_BUSY_MAX_DAYS:
+            raise InvalidFreeBusyRangeException(
+                f"Date range cannot exceed {settings.FREE_BUSY_MAX_DAYS} days."
+            )
+
+    def verify_lecturer_exists(self) -> None:
+        directory = lecturer_directory_cache.get(self.db_session)
+        if directory.get_name(self.lecturer_id) is None:
+            raise LecturerDoesNotExistException(self.lecturer_id)
+
+    def fetch_busy_masks(self) -> None:
+        stmt = select(Schedule.date, Schedule.start_time).where(
+            Schedule.lecturer_id == self.lecturer_id,
+            Schedule.date >= self.start_date,
+            Schedule.date <= self.end_date,
+        )
+        self.busy_masks = {}
+        for date, start_time in self.db_session.execute(stmt):
+            self.busy_masks[date] = self.busy_masks.get(date, 0) | 1 << start_time.hour
+
+    def invoke(self) -> LecturerFreeBusyResponse:
+        self.validate_request()
+        self.verify_lecturer_exists()
+        self.fetch_busy_masks()
+
+        bookable_mask = hour_range_mask(
+            settings.BOOKING_DAY_START_HOUR, settings.BOOKING_DAY_END_HOUR
+        )
+        days = []
+        for offset in range((self.end_date - self.start_date).days + 1):
+            date = self.start_date + datetime.timedelta(days=offset)
+            busy_mask = self.busy_masks.get(date, 0)
+            days.append(
+                LecturerDayFreeBusy.model_construct(
+                    date=date,
+                    busy=to_intervals(busy_mask),
+                    free=to_intervals(bookable_mask & ~busy_mask),
+                )
+            )
+        return LecturerFreeBusyResponse.model_construct(
+            lecturer_id=self.lecturer_id, days=days
+        )
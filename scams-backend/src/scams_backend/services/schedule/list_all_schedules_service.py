@@ -1,14 +1,12 @@
 from sqlalchemy.orm import Session
 from scams_backend.models.schedule import Schedule
-from scams_backend.schemas.schedule.schedule_schema import (
-    ListSchedulesResponse,
-    ScheduleDetail,
-)
+from scams_backend.schemas.schedule.schedule_schema import ListSchedulesResponse
 import datetime
 from typing import Optional
 from scams_backend.models.room import Room
-
-from scams_backend.utils.encrypt import decrypt_data
+from scams_backend.services.schedule.schedule_detail_builder import (
+    ScheduleDetailBuilder,
+)
 
 
 class ListAllSchedulesService:
@@ -44,30 +42,8 @@ class ListAllSchedulesService:
 
     def invoke(self) -> ListSchedulesResponse:
         self.fetch_schedules()
-        schedule_details = []
-        for schedule in self.schedules:
-            room = schedule.room
-            building = room.building if room else None
-            lecturer = schedule.lecturer
-            schedule_details.append(
-                ScheduleDetail(
-                    id=schedule.id,
-                    room_id=schedule.room_id,
-                    room_name=room.name if room else "",
-                    lecturer_id=schedule.lecturer_id,
-                    lecturer_name=decrypt_data(lecturer.full_name) if lecturer else "",
-                    building_id=building.id if building else None,
-                    building_name=building.name if building else "",
-                    date=schedule.date,
-                    start_time=schedule.start_time,
-                    purpose=decrypt_data(schedule.purpose),
-                    team_members=(
-                        decrypt_data(schedule.team_members)
-                        if schedule.team_members
-                        else ""
-                    ),
-                    created_at=schedule.created_at,
-                )
-            )
-        response = ListSchedulesResponse(schedules=schedule_details)
+        schedule_details = ScheduleDetailBuilder(self.db_session).build_all(
+            self.schedules
+        )
+        response = ListSchedulesResponse.model_construct(schedules=schedule_details)
         return response
@@ -0,0 +1,166 @@
+import datetime
+from typing import Optional
+from sqlalchemy import (
+    Integer,
+    cast,
+    delete,
+    extract,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from scams_backend.models.room_day_occupancy import RoomDayOccupancy
+from scams_backend.models.schedule import Schedule
+from scams_backend.utils.slot_mask import HOURS_PER_DAY, hour_range_mask
+
+FULL_DAY_MASK = hour_range_mask(0, HOURS_PER_DAY)
+
+
+def summarize_slots(room_id, date, start_time):
+    """Select of (room_id, date, mask, hours) per room-day of the given slots."""
+    hour = cast(extract("hour", start_time), Integer)
+    return select(
+        room_id,
+        date,
+        func.sum(literal(1).op("<<")(hour)).label("mask"),
+        func.count().label("hours"),
+    ).group_by(room_id, date)
+
+
+class OccupancySummaryService:
+    """Keeps ``room_day_occupancy`` in step with ``schedules``.
+
+    Changes are applied with atomic upserts in the caller's transaction, so
+    the summary commits or rolls back together with the schedule rows and
+    concurrent bookings of the same room-day do not overwrite each other.
+    Callers flush their schedule rows first: the unique slot index then
+    guarantees that added hours were free, which keeps ``booked_hours`` equal
+    to the number of bits in ``booked_mask``.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db_session: Session = db_session
+
+    def dialect_insert(self):
+        dialect = self.db_session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(RoomDayOccupancy)
+        if dialect == "sqlite":
+            return sqlite.insert(RoomDayOccupancy)
+        raise NotImplementedError(f"No upsert support for {dialect}.")
+
+    def add_hours(self, room_id: int, date: datetime.date, mask: int) -> None:
+        if not mask:
+            return
+        stmt = self.dialect_insert().values(
+            room_id=room_id,
+            date=date,
+            booked_mask=mask,
+            booked_hours=mask.bit_count(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RoomDayOccupancy.room_id, RoomDayOccupancy.date],
+            set_={
+                "booked_mask": RoomDayOccupancy.booked_mask.op("|")(
+                    stmt.excluded.booked_mask
+                ),
+                "booked_hours": RoomDayOccupancy.booked_hours
+                + stmt.excluded.booked_hours,
+            },
+        )
+        self.db_session.execute(stmt)
+
+    def remove_slots(self, slots) -> None:
+        """Clears every slot selected by ``slots`` in two statements.
+
+        ``slots`` selects (room_id, date, start_time) of booked slots, such
+        as schedule rows that were just deleted. The slots are subtracted
+        rather than recounted, so concurrent cancellations of the same
+        room-day do not undo each other.
+        """
+        slots = slots.subquery()
+        removed = summarize_slots(
+            slots.c.room_id, slots.c.date, slots.c.start_time
+        ).subquery()
+        # The removed bits are all set in booked_mask, so subtracting them
+        # from FULL_DAY_MASK gives the complement without a bitwise NOT.
+        self.db_session.execute(
+            update(RoomDayOccupancy)
+            .where(
+                RoomDayOccupancy.room_id == removed.c.room_id,
+                RoomDayOccupancy.date == removed.c.date,
+            )
+            .values(
+                booked_mask=RoomDayOccupancy.booked_mask.op("&")(
+                    (FULL_DAY_MASK - removed.c.mask).self_group()
+                ),
+                booked_hours=RoomDayOccupancy.booked_hours - removed.c.hours,
+            )
+        )
+        self.db_session.execute(
+            delete(RoomDayOccupancy).where(
+                tuple_(RoomDayOccupancy.room_id, RoomDayOccupancy.date).in_(
+                    select(removed.c.room_id, removed.c.date)
+                ),
+                RoomDayOccupancy.booked_hours <= 0,
+            )
+        )
+
+
+class RebuildOccupancySummaryService:
+    """Recomputes the summary of a date range from ``schedules``."""
+
+    def __init__(
+        self,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        room_id: Optional[int],
+        db_session: Session,
+    ):
+        self.start_date: datetime.date = start_date
+        self.end_date: datetime.date = end_date
+        self.room_id: Optional[int] = room_id
+        self.db_session: Session = db_session
+
+    def lock_summary(self) -> None:
+        # Bookings wait for the rebuild instead of updating rows it is about
+        # to replace; readers are not blocked.
+        if self.db_session.get_bind().dialect.name == "postgresql":
+            self.db_session.execute(
+                text("LOCK TABLE room_day_occupancy IN SHARE ROW EXCLUSIVE MODE")
+            )
+
+    def delete_range(self) -> None:
+        stmt = delete(RoomDayOccupancy).where(
+            RoomDayOccupancy.date >= self.start_date,
+            RoomDayOccupancy.date <= self.end_date,
+        )
+        if self.room_id is not None:
+            stmt = stmt.where(RoomDayOccupancy.room_id == self.room_id)
+        self.db_session.execute(stmt)
+
+    def insert_range(self) -> int:
+        source = summarize_slots(
+            Schedule.room_id, Schedule.date, Schedule.start_time
+        ).where(Schedule.date >= self.start_date, Schedule.date <= self.end_date)
+        if self.room_id is not None:
+            source = source.where(Schedule.room_id == self.room_id)
+        result = self.db_session.execute(
+            insert(RoomDayOccupancy).from_select(
+                ["room_id", "date", "booked_mask", "booked_hours"], source
+            )
+        )
+        return result.rowcount
+
+    def invoke(self) -> int:
+        self.lock_summary()
+        self.delete_range()
+        rows = self.insert_range()
+        self.db_session.commit()
+        return rows
@@ -0,0 +1,148 @@
+import uuid
+from typing import Optional
+from sqlalchemy import Integer, String, delete, insert, literal, select
+from sqlalchemy.orm import Session
+from scams_backend.cache.calendar_feed import calendar_feed_cache
+from scams_backend.cache.shared_cache import invalidation_bus
+from scams_backend.constants.cache import InvalidationTopic
+from scams_backend.constants.calendar import CalendarFeedKind
+from scams_backend.db.deadline import is_deadline_error
+from scams_backend.models.schedule import Schedule
+from scams_backend.models.schedule_cancellation import ScheduleCancellation
+from scams_backend.schemas.schedule.schedule_schema import CancelSchedulesResponse
+from scams_backend.services.schedule.exception import ScheduleCancellationException
+from scams_backend.services.schedule.occupancy_summary_service import (
+    OccupancySummaryService,
+)
+
+CANCELLED_COLUMNS = (
+    Schedule.id,
+    Schedule.room_id,
+    Schedule.lecturer_id,
+    Schedule.date,
+    Schedule.start_time,
+    Schedule.purpose,
+    Schedule.team_members,
+    Schedule.created_at,
+)
+AUDIT_COLUMNS = (
+    "schedule_id",
+    "room_id",
+    "lecturer_id",
+    "date",
+    "start_time",
+    "purpose",
+    "team_members",
+    "created_at",
+    "cancellation_id",
+    "cancelled_by",
+    "reason",
+)
+
+
+class ScheduleCanceller:
+    """Cancels every schedule matching a set of conditions as one batch.
+
+    On PostgreSQL the rows are moved to ``schedule_cancellations`` by a single
+    INSERT ... SELECT from a DELETE ... RETURNING, so they never pass through
+    Python; the occupancy summary is corrected from those audit rows in two
+    statements. Caches and calendar feeds are invalidated once for the whole
+    batch after the commit.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db_session: Session = db_session
+
+    def move_to_audit(
+        self,
+        conditions: list,
+        cancellation_id: str,
+        cancelled_by: int,
+        reason: Optional[str],
+    ) -> int:
+        audit_values = (
+            literal(cancellation_id, String),
+            literal(cancelled_by, Integer),
+            literal(reason, String),
+        )
+        if self.db_session.get_bind().dialect.name == "postgresql":
+            cancelled = (
+                delete(Schedule)
+                .where(*conditions)
+                .returning(*CANCELLED_COLUMNS)
+                .cte("cancelled")
+            )
+            return self.db_session.execute(
+                insert(ScheduleCancellation).from_select(
+                    AUDIT_COLUMNS, select(*cancelled.c, *audit_values)
+                )
+            ).rowcount
+
+        # Without data-modifying CTEs (e.g. SQLite), copy first, then delete
+        # exactly the copied rows.
+        self.db_session.execute(
+            insert(ScheduleCancellation).from_select(
+                AUDIT_COLUMNS,
+                select(*CANCELLED_COLUMNS, *audit_values).where(*conditions),
+            )
+        )
+        return self.db_session.execute(
+            delete(Schedule)
+            .where(
+                Schedule.id.in_(
+                    select(ScheduleCancellation.schedule_id).where(
+                        ScheduleCancellation.cancellation_id == cancellation_id
+                    )
+                )
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    def update_summary(self, cancellation_id: str) -> None:
+        OccupancySummaryService(self.db_session).remove_slots(
+            select(
+                ScheduleCancellation.room_id,
+                ScheduleCancellation.date,
+                ScheduleCancellation.start_time,
+            ).where(ScheduleCancellation.cancellation_id == cancellation_id)
+        )
+
+    def fetch_feeds(self, cancellation_id: str) -> set[tuple[str, int]]:
+        pairs = self.db_session.execute(
+            select(ScheduleCancellation.lecturer_id, ScheduleCancellation.room_id)
+            .where(ScheduleCancellation.cancellation_id == cancellation_id)
+            .distinct()
+        ).all()
+        feeds = {(CalendarFeedKind.LECTURER.value, pair.lecturer_id) for pair in pairs}
+        feeds.update((CalendarFeedKind.ROOM.value, pair.room_id) for pair in pairs)
+        return feeds
+
+    def invalidate(self, feeds: set[tuple[str, int]]) -> None:
+        invalidation_bus.publish(InvalidationTopic.SCHEDULES)
+        calendar_feed_cache.invalidate(feeds)
+
+    def cancel(
+        self, conditions: list, cancelled_by: int, reason: Optional[str]
+    ) -> CancelSchedulesResponse:
+        cancellation_id = str(uuid.uuid4())
+        feeds = set()
+        try:
+            cancelled_count = self.move_to_audit(
+                conditions, cancellation_id, cancelled_by, reason
+            )
+            if cancelled_count:
+                self.update_summary(cancellation_id)
+                feeds = self.fetch_feeds(cancellation_id)
+            self.db_session.commit()
+        except Exception as e:
+            self.db_session.rollback()
+            if is_deadline_error(e):
+                raise
+            raise ScheduleCancellationException(
+                f"An error occurred while cancelling schedule entries: {str(e)}"
+            )
+        if cancelled_count:
+            self.invalidate(feeds)
+        return CancelSchedulesResponse.model_construct(
+            cancellation_id=cancellation_id, cancelled_count=cancelled_count
+        )
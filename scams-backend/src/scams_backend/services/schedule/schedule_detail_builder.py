@@ -0,0 +1,75 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from scams_backend.cache.catalog import CatalogSnapshot, catalog_cache
+from scams_backend.cache.lecturer_directory import (
+    LecturerDirectory,
+    lecturer_directory_cache,
+)
+from scams_backend.models.schedule import Schedule
+from scams_backend.schemas.schedule.schedule_schema import ScheduleDetail
+from scams_backend.utils.encrypt import decrypt_data
+
+
+class ScheduleDetailBuilder:
+    """Builds ScheduleDetail models from schedule rows.
+
+    Room, building and lecturer names come from the in-memory catalog and
+    lecturer directory, and the models are constructed without validation
+    since every field comes straight from typed database columns.
+    """
+
+    def __init__(self, db_session: Session):
+        self.catalog: CatalogSnapshot = catalog_cache.get(db_session)
+        self.lecturer_directory: LecturerDirectory = lecturer_directory_cache.get(
+            db_session
+        )
+
+    def get_lecturer_name(self, schedule: Schedule) -> str:
+        lecturer_name = self.lecturer_directory.get_name(schedule.lecturer_id)
+        if lecturer_name is None:
+            lecturer = schedule.lecturer
+            lecturer_name = decrypt_data(lecturer.full_name) if lecturer else ""
+        return lecturer_name
+
+    def build(
+        self,
+        schedule: Schedule,
+        purpose: Optional[str] = None,
+        team_members: Optional[str] = None,
+    ) -> ScheduleDetail:
+        room = self.catalog.get_room(schedule.room_id)
+        if room is not None:
+            room_name = room.name
+            building_id = room.building_id
+            building_name = room.building_name
+        else:
+            room = schedule.room
+            building = room.building if room else None
+            room_name = room.name if room else ""
+            building_id = building.id if building else None
+            building_name = building.name if building else ""
+
+        if purpose is None:
+            purpose = decrypt_data(schedule.purpose)
+        if team_members is None:
+            team_members = (
+                decrypt_data(schedule.team_members) if schedule.team_members else ""
+            )
+
+        return ScheduleDetail.model_construct(
+            id=schedule.id,
+            room_id=schedule.room_id,
+            room_name=room_name,
+            lecturer_id=schedule.lecturer_id,
+            lecturer_name=self.get_lecturer_name(schedule),
+            building_id=building_id,
+            building_name=building_name,
+            date=schedule.date,
+            start_time=schedule.start_time,
+            purpose=purpose,
+            team_members=team_members,
+            created_at=schedule.created_at,
+        )
+
+    def build_all(self, schedules: list[Schedule]) -> list[ScheduleDetail]:
+        return [self.build(schedule) for schedule in schedules]
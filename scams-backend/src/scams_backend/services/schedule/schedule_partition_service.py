@@ -0,0 +1,238 @@
+import asyncio
+import datetime
+import gzip
+import logging
+import os
+import re
+from typing import NamedTuple, Optional
+from sqlalchemy import delete, text
+from sqlalchemy.orm import Session
+from scams_backend.core.config import settings
+from scams_backend.db.session import SessionLocal
+from scams_backend.models.room_day_occupancy import RoomDayOccupancy
+from scams_backend.cache.shared_cache import invalidation_bus
+from scams_backend.constants.cache import InvalidationTopic
+
+BOUND_PATTERN = re.compile(r"FROM \('([\d-]+)'\) TO \('([\d-]+)'\)")
+ARCHIVE_MODES = ("file", "table")
+PARTIAL_SUFFIX = ".partial"
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulePartition(NamedTuple):
+    name: str
+    start: datetime.date
+    end: datetime.date
+
+
+def month_start(date: datetime.date) -> datetime.date:
+    return date.replace(day=1)
+
+
+def add_months(month: datetime.date, months: int) -> datetime.date:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: datetime.date) -> str:
+    return f"schedules_y{month.year}m{month.month:02d}"
+
+
+class SchedulePartitionService:
+    """Maintains the monthly range partitions of ``schedules`` on PostgreSQL.
+
+    Future months are created ahead of time, so inserts never land in the
+    default partition. Months before a cutoff are detached and archived,
+    either to gzipped CSV files or to the ``schedules_archive`` table, and
+    their ``room_day_occupancy`` rows are deleted in the same transaction. On
+    databases without partitioning (e.g. SQLite) everything is a no-op.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db_session: Session = db_session
+
+    def is_partitioned(self) -> bool:
+        if self.db_session.get_bind().dialect.name != "postgresql":
+            return False
+        return bool(
+            self.db_session.execute(
+                text(
+                    "SELECT 1 FROM pg_partitioned_table "
+                    "WHERE partrelid = to_regclass('schedules')"
+                )
+            ).scalar()
+        )
+
+    def lock(self) -> None:
+        # Serializes maintenance between workers; released at commit.
+        self.db_session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext('schedules_partitions'))")
+        )
+
+    def list_partitions(self) -> list[SchedulePartition]:
+        rows = self.db_session.execute(
+            text(
+                "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+                "FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = 'schedules'::regclass"
+            )
+        ).all()
+        partitions = []
+        for name, bound in rows:
+            match = BOUND_PATTERN.search(bound)
+            if match is None:  # the default partition
+                continue
+            partitions.append(
+                SchedulePartition(
+                    name,
+                    datetime.date.fromisoformat(match.group(1)),
+                    datetime.date.fromisoformat(match.group(2)),
+                )
+            )
+        return sorted(partitions, key=lambda partition: partition.start)
+
+    def create_partition(self, month: datetime.date) -> None:
+        name = partition_name(month)
+        bounds = {"start": month, "end": add_months(month, 1)}
+        # Rows of this month may already sit in the default partition, which
+        # makes a plain PARTITION OF fail; move them over before attaching.
+        self.db_session.execute(
+            text(
+                f"CREATE TABLE {name} "
+                "(LIKE schedules INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        self.db_session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM schedules_default "
+                "WHERE date >= :start AND date < :end RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            bounds,
+        )
+        self.db_session.execute(
+            text(
+                f"ALTER TABLE schedules ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{bounds['start']}') TO ('{bounds['end']}')"
+            )
+        )
+
+    def ensure_partitions(
+        self, first_month: datetime.date, last_month: datetime.date
+    ) -> list[str]:
+        if not self.is_partitioned():
+            return []
+        self.lock()
+        existing = {partition.start for partition in self.list_partitions()}
+        created = []
+        month = month_start(first_month)
+        while month <= last_month:
+            if month not in existing:
+                self.create_partition(month)
+                created.append(partition_name(month))
+            month = add_months(month, 1)
+        self.db_session.commit()
+        return created
+
+    def ensure_future_partitions(self, months_ahead: int) -> list[str]:
+        current = month_start(datetime.date.today())
+        return self.ensure_partitions(current, add_months(current, months_ahead))
+
+    def export_partition(self, partition: SchedulePartition, archive_dir: str) -> str:
+        """Write the partition to a temporary file; returns the final path.
+
+        The file only gets its final name once the partition is dropped, see
+        ``archive_partitions``; a run that fails before leaves nothing behind.
+        """
+        os.makedirs(archive_dir, exist_ok=True)
+        path = os.path.join(archive_dir, f"{partition.name}.csv.gz")
+        if os.path.exists(path):
+            raise FileExistsError(f"{path} already exists.")
+        cursor = self.db_session.connection().connection.cursor()
+        # A leftover temporary file of a crashed run is overwritten.
+        with gzip.open(path + PARTIAL_SUFFIX, "wt", newline="") as file:
+            cursor.copy_expert(
+                f"COPY (SELECT * FROM {partition.name} ORDER BY id) "
+                "TO STDOUT WITH (FORMAT csv, HEADER)",
+                file,
+            )
+        return path
+
+    def archive_partitions(
+        self, before: datetime.date, mode: str, archive_dir: str
+    ) -> list[str]:
+        if mode not in ARCHIVE_MODES:
+            raise ValueError(f"Unknown archive mode '{mode}'.")
+        if not self.is_partitioned():
+            return []
+        archived = []
+        exported_files = []
+        try:
+            self.lock()
+            for partition in self.list_partitions():
+                if partition.end > before:
+                    continue
+                if mode == "file":
+                    path = self.export_partition(partition, archive_dir)
+                    exported_files.append(path)
+                    archived.append(path)
+                else:
+                    self.db_session.execute(
+                        text(
+                            "INSERT INTO schedules_archive "
+                            f"SELECT * FROM {partition.name}"
+                        )
+                    )
+                    archived.append(f"schedules_archive ({partition.name})")
+                self.db_session.execute(
+                    text(f"ALTER TABLE schedules DETACH PARTITION {partition.name}")
+                )
+                self.db_session.execute(text(f"DROP TABLE {partition.name}"))
+                # The summary only describes bookings still in ``schedules``.
+                self.db_session.execute(
+                    delete(RoomDayOccupancy).where(
+                        RoomDayOccupancy.date >= partition.start,
+                        RoomDayOccupancy.date < partition.end,
+                    )
+                )
+            self.db_session.commit()
+        except BaseException:
+            self.db_session.rollback()
+            for path in exported_files:
+                if os.path.exists(path + PARTIAL_SUFFIX):
+                    os.remove(path + PARTIAL_SUFFIX)
+            raise
+        for path in exported_files:
+            os.replace(path + PARTIAL_SUFFIX, path)
+        if archived:
+            invalidation_bus.publish(InvalidationTopic.SCHEDULES)
+        return archived
+
+    def invoke(self) -> list[str]:
+        return self.ensure_future_partitions(settings.SCHEDULE_PARTITION_MONTHS_AHEAD)
+
+
+def archive_cutoff(today: Optional[datetime.date] = None) -> datetime.date:
+    """First month that stays hot; everything before it may be archived."""
+    return add_months(
+        month_start(today or datetime.date.today()),
+        -settings.SCHEDULE_ARCHIVE_AFTER_MONTHS,
+    )
+
+
+def maintain_partitions() -> list[str]:
+    with SessionLocal() as db_session:
+        return SchedulePartitionService(db_session=db_session).invoke()
+
+
+async def run_partition_maintenance() -> None:
+    while True:
+        try:
+            await asyncio.to_thread(maintain_partitions)
+        except Exception:
+            # Retried on the next round; rows land in the default partition
+            # meanwhile and are moved out once their month exists.
+            logger.exception("Schedule partition maintenance failed.")
+        await asyncio.sleep(settings.SCHEDULE_PARTITION_CHECK_INTERVAL_SECONDS)
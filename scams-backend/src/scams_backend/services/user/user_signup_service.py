@@ -5,7 +5,11 @@ from scams_backend.schemas.user.user_signup_schema import (
 )
 from sqlalchemy.orm import Session
 from scams_backend.services.password.password_service import PasswordService
-from scams_backend.services.user.exception import UserAlreadyExistsException
+from scams_backend.services.user.exception import (
+    PermissionException,
+    UserAlreadyExistsException,
+)
+from scams_backend.constants.user import UserRole
 from scams_backend.utils.encrypt import encrypt_data, decrypt_data
 from scams_backend.utils.hash import hash_email
 
@@ -17,6 +21,8 @@ class UserSignUpService:
         self.user: User = None
 
     def validate_request(self) -> None:
+        if self.signup_request.role == UserRole.ADMIN:
+            raise PermissionException("Admin accounts cannot be created by sign-up.")
         existing_user = (
             self.db_session.query(User)
             .filter_by(email_hash=hash_email(self.signup_request.email))
@@ -0,0 +1,95 @@
+import gzip
+import zlib
+from typing import Iterable, Optional, Protocol
+from scams_backend.core.config import settings
+
+# brotli is an optional extra: pip install scams-backend[compression]
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def encoding_qualities(accept_encoding: str) -> dict[str, float]:
+    """The q-value of every coding in an Accept-Encoding header value."""
+    qualities = {}
+    for item in accept_encoding.split(","):
+        name, *params = item.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    return qualities
+
+
+# Supported content codings, most preferred first.
+ENCODINGS: tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(
+    accept_encoding: str, encodings: Iterable[str] = ENCODINGS
+) -> Optional[str]:
+    """The acceptable coding with the highest q-value; ties go to the first."""
+    qualities = encoding_qualities(accept_encoding)
+    best, best_quality = None, 0.0
+    for encoding in encodings:
+        # An explicit entry wins over "*", whatever their order; q=0 refuses.
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(
+        content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0
+    )
+
+
+class StreamCompressor(Protocol):
+    def compress(self, chunk: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipStreamCompressor:
+    def __init__(self):
+        self.compressor = zlib.compressobj(
+            settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16
+        )
+
+    def compress(self, chunk: bytes) -> bytes:
+        # Sync-flush every chunk so streamed lines reach the client right away.
+        return self.compressor.compress(chunk) + self.compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self.compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliStreamCompressor:
+    def __init__(self):
+        self.compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self.compressor.process(chunk) + self.compressor.flush()
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()
+
+
+def stream_compressor(encoding: str) -> StreamCompressor:
+    if encoding == "br":
+        return BrotliStreamCompressor()
+    return GzipStreamCompressor()
@@ -0,0 +1,101 @@
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+# Weight of the newest sample in the latency moving average.
+LATENCY_SMOOTHING = 0.2
+# Limits are adjusted at most this often, so one slow burst does not collapse them.
+ADJUST_INTERVAL_SECONDS = 1.0
+DECREASE_FACTOR = 0.75
+INCREASE_FACTOR = 0.1
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit with a bounded wait queue that adapts to latency.
+
+    While the smoothed service time stays above ``latency_target`` the limit
+    shrinks multiplicatively down to ``min_limit``; once latency recovers and
+    the limit is saturated it grows back towards ``max_limit``. Meant to be
+    used from a single event loop, so it needs no locking.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        queue_size: int,
+        queue_timeout: float,
+        latency_target: float,
+        min_limit: int = 1,
+    ):
+        self.max_limit: int = max_limit
+        self.min_limit: int = min(min_limit, max_limit)
+        self.limit: float = float(max_limit)
+        self.queue_size: int = queue_size
+        self.queue_timeout: float = queue_timeout
+        self.latency_target: float = latency_target
+        self.in_flight: int = 0
+        self.waiters: deque[asyncio.Future] = deque()
+        self.latency: Optional[float] = None
+        self.last_adjusted: float = time.monotonic()
+
+    def has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    async def acquire(self) -> Optional[str]:
+        """Take a slot; returns None when admitted or the reason for rejection."""
+        if self.has_capacity() and not self.waiters:
+            self.in_flight += 1
+            return None
+        if len(self.waiters) >= self.queue_size:
+            return "queue_full"
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if waiter.done():
+                # The slot was handed over just as the wait timed out.
+                return None
+            waiter.cancel()
+            self.waiters.remove(waiter)
+            return "queue_timeout"
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(None)
+            else:
+                waiter.cancel()
+                self.waiters.remove(waiter)
+            raise
+        return None
+
+    def release(self, latency: Optional[float]) -> None:
+        self.in_flight -= 1
+        if latency is not None:
+            self.observe(latency)
+        while self.waiters and self.has_capacity():
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def observe(self, latency: float) -> None:
+        saturated = self.in_flight + 1 >= int(self.limit)
+        self.latency = (
+            latency
+            if self.latency is None
+            else self.latency + LATENCY_SMOOTHING * (latency - self.latency)
+        )
+        now = time.monotonic()
+        if now - self.last_adjusted < ADJUST_INTERVAL_SECONDS:
+            return
+        if self.latency > self.latency_target:
+            self.limit = max(float(self.min_limit), self.limit * DECREASE_FACTOR)
+            self.last_adjusted = now
+        elif saturated and self.limit < self.max_limit:
+            self.limit = min(
+                float(self.max_limit),
+                self.limit + max(1.0, self.limit * INCREASE_FACTOR),
+            )
+            self.last_adjusted = now
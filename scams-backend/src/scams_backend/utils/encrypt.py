@@ -1,21 +1,53 @@
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-import base64, os
+import base64, binascii, os
+from functools import lru_cache
+from typing import Iterable, Optional
 from scams_backend.core.config import settings
+from scams_backend.metrics.registry import AES_OPERATION_DURATION
 
+encrypt_duration = AES_OPERATION_DURATION.labels("encrypt")
+decrypt_duration = AES_OPERATION_DURATION.labels("decrypt")
+decrypt_batch_duration = AES_OPERATION_DURATION.labels("decrypt_batch")
+URLSAFE_TO_STANDARD = bytes.maketrans(b"-_", b"+/")
 
+
+@lru_cache(maxsize=1)
+def get_cipher(aes_key: str) -> AESGCM:
+    return AESGCM(base64.urlsafe_b64decode(aes_key))
+
+
+@encrypt_duration.time()
 def encrypt_data(plain_text: str) -> str:
-    aes_key = base64.urlsafe_b64decode(settings.AES_KEY)
-    aesgcm = AESGCM(aes_key)
+    aesgcm = get_cipher(settings.AES_KEY)
     nonce = os.urandom(12)
     cipher_text = aesgcm.encrypt(nonce, plain_text.encode(), None)
     return base64.urlsafe_b64encode(nonce + cipher_text).decode()
 
 
+@decrypt_duration.time()
 def decrypt_data(cipher_text: str) -> str:
-    aes_key = base64.urlsafe_b64decode(settings.AES_KEY)
-    aesgcm = AESGCM(aes_key)
+    aesgcm = get_cipher(settings.AES_KEY)
     data = base64.urlsafe_b64decode(cipher_text)
     nonce = data[:12]
     ct = data[12:]
     plain_text = aesgcm.decrypt(nonce, ct, None)
     return plain_text.decode()
+
+
+@decrypt_batch_duration.time()
+def decrypt_batch(cipher_texts: Iterable[Optional[str]]) -> list[str]:
+    """Decrypt many values at once; empty or NULL values decrypt to "".
+
+    Skips the per-call overhead of ``base64.urlsafe_b64decode`` and of the
+    per-value timer, which dominate for short values.
+    """
+    decrypt = get_cipher(settings.AES_KEY).decrypt
+    a2b_base64 = binascii.a2b_base64
+    plain_texts = []
+    for cipher_text in cipher_texts:
+        if not cipher_text:
+            plain_texts.append("")
+            continue
+        data = a2b_base64(cipher_text.encode().translate(URLSAFE_TO_STANDARD))
+        plain_texts.append(decrypt(data[:12], data[12:], None).decode())
+    return plain_texts
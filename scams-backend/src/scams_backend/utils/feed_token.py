@@ -0,0 +1,23 @@
+import base64
+import hashlib
+import hmac
+from scams_backend.core.config import settings
+
+
+def create_feed_token(kind: str, subject_id: int) -> str:
+    """Signed token granting read access to one calendar feed.
+
+    Tokens do not expire; changing CALENDAR_FEED_SECRET revokes all of them.
+    """
+    digest = hmac.new(
+        settings.CALENDAR_FEED_SECRET.encode(),
+        f"{kind}:{subject_id}".encode(),
+        hashlib.sha256,
+    ).digest()
+    return base64.urlsafe_b64encode(digest[:24]).decode()
+
+
+def verify_feed_token(kind: str, subject_id: int, token: str) -> bool:
+    return hmac.compare_digest(
+        create_feed_token(kind, subject_id).encode(), token.encode()
+    )
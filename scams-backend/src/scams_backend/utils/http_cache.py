@@ -0,0 +1,65 @@
+import hashlib
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from starlette.requests import Request
+from starlette.responses import Response
+from scams_backend.utils.compression import ENCODINGS, compress, negotiate_encoding
+
+
+class EncodedBody:
+    """A response body encoded and compressed once, with its validators."""
+
+    __slots__ = ("content", "encoded_content", "etag", "last_modified")
+
+    def __init__(self, content: bytes):
+        self.content: bytes = content
+        # Only codings that actually shrink the body are kept.
+        self.encoded_content: dict[str, bytes] = {}
+        for encoding in ENCODINGS:
+            compressed = compress(content, encoding)
+            if len(compressed) < len(content):
+                self.encoded_content[encoding] = compressed
+        self.etag: str = f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+        self.last_modified: int = int(time.time())
+
+    def is_not_modified(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return any(
+                tag.strip().removeprefix("W/") in (self.etag, "*")
+                for tag in if_none_match.split(",")
+            )
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return self.last_modified <= since
+        return False
+
+
+def encoded_body_response(
+    request: Request,
+    body: EncodedBody,
+    max_age: int,
+    media_type: str = "application/json",
+) -> Response:
+    headers = {
+        "ETag": body.etag,
+        "Last-Modified": formatdate(body.last_modified, usegmt=True),
+        "Cache-Control": f"private, max-age={max_age}, must-revalidate",
+        "Vary": "Accept-Encoding",
+    }
+    if body.is_not_modified(request):
+        return Response(status_code=304, headers=headers)
+
+    content = body.content
+    encoding = negotiate_encoding(
+        request.headers.get("accept-encoding", ""), body.encoded_content
+    )
+    if encoding is not None:
+        content = body.encoded_content[encoding]
+        headers["Content-Encoding"] = encoding
+    return Response(content=content, media_type=media_type, headers=headers)
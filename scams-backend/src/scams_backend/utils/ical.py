@@ -0,0 +1,40 @@
+import datetime
+from typing import Iterable
+
+ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
+MAX_LINE_OCTETS = 75
+
+
+def escape_text(value: str) -> str:
+    return value.replace("\r\n", "\n").replace("\r", "\n").translate(ESCAPES)
+
+
+def fold_line(line: str) -> str:
+    """Split ``line`` into CRLF-terminated lines of at most 75 octets (RFC 5545)."""
+    encoded = line.encode()
+    if len(encoded) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts = []
+    start = 0
+    limit = MAX_LINE_OCTETS
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Never cut a multi-byte character in half.
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode())
+        start = end
+        # Continuation lines start with a space, which counts toward the limit.
+        limit = MAX_LINE_OCTETS - 1
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_utc(value: datetime.datetime) -> str:
+    return value.astimezone(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def render_component(name: str, properties: Iterable[tuple[str, str]]) -> str:
+    lines = [f"BEGIN:{name}\r\n"]
+    lines.extend(fold_line(f"{key}:{value}") for key, value in properties)
+    lines.append(f"END:{name}\r\n")
+    return "".join(lines)
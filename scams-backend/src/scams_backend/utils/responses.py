@@ -0,0 +1,15 @@
+from typing import Any
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core's Rust serializer.
+
+    Route handlers return it directly with a Pydantic model as ``content`` so
+    FastAPI neither re-validates the model nor runs it through
+    ``jsonable_encoder``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
@@ -0,0 +1,38 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls that share a key into a single execution.
+
+    The first caller runs the function; callers arriving while it is still
+    running await the same result, or the same exception.
+    """
+
+    def __init__(self):
+        self._flights: dict[Hashable, asyncio.Future] = {}
+
+    async def run(
+        self, key: Hashable, function: Callable[[], Awaitable[T]]
+    ) -> tuple[T, bool]:
+        """Returns the result and whether it was shared from another caller."""
+        flight = self._flights.get(key)
+        if flight is not None:
+            return await asyncio.shield(flight), True
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        try:
+            result = await function()
+        except BaseException as e:
+            flight.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting.
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result, False
+        finally:
+            del self._flights[key]
@@ -0,0 +1,42 @@
+from typing import Optional
+
+HOURS_PER_DAY = 24
+
+
+def hour_range_mask(start_hour: int, end_hour: int) -> int:
+    """Bitmask with bits ``start_hour`` .. ``end_hour - 1`` set."""
+    if end_hour <= start_hour:
+        return 0
+    return ((1 << end_hour) - 1) & ~((1 << start_hour) - 1)
+
+
+def run_starts(free_mask: int, length: int) -> int:
+    """Bitmask of the positions where ``length`` consecutive free bits start."""
+    starts = free_mask
+    for _ in range(length - 1):
+        starts &= starts >> 1
+    return starts
+
+
+def first_free_run(
+    busy_mask: int, length: int, start_hour: int, end_hour: int
+) -> Optional[int]:
+    free_mask = hour_range_mask(start_hour, end_hour) & ~busy_mask
+    starts = run_starts(free_mask, length)
+    if not starts:
+        return None
+    return (starts & -starts).bit_length() - 1
+
+
+def mask_runs(mask: int) -> list[tuple[int, int]]:
+    """(start, end) of every run of set bits, e.g. 0b1110 -> [(1, 4)]."""
+    runs = []
+    start = None
+    for position in range(mask.bit_length() + 1):
+        if mask >> position & 1:
+            if start is None:
+                start = position
+        elif start is not None:
+            runs.append((start, position))
+            start = None
+    return runs
@@ -1,10 +1,49 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 from scams_backend.routers import health_router
 from scams_backend.routers import user_router
 from scams_backend.routers import resource_router
 from scams_backend.routers import room_router
 from scams_backend.routers import schedule_router
+from scams_backend.routers import analytics_router
+from scams_backend.routers import calendar_router
+from scams_backend.routers import metrics_router
 from scams_backend.middlewares.db_middleware import DBMiddleware
+from scams_backend.middlewares.compression_middleware import CompressionMiddleware
+from scams_backend.middlewares.metrics_middleware import MetricsMiddleware
+from scams_backend.middlewares.load_shedding_middleware import LoadSheddingMiddleware
+from scams_backend.middlewares.deadline_middleware import DeadlineMiddleware
+from scams_backend.db.session import SessionLocal, engine
+from scams_backend.db.deadline import statement_timeout_exception_handler
+from scams_backend.metrics.db import instrument_engine
+from scams_backend.services.health.readiness_service import readiness_service
+from scams_backend.services.schedule.schedule_partition_service import (
+    run_partition_maintenance,
+)
+from scams_backend.cache.catalog import catalog_cache
+from scams_backend.cache.lecturer_directory import lecturer_directory_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the reference data caches so the first requests do not pay for
+    # loading them; when the database is not reachable yet they load lazily.
+    try:
+        with SessionLocal() as db_session:
+            catalog_cache.reload(db_session)
+            lecturer_directory_cache.reload(db_session)
+    except SQLAlchemyError:
+        pass
+
+    readiness_task = asyncio.create_task(readiness_service.run())
+    partition_task = asyncio.create_task(run_partition_maintenance())
+    yield
+    for task in (readiness_task, partition_task):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
 
 
 def initialize_routers(app: FastAPI) -> FastAPI:
@@ -13,15 +52,29 @@ def initialize_routers(app: FastAPI) -> FastAPI:
     app.include_router(resource_router.router)
     app.include_router(room_router.router)
     app.include_router(schedule_router.router)
+    app.include_router(analytics_router.router)
+    app.include_router(calendar_router.router)
+    app.include_router(metrics_router.router)
     return app
 
 
 def initialize_middlewares(app: FastAPI) -> FastAPI:
     app.add_middleware(DBMiddleware)
+    app.add_middleware(CompressionMiddleware)
+    app.add_middleware(DeadlineMiddleware)
+    app.add_middleware(LoadSheddingMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    return app
+
+
+def initialize_exception_handlers(app: FastAPI) -> FastAPI:
+    app.add_exception_handler(DBAPIError, statement_timeout_exception_handler)
     return app
 
 
 def initialize_app(app: FastAPI = None) -> FastAPI:
+    instrument_engine(engine)
     app = initialize_routers(app)
     app = initialize_middlewares(app)
+    app = initialize_exception_handlers(app)
     return app
@@ -0,0 +1,13 @@
+from typing import Iterator
+
+import pytest
+
+from tests.support import RunningRespServer, start_resp_server
+
+
+@pytest.fixture
+def resp_server() -> Iterator[RunningRespServer]:
+    """An in-memory stand-in for Redis listening on a free local port."""
+    server, port, stop = start_resp_server()
+    yield RunningRespServer(server, f"redis://127.0.0.1:{port}/0")
+    stop()
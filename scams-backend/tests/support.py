@@ -0,0 +1,75 @@
+"""Helpers for tests that need a cache server."""
+
+import asyncio
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+from scams_backend.cache.resp_server import RespServer
+
+
+class RunningRespServer(NamedTuple):
+    server: RespServer
+    url: str
+
+    def wait_for_subscribers(self, channel: str, count: int = 1) -> None:
+        wait_until(lambda: len(self.server.channels.get(channel.encode(), ())) >= count)
+
+
+def wait_until(condition: Callable[[], object], timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for the condition.")
+        time.sleep(0.01)
+
+
+def start_resp_server(
+    password: Optional[str] = None,
+) -> tuple[RespServer, int, Callable[[], None]]:
+    """Run a RespServer on a free port in a background thread.
+
+    Returns the server, its port and a function that stops it and closes
+    every client connection.
+    """
+    server = RespServer(password)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    state = {}
+    connections: set[asyncio.Task] = set()
+
+    async def handle(reader, writer) -> None:
+        connections.add(asyncio.current_task())
+        try:
+            await server.handle(reader, writer)
+        finally:
+            connections.discard(asyncio.current_task())
+
+    async def serve() -> None:
+        state["server"] = await asyncio.start_server(handle, "127.0.0.1", 0)
+        state["port"] = state["server"].sockets[0].getsockname()[1]
+        started.set()
+
+    async def shutdown() -> None:
+        state["server"].close()
+        for task in list(connections):
+            task.cancel()
+        await asyncio.gather(*connections, return_exceptions=True)
+        await state["server"].wait_closed()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(serve())
+        loop.run_forever()
+        loop.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait(5)
+
+    def stop() -> None:
+        asyncio.run_coroutine_threadsafe(shutdown(), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+
+    return server, state["port"], stop
@@ -0,0 +1,39 @@
+import pytest
+
+from scams_backend.utils.compression import encoding_qualities, negotiate_encoding
+
+ENCODINGS = ("br", "gzip")
+
+
+def test_encoding_qualities_parse_q_values():
+    assert encoding_qualities("gzip, br;q=0.5, *;q=0, identity;level=1;Q=0.1") == {
+        "gzip": 1.0,
+        "br": 0.5,
+        "*": 0.0,
+        "identity": 0.1,
+    }
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("", None),
+        ("identity", None),
+        ("gzip", "gzip"),
+        ("gzip, br", "br"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("*", "br"),
+        ("*;q=0.5, gzip;q=0", "br"),
+        ("*;q=0.5, br;q=0, gzip;q=0", None),
+        ("gzip;q=0, *", "br"),
+        ("gzip;q=invalid", None),
+        ("GZIP", "gzip"),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    assert negotiate_encoding(accept_encoding, ENCODINGS) == expected
+
+
+def test_negotiate_encoding_only_offers_the_given_codings():
+    assert negotiate_encoding("*;q=0.5, gzip;q=0", ("gzip",)) is None
+    assert negotiate_encoding("br, gzip;q=0.5", ("gzip",)) == "gzip"
@@ -0,0 +1,157 @@
+import socket
+import time
+
+import pytest
+
+from scams_backend.cache.backend import CacheBackendError
+from scams_backend.cache.redis_backend import RedisCacheBackend
+
+from tests.support import start_resp_server, wait_until
+
+
+def test_get_returns_none_for_missing_key(resp_server):
+    backend = RedisCacheBackend(resp_server.url)
+
+    assert backend.get("missing") is None
+
+
+def test_set_and_get_round_trip_binary_values(resp_server):
+    backend = RedisCacheBackend(resp_server.url)
+    value = b"\x00\r\n\xffbody"
+
+    backend.set("key", value, ttl_seconds=None)
+
+    assert backend.get("key") == value
+
+
+def test_set_with_ttl_expires(resp_server):
+    backend = RedisCacheBackend(resp_server.url)
+
+    backend.set("key", b"value", ttl_seconds=0.05)
+
+    assert backend.get("key") == b"value"
+    time.sleep(0.1)
+    assert backend.get("key") is None
+
+
+def test_delete_removes_key(resp_server):
+    backend = RedisCacheBackend(resp_server.url)
+    backend.set("key", b"value", ttl_seconds=None)
+
+    backend.delete("key")
+
+    assert backend.get("key") is None
+
+
+def test_incr_counts_from_zero(resp_server):
+    backend = RedisCacheBackend(resp_server.url)
+
+    assert [backend.incr("counter") for _ in range(3)] == [1, 2, 3]
+    assert backend.get("counter") == b"3"
+
+
+def test_server_errors_raise_cache_backend_error(resp_server):
+    backend = RedisCacheBackend(resp_server.url)
+    backend.set("key", b"not a number", ttl_seconds=None)
+
+    with pytest.raises(CacheBackendError):
+        backend.incr("key")
+
+
+def test_databases_are_selected_from_the_url(resp_server):
+    first = RedisCacheBackend(resp_server.url)
+    second = RedisCacheBackend(resp_server.url.rsplit("/", 1)[0] + "/1")
+
+    first.set("key", b"first", ttl_seconds=None)
+
+    assert second.get("key") is None
+
+
+def test_password_from_the_url_authenticates():
+    _, port, stop = start_resp_server(password="secret")
+    try:
+        assert RedisCacheBackend(f"redis://:secret@127.0.0.1:{port}/0").incr("n") == 1
+        with pytest.raises(CacheBackendError):
+            RedisCacheBackend(f"redis://127.0.0.1:{port}/0").incr("n")
+    finally:
+        stop()
+
+
+def test_unreachable_server_raises_cache_backend_error():
+    _, port, stop = start_resp_server()
+    stop()
+    backend = RedisCacheBackend(f"redis://127.0.0.1:{port}/0", timeout=0.5)
+
+    with pytest.raises(CacheBackendError):
+        backend.get("key")
+
+
+def test_dropped_connection_is_retried_once(resp_server):
+    backend = RedisCacheBackend(resp_server.url)
+    backend.set("key", b"value", ttl_seconds=None)
+    # Simulate the server closing an idle connection.
+    backend._connection._socket.close()
+
+    assert backend.get("key") == b"value"
+
+
+def test_publish_reaches_subscribers(resp_server):
+    publisher = RedisCacheBackend(resp_server.url)
+    subscriber = RedisCacheBackend(resp_server.url)
+    received = []
+    subscriber.subscribe("channel", received.append)
+    resp_server.wait_for_subscribers("channel")
+
+    publisher.publish("channel", b"first")
+    publisher.publish("other", b"ignored")
+    publisher.publish("channel", b"second")
+
+    wait_until(lambda: len(received) == 2)
+    assert received == [b"first", b"second"]
+
+
+def test_subscribing_to_another_channel_keeps_the_first(resp_server):
+    publisher = RedisCacheBackend(resp_server.url)
+    subscriber = RedisCacheBackend(resp_server.url)
+    first, second = [], []
+    subscriber.subscribe("first", first.append)
+    resp_server.wait_for_subscribers("first")
+    subscriber.subscribe("second", second.append)
+    resp_server.wait_for_subscribers("second")
+
+    publisher.publish("first", b"a")
+    publisher.publish("second", b"b")
+
+    wait_until(lambda: first and second)
+    assert (first, second) == ([b"a"], [b"b"])
+
+
+def test_failing_handler_does_not_stop_the_others(resp_server):
+    publisher = RedisCacheBackend(resp_server.url)
+    subscriber = RedisCacheBackend(resp_server.url)
+    received = []
+
+    def fail(message: bytes) -> None:
+        raise RuntimeError("broken subscriber")
+
+    subscriber.subscribe("channel", fail)
+    subscriber.subscribe("channel", received.append)
+    resp_server.wait_for_subscribers("channel")
+
+    publisher.publish("channel", b"first")
+    publisher.publish("channel", b"second")
+
+    wait_until(lambda: len(received) == 2)
+
+
+def test_on_subscribed_runs_again_after_a_reconnect(resp_server):
+    subscriber = RedisCacheBackend(resp_server.url)
+    subscriptions = []
+    subscriber.subscribe(
+        "channel", lambda message: None, lambda: subscriptions.append(1)
+    )
+    wait_until(lambda: subscriptions == [1])
+
+    subscriber._pubsub._socket.shutdown(socket.SHUT_RDWR)
+
+    wait_until(lambda: subscriptions == [1, 1])
@@ -0,0 +1,147 @@
+import socket
+import threading
+import uuid
+
+from scams_backend.cache.redis_backend import RedisCacheBackend
+from scams_backend.cache.shared_cache import InvalidationBus, SharedCache
+
+from tests.support import wait_until
+
+TOPIC = "rooms"
+
+
+class Worker:
+    """One application process: its own connection, bus and cache instance."""
+
+    def __init__(self, url: str, channel: str, namespace: str):
+        self.backend = RedisCacheBackend(url)
+        self.bus = InvalidationBus(self.backend, channel=channel)
+        self.cache = SharedCache(
+            namespace,
+            ttl_seconds=60,
+            backend=self.backend,
+            invalidation_bus=self.bus,
+            topics=(TOPIC,),
+        )
+
+
+def start_workers(resp_server, count: int = 2) -> list[Worker]:
+    # Unique names keep the metrics labels and keys of each test apart.
+    suffix = uuid.uuid4().hex
+    workers = [
+        Worker(resp_server.url, f"invalidations-{suffix}", f"test-{suffix}")
+        for _ in range(count)
+    ]
+    resp_server.wait_for_subscribers(f"invalidations-{suffix}", count)
+    return workers
+
+
+def test_values_are_shared_between_workers(resp_server):
+    first, second = start_workers(resp_server)
+
+    first.cache.set("key", b"value")
+
+    assert second.cache.get("key") == b"value"
+
+
+def test_publish_runs_local_handlers_at_once_and_remote_ones_on_delivery(
+    resp_server,
+):
+    first, second = start_workers(resp_server)
+    calls = {"first": [], "second": []}
+    first.bus.subscribe("other", calls["first"].append)
+    second.bus.subscribe("other", calls["second"].append)
+
+    first.bus.publish("other")
+
+    assert calls["first"] == [True]
+    wait_until(lambda: calls["second"])
+    assert calls["second"] == [False]
+    # The publisher ignores its own message when it comes back.
+    assert calls["first"] == [True]
+
+
+def test_invalidation_reaches_every_worker(resp_server):
+    first, second = start_workers(resp_server)
+    assert second.cache.get_or_load("key", lambda: b"old") == b"old"
+    # The second worker remembers the generation it read the key under.
+    assert second.cache.get("key") == b"old"
+
+    first.bus.publish(TOPIC)
+
+    assert first.cache.get("key") is None
+    wait_until(lambda: second.cache.get("key") is None)
+    assert second.cache.get_or_load("key", lambda: b"new") == b"new"
+    assert first.cache.get("key") == b"new"
+
+
+def test_invalidation_sent_while_disconnected_is_not_lost(resp_server):
+    first, second = start_workers(resp_server)
+    assert second.cache.get_or_load("key", lambda: b"old") == b"old"
+    # The message below never reaches the second worker.
+    second.backend._pubsub._socket.shutdown(socket.SHUT_RDWR)
+
+    first.bus.publish(TOPIC)
+
+    wait_until(lambda: second.cache.get("key") is None)
+
+
+def test_value_loaded_across_an_invalidation_is_not_served(resp_server):
+    (worker,) = start_workers(resp_server, count=1)
+
+    def load_then_invalidate() -> bytes:
+        worker.bus.publish(TOPIC)
+        return b"stale"
+
+    assert worker.cache.get_or_load("key", load_then_invalidate) == b"stale"
+    assert worker.cache.get("key") is None
+
+
+def test_concurrent_misses_load_once_per_process(resp_server):
+    (worker,) = start_workers(resp_server, count=1)
+    loading = threading.Event()
+    release = threading.Event()
+    loads = []
+
+    def slow_loader() -> bytes:
+        loads.append(1)
+        loading.set()
+        release.wait(5)
+        return b"value"
+
+    results = []
+    leader = threading.Thread(
+        target=lambda: results.append(worker.cache.get_or_load("key", slow_loader))
+    )
+    leader.start()
+    loading.wait(5)
+    followers = [
+        threading.Thread(
+            target=lambda: results.append(worker.cache.get_or_load("key", slow_loader))
+        )
+        for _ in range(4)
+    ]
+    for follower in followers:
+        follower.start()
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert results == [b"value"] * 5
+    assert len(loads) == 1
+
+
+def test_unreachable_backend_is_a_miss():
+    backend = RedisCacheBackend("redis://127.0.0.1:1/0", timeout=0.2)
+    cache = SharedCache(
+        f"test-{uuid.uuid4().hex}",
+        ttl_seconds=60,
+        backend=backend,
+        invalidation_bus=InvalidationBus(backend, channel="invalidations"),
+    )
+
+    assert cache.get("key") is None
+    cache.set("key", b"value")
+    assert cache.get_or_load("key", lambda: b"loaded") == b"loaded"
+    cache.invalidate()
+    assert cache.get_or_load("key", lambda: b"reloaded") == b"reloaded"
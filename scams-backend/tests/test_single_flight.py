@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from scams_backend.utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_with_one_key_run_once():
+    async def scenario():
+        flights: SingleFlight[str] = SingleFlight()
+        calls = []
+        release = asyncio.Event()
+
+        async def work() -> str:
+            calls.append(1)
+            await release.wait()
+            return "result"
+
+        tasks = [asyncio.create_task(flights.run("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        return calls, await asyncio.gather(*tasks)
+
+    calls, results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert results == [("result", False), ("result", True), ("result", True)]
+
+
+def test_different_keys_run_independently():
+    async def scenario():
+        flights: SingleFlight[str] = SingleFlight()
+
+        async def work(value: str) -> str:
+            await asyncio.sleep(0)
+            return value
+
+        return await asyncio.gather(
+            flights.run("a", lambda: work("a")), flights.run("b", lambda: work("b"))
+        )
+
+    assert asyncio.run(scenario()) == [("a", False), ("b", False)]
+
+
+def test_exception_reaches_every_waiter():
+    async def scenario():
+        flights: SingleFlight[str] = SingleFlight()
+        release = asyncio.Event()
+
+        async def fail() -> str:
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(flights.run("key", fail)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+
+def test_key_is_released_after_the_call():
+    async def scenario():
+        flights: SingleFlight[int] = SingleFlight()
+        counter = iter(range(10))
+
+        async def work() -> int:
+            return next(counter)
+
+        first = await flights.run("key", work)
+        second = await flights.run("key", work)
+        return first, second, flights._flights
+
+    assert asyncio.run(scenario()) == ((0, False), (1, False), {})
+
+
+def test_cancelled_waiter_does_not_cancel_the_leader():
+    async def scenario():
+        flights: SingleFlight[str] = SingleFlight()
+        release = asyncio.Event()
+
+        async def work() -> str:
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(flights.run("key", work))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flights.run("key", work))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        return await leader
+
+    assert asyncio.run(scenario()) == ("result", False)
@@ -0,0 +1,68 @@
+import pytest
+
+from scams_backend.utils.slot_mask import (
+    HOURS_PER_DAY,
+    first_free_run,
+    hour_range_mask,
+    mask_runs,
+    run_starts,
+)
+
+
+@pytest.mark.parametrize(
+    "start_hour, end_hour, expected",
+    [
+        (0, 0, 0),
+        (9, 9, 0),
+        (10, 9, 0),
+        (0, 1, 0b1),
+        (1, 4, 0b1110),
+        (7, 22, sum(1 << hour for hour in range(7, 22))),
+        (0, HOURS_PER_DAY, (1 << HOURS_PER_DAY) - 1),
+    ],
+)
+def test_hour_range_mask(start_hour, end_hour, expected):
+    assert hour_range_mask(start_hour, end_hour) == expected
+
+
+def test_run_starts_marks_where_enough_free_hours_follow():
+    free_mask = 0b0111_0110
+
+    assert run_starts(free_mask, 1) == free_mask
+    assert run_starts(free_mask, 2) == 0b0011_0010
+    assert run_starts(free_mask, 3) == 0b0001_0000
+    assert run_starts(free_mask, 4) == 0
+
+
+def test_first_free_run_skips_busy_hours():
+    busy_mask = hour_range_mask(8, 10) | hour_range_mask(11, 12)
+
+    assert first_free_run(busy_mask, 1, 8, 18) == 10
+    assert first_free_run(busy_mask, 2, 8, 18) == 12
+    assert first_free_run(busy_mask, 6, 8, 18) == 12
+
+
+def test_first_free_run_stays_inside_the_window():
+    assert first_free_run(0, 3, 20, 22) is None
+    assert first_free_run(0, 2, 20, 22) == 20
+    assert first_free_run(hour_range_mask(7, 22), 1, 7, 22) is None
+
+
+@pytest.mark.parametrize(
+    "mask, expected",
+    [
+        (0, []),
+        (0b1, [(0, 1)]),
+        (0b1110, [(1, 4)]),
+        (0b1011_0011, [(0, 2), (4, 6), (7, 8)]),
+        (hour_range_mask(0, HOURS_PER_DAY), [(0, HOURS_PER_DAY)]),
+    ],
+)
+def test_mask_runs(mask, expected):
+    assert mask_runs(mask) == expected
+
+
+def test_mask_runs_round_trips_through_hour_range_mask():
+    mask = hour_range_mask(7, 9) | hour_range_mask(12, 13) | hour_range_mask(20, 24)
+
+    assert sum(hour_range_mask(start, end) for start, end in mask_runs(mask)) == mask